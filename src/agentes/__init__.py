@@ -18,11 +18,38 @@ from .tabular_agent import TabularAgent
 from .monte_carlo_agent import MonteCarloAgent
 from .monte_carlo_off_policy_agent import MonteCarloOffPolicyAgent
 from .monte_carlo_on_policy_agent import MonteCarloOnPolicyAgent
+from .n_step_agent import NStepAgent
+from .n_step_sarsa_agent import NStepSARSAAgent
+from .n_step_expected_sarsa_agent import NStepExpectedSARSAAgent
+from .n_step_tree_backup_agent import NStepTreeBackupAgent
 from .sarsa_agent import SARSAAgent
+from .expected_sarsa_agent import ExpectedSARSAAgent
 from .qlearning_agent import QLearningAgent
-from .sarsa_semigradient_agent import SARSASemiGradientAgent
-from .dqlearning_agent import DeepQAgent
+from .hogwild_qlearning_agent import HogwildQLearningAgent
+from .evaluation import BackgroundEvaluator, run_greedy_episodes, reached_goal
+from .replay_buffer import ReplayBuffer
+from .async_training import train_async, run_async_training
+from .dqn_profile import load_profile, save_profile, default_profile_path
+
+# Los agentes neuronales dependen de torch, que tarda segundos en importarse.
+# Se cargan bajo demanda (PEP 562) para que los agentes tabulares no lo paguen.
+_LAZY_IMPORTS = {
+    'SARSASemiGradientAgent': '.sarsa_semigradient_agent',
+    'DeepQAgent': '.dqlearning_agent',
+    'DeepQEnsemble': '.dqn_ensemble',
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
 
 # Lista de módulos o clases públicas
-__all__ = ['Agent', 'TabularAgent', 'MonteCarloAgent', 'MonteCarloOffPolicyAgent', 'MonteCarloOnPolicyAgent', 'SARSAAgent', 'QLearningAgent', 'SARSASemiGradientAgent', 'DeepQAgent']
+__all__ = ['Agent', 'TabularAgent', 'MonteCarloAgent', 'MonteCarloOffPolicyAgent', 'MonteCarloOnPolicyAgent', 'NStepAgent', 'NStepSARSAAgent', 'NStepExpectedSARSAAgent', 'NStepTreeBackupAgent', 'SARSAAgent', 'ExpectedSARSAAgent', 'QLearningAgent', 'HogwildQLearningAgent', 'BackgroundEvaluator', 'run_greedy_episodes', 'reached_goal', 'ReplayBuffer', 'train_async', 'run_async_training', 'load_profile', 'save_profile', 'default_profile_path', 'SARSASemiGradientAgent', 'DeepQAgent', 'DeepQEnsemble']
 
@@ -15,6 +15,8 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 from abc import ABC, abstractmethod
 import gymnasium as gym
 from politicas import Policy
+from instrumentacion import PhaseTimer, TrajectoryRecorder
+from agentes.evaluation import run_greedy_episodes
 from typing import Any, Dict
 import numpy as np
 
@@ -48,10 +50,22 @@ class Agent(ABC):
         self.episode_rewards = []
         self.steps = []
         self.episode_count = 0
+
+        # Instrumentación opcional (desactivada por defecto)
+        self.timer = None
+        self._instrumentation_undo = []
+
+        # Registro opcional de trayectorias (desactivado por defecto)
+        self.recorder = None
+        self._recording_undo = None
         
         # Inicialización específica según el tipo de algoritmo
         self._init_algorithm_params(**kwargs)
 
+        # La política puede necesitar estado del agente (contadores de visitas)
+        if self.policy is not None:
+            self.policy.bind(self)
+
     @abstractmethod
     def _init_algorithm_params(self, **kwargs):
         """
@@ -84,6 +98,32 @@ class Agent(ABC):
         """
         pass
 
+    def get_action_values_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Valores de acción de un lote de estados. Las subclases lo vectorizan.
+        
+        Args:
+            states: Array de estados
+            
+        Returns:
+            Array (batch, n_actions)
+        """
+        return np.stack([self.get_action_values(state) for state in states])
+
+    def get_actions(self, states: np.ndarray) -> np.ndarray:
+        """
+        Selecciona con la política una acción para cada estado de un lote,
+        con una única llamada a get_action_values_batch
+        
+        Args:
+            states: Array de estados
+            
+        Returns:
+            Array de acciones
+        """
+        states = np.asarray(states)
+        return self.policy.select_action_batch(states, self.get_action_values_batch(states))
+
     @abstractmethod
     def update(self, state: Any, action: int, next_state: Any, reward: float, 
                done: bool, info: Dict = None):
@@ -100,6 +140,53 @@ class Agent(ABC):
         """
         pass
     
+    def get_greedy_actions(self, states: np.ndarray) -> np.ndarray:
+        """
+        Devuelve la acción greedy para cada estado de un lote, sin exploración
+        ni modificación de la política. Las subclases lo vectorizan.
+        
+        Args:
+            states: Array de estados
+            
+        Returns:
+            Array con la acción greedy de cada estado
+        """
+        return np.array([np.argmax(self.get_action_values(state)) for state in states])
+
+    def greedy_snapshot(self):
+        """
+        Devuelve una copia congelada y serializable de la política greedy,
+        necesaria para evaluar en segundo plano (agentes.evaluation.BackgroundEvaluator)
+        
+        Returns:
+            Función que recibe un array de estados y devuelve sus acciones
+        """
+        raise NotImplementedError(f"{type(self).__name__} no implementa greedy_snapshot")
+
+    def evaluate(self, num_episodes: int = 100, num_envs: int = 16, max_steps: int = 1000,
+                 seed: int = None, env_fn=None, success_fn=None,
+                 success_threshold: float = None) -> Dict[str, Any]:
+        """
+        Evalúa la política greedy del agente en varios entornos a la vez
+        
+        Args:
+            num_episodes: Número de episodios de evaluación
+            num_envs: Número de entornos simultáneos
+            max_steps: Máximo de pasos por episodio
+            seed: Semilla; el episodio i se inicia con seed + i
+            env_fn: EnvSpec, identificador o función que crea el entorno
+                (por defecto el spec del entorno del agente)
+            success_fn: Criterio de éxito (ver run_greedy_episodes y reached_goal)
+            success_threshold: Éxito si el retorno alcanza este valor
+            
+        Returns:
+            Diccionario con las distribuciones de retorno y longitud y, si se
+            indica un criterio de éxito, la tasa de éxito
+        """
+        env_fn = env_fn if env_fn is not None else self.env.spec
+        return run_greedy_episodes(self.get_greedy_actions, env_fn, num_episodes, num_envs, max_steps, seed,
+                                   success_fn, success_threshold)
+
     def start_episode(self):
         """Prepara al agente para un nuevo episodio"""
         self.episode_count += 1
@@ -114,6 +201,78 @@ class Agent(ABC):
         self.episode_rewards.append(episode_reward)
         self.steps.append(steps)
     
+    def enable_instrumentation(self, timer: PhaseTimer = None) -> PhaseTimer:
+        """
+        Activa la medición de tiempos por fase (get_action, select_action,
+        env_step, update, ...)
+
+        Args:
+            timer: Temporizador a usar (se crea uno nuevo si no se indica)
+
+        Returns:
+            El temporizador activo
+        """
+        self.disable_instrumentation()
+        self.timer = timer if timer is not None else PhaseTimer()
+        self._instrument(self.timer)
+        return self.timer
+
+    def disable_instrumentation(self):
+        """
+        Desactiva la medición restaurando los métodos originales.
+        Los resultados se conservan en self.timer.
+        """
+        for undo in reversed(self._instrumentation_undo):
+            undo()
+        self._instrumentation_undo = []
+
+    def _instrument(self, timer: PhaseTimer):
+        """
+        Envuelve los métodos del bucle de entrenamiento con el temporizador.
+        Las subclases pueden ampliarlo para medir fases internas.
+
+        Args:
+            timer: Temporizador
+        """
+        undo = self._instrumentation_undo
+        undo.append(timer.wrap_method(self, 'get_action', 'get_action'))
+        undo.append(timer.wrap_method(self, 'update', 'update'))
+        undo.append(timer.wrap_method(self.env, 'step', 'env_step'))
+        if self.policy is not None:
+            undo.append(self.policy.instrument(timer))
+        if hasattr(self, '_process_episode'):
+            undo.append(timer.wrap_method(self, '_process_episode', 'process_episode'))
+
+    def enable_recording(self, recorder: TrajectoryRecorder) -> TrajectoryRecorder:
+        """
+        Activa el registro de todas las transiciones que pasan por update,
+        marcando los episodios en end_episode
+
+        Args:
+            recorder: Registro donde se guardan las transiciones
+
+        Returns:
+            El registro activo
+        """
+        self.disable_recording()
+        self.recorder = recorder
+        self._recording_undo = recorder.attach(self)
+        return recorder
+
+    def disable_recording(self, close: bool = True):
+        """
+        Desactiva el registro de transiciones
+
+        Args:
+            close: Si es True se cierra el registro (escribe lo pendiente y el índice)
+        """
+        if self._recording_undo is not None:
+            self._recording_undo()
+            self._recording_undo = None
+        if close and self.recorder is not None:
+            self.recorder.close()
+        self.recorder = None
+
     def stats(self):
         """
         Devuelve estadísticas sobre el proceso de aprendizaje
@@ -121,17 +280,24 @@ class Agent(ABC):
         Returns:
             Diccionario con estadísticas
         """
-        stats = 0
-        reward_ratio = []
-        for episode, reward in enumerate(self.episode_rewards):
-            stats += reward
-            reward_ratio.append(stats / (episode + 1))
+        # Media acumulada de recompensas calculada de forma vectorizada
+        reward_ratio = (np.cumsum(self.episode_rewards) / np.arange(1, len(self.episode_rewards) + 1)).tolist()
 
-
-        return {
+        stats = {
             "episode_rewards": self.episode_rewards,
             "mean_reward": np.mean(self.episode_rewards) if self.episode_rewards else 0,
             "episodes": self.episode_count,
             "reward_ratio": reward_ratio,
             "episode_lengths": self.steps
-        }
\ No newline at end of file
+        }
+
+        if self.timer is not None:
+            report = self.timer.report()
+            stats["instrumentation"] = report
+            stats["steps_per_sec"] = report["steps_per_sec"]
+            stats["updates_per_sec"] = report["updates_per_sec"]
+
+        if self.recorder is not None:
+            stats["recording"] = self.recorder.stats()
+
+        return stats
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""
+Module: agentes/async_training.py
+Description: Entrenamiento con muchos entornos asíncronos en vuelo y selección de acciones por lotes.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from agentes.monte_carlo_agent import MonteCarloAgent
+from agentes.n_step_agent import NStepAgent
+from time import perf_counter
+from typing import Any, Dict, Sequence
+import asyncio
+import numpy as np
+
+
+class _ActionBatcher:
+    """
+    Agrupa las peticiones de acción de los entornos que están listos a la vez
+    y las resuelve con una única llamada a agent.get_actions
+    """
+
+    def __init__(self, agent, max_batch_size: int, max_latency: float):
+        self.agent = agent
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.queue = asyncio.Queue()
+        self.batch_sizes = []
+
+    async def get_action(self, state: Any) -> int:
+        """Encola un estado y espera su acción"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((state, future))
+        return await future
+
+    async def run(self):
+        """Bucle de agrupación"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            # Deja correr a los entornos que ya están listos para que encolen su estado
+            await asyncio.sleep(0)
+            deadline = loop.time() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                actions = self.agent.get_actions(np.asarray([state for state, _ in batch]))
+            except Exception as error:
+                for _, future in batch:
+                    future.set_exception(error)
+                continue
+            self.batch_sizes.append(len(batch))
+            for (_, future), action in zip(batch, actions):
+                future.set_result(int(action))
+
+
+async def run_async_training(agent, envs: Sequence, num_episodes: int, max_steps_per_episode: int = 1000,
+                             decay: bool = True, seed: int = None, max_batch_size: int = 256,
+                             max_latency: float = 0.0) -> Dict[str, Any]:
+    """
+    Entrena un agente con varios entornos asíncronos a la vez (ver train_async)
+    """
+    if isinstance(agent, (MonteCarloAgent, NStepAgent)):
+        raise ValueError(f"{type(agent).__name__} guarda el episodio en curso y no admite episodios intercalados")
+    if getattr(agent, 'n_step', 1) > 1:
+        # El replay buffer encadena los objetivos de n pasos con llamadas
+        # consecutivas a add, que aquí vienen de entornos distintos
+        raise ValueError(f"{type(agent).__name__} con n_step > 1 no admite episodios intercalados")
+
+    batcher = _ActionBatcher(agent, max_batch_size, max_latency)
+    batch_task = asyncio.create_task(batcher.run())
+    next_episode = 0
+    total_steps = 0
+
+    async def run_env(env):
+        nonlocal next_episode, total_steps
+        while next_episode < num_episodes:
+            episode = next_episode
+            next_episode += 1
+            state, info = await env.reset(seed=None if seed is None else seed + episode)
+            agent.start_episode()
+
+            done = False
+            step = 0
+            episode_reward = 0
+            while not done and step < max_steps_per_episode:
+                action = await batcher.get_action(state)
+                next_state, reward, terminated, truncated, info = await env.step(action)
+                done = terminated or truncated
+                agent.update(state, action, next_state, reward, done, info)
+                episode_reward += reward
+                state = next_state
+                step += 1
+
+            agent.end_episode(episode_reward, step)
+            total_steps += step
+            if decay:
+                agent.policy.decay()
+
+    start = perf_counter()
+    try:
+        await asyncio.gather(*(run_env(env) for env in envs))
+    finally:
+        batch_task.cancel()
+        try:
+            await batch_task
+        except asyncio.CancelledError:
+            pass
+    wall_time = perf_counter() - start
+
+    return {
+        'episodes': num_episodes,
+        'steps': total_steps,
+        'num_envs': len(envs),
+        'wall_time': wall_time,
+        'steps_per_sec': total_steps / wall_time if wall_time > 0 else 0.0,
+        'mean_batch_size': float(np.mean(batcher.batch_sizes)) if batcher.batch_sizes else 0.0,
+    }
+
+
+def train_async(agent, envs: Sequence, num_episodes: int, max_steps_per_episode: int = 1000,
+                decay: bool = True, seed: int = None, max_batch_size: int = 256,
+                max_latency: float = 0.0) -> Dict[str, Any]:
+    """
+    Entrena un agente con muchos entornos asíncronos en vuelo.
+
+    Cada entorno corre en su propia corrutina: mientras unos esperan a su
+    step (E/S de un simulador externo), los que ya tienen observación piden
+    acción y se agrupan en un lote que se resuelve con una sola llamada a
+    get_action_values_batch. Cada transición se pasa a agent.update en
+    cuanto llega. Todo corre en el hilo del bucle de eventos, así que las
+    actualizaciones del agente nunca se solapan.
+
+    Los episodios de distintos entornos se intercalan, por lo que no sirve
+    para agentes que guardan el episodio en curso (Monte Carlo y n pasos)
+    ni para DeepQAgent con objetivos de n pasos (n_step > 1).
+    Las estadísticas por episodio del agente (convergencia de los tabulares)
+    se vuelven aproximadas.
+
+    Args:
+        agent: Agente a entrenar
+        envs: Entornos asíncronos (await reset(seed), await step(action)),
+            por ejemplo entornos.LatencyEnv o entornos.ThreadedAsyncEnv
+        num_episodes: Número total de episodios entre todos los entornos
+        max_steps_per_episode: Máximo de pasos por episodio
+        decay: Si se llama a policy.decay() al terminar cada episodio
+        seed: Semilla; el episodio i se inicia con seed + i
+        max_batch_size: Tamaño máximo de cada lote de selección de acciones
+        max_latency: Tiempo máximo (s) que se espera a que se llene un lote
+
+    Returns:
+        Diccionario con episodios, pasos, tiempo total, pasos por segundo y
+        tamaño medio de lote
+    """
+    return asyncio.run(run_async_training(agent, envs, num_episodes, max_steps_per_episode, decay,
+                                          seed, max_batch_size, max_latency))
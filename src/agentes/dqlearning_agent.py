@@ -13,10 +13,12 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
 from agentes.agent import Agent
+from agentes.evaluation import NetworkGreedySnapshot
+from agentes.replay_buffer import ReplayBuffer
+from agentes.dqn_profile import load_profile, merge_profile, apply_thread_settings
 import torch.nn as nn
 import torch.optim as optim
 import torch
-import random
 import numpy as np
 
 class DQNNetwork(nn.Module):
@@ -39,11 +41,32 @@ class DeepQAgent(Agent):
     Incluye un replay buffer y una target network para estabilizar el entrenamiento.
     """
     def _init_algorithm_params(self, **kwargs):
+        # Perfil de la máquina (python -m benchmark autotune), solo si se pide:
+        # autotune_profile=True (ruta por defecto) o una ruta. Fija batch_size
+        # y updates_per_step; los argumentos explícitos tienen prioridad (ver
+        # merge_profile)
+        self.profile = load_profile(kwargs.get('autotune_profile', False))
+        explicit = kwargs
+        kwargs = merge_profile(self.profile, kwargs)
+
+        # Los hilos de torch son globales al proceso: solo se cambian si se
+        # indican num_threads/num_interop_threads o, para usar los del
+        # perfil, autotune_threads=True
+        threads = kwargs if kwargs.get('autotune_threads', False) else explicit
+        apply_thread_settings(threads.get('num_threads'), threads.get('num_interop_threads'))
+
         # Parámetros del DQN
         self.lr = kwargs.get('lr', 0.001)
         self.batch_size = kwargs.get('batch_size', 32)
+        # Pasos de gradiente por paso del entorno (fraccionario: 0.25 = uno cada 4 pasos)
+        self.updates_per_step = kwargs.get('updates_per_step', 1)
+        if self.updates_per_step <= 0:
+            raise ValueError("updates_per_step debe ser mayor que 0")
+        self.pending_updates = 0.0
         self.replay_buffer_size = kwargs.get('replay_buffer_size', 10000)
         self.target_update_freq = kwargs.get('target_update_freq', 100)
+        # Pasos de los objetivos (1 = DQN clásico)
+        self.n_step = kwargs.get('n_step', 1)
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         
         # Dimensiones del estado y número de acciones (asumimos que el estado es un vector)
@@ -59,10 +82,28 @@ class DeepQAgent(Agent):
         # Optimizador
         self.optimizer = optim.Adam(self.q_network.parameters(), lr=self.lr)
         
-        # Replay buffer: lista de transiciones (state, action, reward, next_state, done)
-        self.replay_buffer = []
+        # Replay buffer con cada observación guardada una sola vez
+        # (replay_obs_dtype: 'float32', 'float16' o 'uint8')
+        self.replay_buffer = self._make_replay_buffer(**kwargs)
         self.update_counter = 0
 
+    def _make_replay_buffer(self, **kwargs):
+        """
+        Crea el replay buffer. Para guardar observaciones continuas en uint8
+        se cuantizan entre replay_obs_low y replay_obs_high (por defecto los
+        límites del espacio de observación, que deben estar acotados).
+        """
+        obs_dtype = kwargs.get('replay_obs_dtype', 'float32')
+        low = kwargs.get('replay_obs_low')
+        high = kwargs.get('replay_obs_high')
+        if obs_dtype == 'uint8' and self.observation_space.dtype != np.uint8 and (low is None or high is None):
+            low, high = self.observation_space.low, self.observation_space.high
+            if not (np.all(np.isfinite(low)) and np.all(np.isfinite(high))
+                    and np.all(np.abs(low) < 1e6) and np.all(np.abs(high) < 1e6)):
+                raise ValueError("Para guardar en uint8 un espacio no acotado indica replay_obs_low y replay_obs_high")
+        return ReplayBuffer(self.replay_buffer_size, self.observation_space.shape, obs_dtype, low, high,
+                            n_step=self.n_step, gamma=self.gamma)
+
     def get_action_values(self, state):
         """
         Devuelve los valores Q para todas las acciones dado un estado,
@@ -73,31 +114,95 @@ class DeepQAgent(Agent):
             state_tensor = torch.tensor(state, dtype=torch.float32).unsqueeze(0).to(self.device)
             q_values = self.q_network(state_tensor)
         return q_values.cpu().numpy()[0]
+
+    def get_action_values_batch(self, states):
+        """
+        Valores Q de un lote de estados con un único forward de la red Q.
+        """
+        self.q_network.eval()
+        with torch.no_grad():
+            states_tensor = torch.as_tensor(np.asarray(states), dtype=torch.float32).to(self.device)
+            q_values = self.q_network(states_tensor)
+        return q_values.cpu().numpy()
+
+    def get_greedy_actions(self, states):
+        """
+        Acciones greedy de un lote de estados con un único forward de la red Q.
+        """
+        self.q_network.eval()
+        with torch.no_grad():
+            states_tensor = torch.as_tensor(np.asarray(states), dtype=torch.float32).to(self.device)
+            q_values = self.q_network(states_tensor)
+        return q_values.argmax(dim=1).cpu().numpy()
+
+    def greedy_snapshot(self):
+        """
+        Copia congelada (en CPU) de la red Q para evaluación en segundo plano.
+        """
+        return NetworkGreedySnapshot(self.q_network)
     
+    def _sample_batch(self):
+        """
+        Selecciona un batch aleatorio del replay buffer y lo convierte a tensores
+
+        Returns:
+            Tupla (states, actions, rewards, next_states, dones, discounts) de tensores,
+            con rewards y discounts de los objetivos de n pasos
+        """
+        batch = self.replay_buffer.sample(self.batch_size)
+        
+        states = torch.as_tensor(batch['states']).to(self.device)
+        actions = torch.as_tensor(batch['actions']).unsqueeze(1).to(self.device)
+        rewards = torch.as_tensor(batch['rewards']).unsqueeze(1).to(self.device)
+        next_states = torch.as_tensor(batch['next_states']).to(self.device)
+        dones = torch.as_tensor(batch['dones'], dtype=torch.float32).unsqueeze(1).to(self.device)
+        discounts = torch.as_tensor(batch['discounts']).unsqueeze(1).to(self.device)
+        return states, actions, rewards, next_states, dones, discounts
+
+    def _optimize(self, loss):
+        """
+        Retropropaga la pérdida y aplica un paso del optimizador
+        """
+        self.optimizer.zero_grad()
+        loss.backward()
+        self.optimizer.step()
+
+    def _instrument(self, timer):
+        """
+        Además de las fases comunes, mide el forward de las redes, el
+        muestreo del replay buffer y el backward con el paso del optimizador.
+        """
+        super()._instrument(timer)
+        undo = self._instrumentation_undo
+        undo.append(timer.wrap_module(self.q_network, 'forward'))
+        undo.append(timer.wrap_module(self.target_network, 'target_forward'))
+        undo.append(timer.wrap_method(self, '_sample_batch', 'replay_sample'))
+        undo.append(timer.wrap_method(self, '_optimize', 'backward'))
+
     def update(self, state, action, next_state, reward, done, info=None):
         """
         Actualiza la red Q utilizando transiciones almacenadas en el replay buffer.
-        Se almacena la transición actual y, si hay suficientes muestras, se realiza
-        un paso de optimización.
+        Se almacena la transición actual y, si hay suficientes muestras, se realizan
+        los pasos de optimización que correspondan según updates_per_step.
         """
         # Almacenar la transición en el replay buffer
-        self.replay_buffer.append((state, action, reward, next_state, done))
-        if len(self.replay_buffer) > self.replay_buffer_size:
-            self.replay_buffer.pop(0)
+        self.replay_buffer.add(state, action, reward, next_state, done)
         
         # No se actualiza si el batch es menor al tamaño mínimo
         if len(self.replay_buffer) < self.batch_size:
             return
         
+        self.pending_updates += self.updates_per_step
+        while self.pending_updates >= 1:
+            self.pending_updates -= 1
+            self._learn_step()
+
+    def _learn_step(self):
+        """
+        Un paso de gradiente sobre un batch aleatorio del replay buffer
+        """
         # Seleccionar un batch aleatorio de transiciones
-        batch = random.sample(self.replay_buffer, self.batch_size)
-        states, actions, rewards, next_states, dones = zip(*batch)
-        
-        states = torch.tensor(np.array(states), dtype=torch.float32).to(self.device)
-        actions = torch.tensor(actions, dtype=torch.int64).unsqueeze(1).to(self.device)
-        rewards = torch.tensor(rewards, dtype=torch.float32).unsqueeze(1).to(self.device)
-        next_states = torch.tensor(np.array(next_states), dtype=torch.float32).to(self.device)
-        dones = torch.tensor(dones, dtype=torch.float32).unsqueeze(1).to(self.device)
+        states, actions, rewards, next_states, dones, discounts = self._sample_batch()
         
         # Predicción Q para los estados actuales
         q_values = self.q_network(states).gather(1, actions)
@@ -106,15 +211,14 @@ class DeepQAgent(Agent):
         with torch.no_grad():
             next_q_values = self.target_network(next_states)
             max_next_q_values, _ = torch.max(next_q_values, dim=1, keepdim=True)
-            target = rewards + self.gamma * max_next_q_values * (1 - dones)
+            # Objetivo de n pasos: R^(k) + γ^k * max_a Q(s_k, a) (γ^1 con n_step=1)
+            target = rewards + discounts * max_next_q_values * (1 - dones)
         
         # Cálculo de la pérdida (error cuadrático medio)
         loss = nn.MSELoss()(q_values, target)
         
         # Optimización
-        self.optimizer.zero_grad()
-        loss.backward()
-        self.optimizer.step()
+        self._optimize(loss)
         
         # Actualizar la target network de forma periódica
         self.update_counter += 1
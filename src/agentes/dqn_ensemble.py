@@ -0,0 +1,313 @@
+"""
+Module: agentes/dqn_ensemble.py
+Description: Entrenamiento en paralelo de un conjunto de redes DQN con torch.func.vmap.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from agentes.dqlearning_agent import DQNNetwork
+from agentes.evaluation import _make_env
+from torch.func import stack_module_state, functional_call, vmap
+from politicas import Policy
+import torch.optim as optim
+import torch
+import numpy as np
+import copy
+
+
+class DeepQEnsemble:
+    """
+    Conjunto de N agentes Deep Q-Learning independientes entrenados a la vez.
+
+    Los parámetros de las N redes Q (y de sus target networks) se apilan con
+    torch.func.stack_module_state, de modo que la selección de acciones, el
+    cálculo de la pérdida y el backward de todos los miembros se hacen con un
+    único forward/backward vectorizado (vmap) sobre N batches de replay.
+    Cada miembro tiene su propio entorno, su copia de la política, su replay
+    buffer y sus estadísticas. Como Adam actúa elemento a elemento, un solo
+    optimizador sobre los parámetros apilados equivale a N optimizadores.
+    """
+
+    def __init__(self, env_fn, num_members: int, policy: Policy, gamma: float = 0.99,
+                 seed: int = 0, **kwargs):
+        """
+        Inicializa el conjunto
+
+        Args:
+            env_fn: EnvSpec, identificador de gymnasium o función que crea un entorno
+            num_members: Número de agentes del conjunto
+            policy: Política de comportamiento (se copia para cada miembro)
+            gamma: Factor de descuento
+            seed: Semilla base; el miembro i usa seed + i
+            **kwargs: Parámetros del DQN (lr, batch_size, replay_buffer_size,
+                target_update_freq, hidden_dim)
+        """
+        self.num_members = num_members
+        self.gamma = gamma
+        self.seed = seed
+        self.lr = kwargs.get('lr', 0.001)
+        self.batch_size = kwargs.get('batch_size', 32)
+        self.replay_buffer_size = kwargs.get('replay_buffer_size', 10000)
+        self.target_update_freq = kwargs.get('target_update_freq', 100)
+        hidden_dim = kwargs.get('hidden_dim', 64)
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+        self.envs = [_make_env(env_fn) for _ in range(num_members)]
+        self.policies = [copy.deepcopy(policy) for _ in range(num_members)]
+        self.input_dim = self.envs[0].observation_space.shape[0]
+        self.n_actions = self.envs[0].action_space.n
+
+        # Redes de cada miembro, cada una con su semilla
+        networks = []
+        for i in range(num_members):
+            torch.manual_seed(seed + i)
+            networks.append(DQNNetwork(self.input_dim, self.n_actions, hidden_dim).to(self.device))
+        self.params, self.buffers = stack_module_state(networks)
+        self.target_params = {name: p.detach().clone() for name, p in self.params.items()}
+
+        # Red "plantilla" sin datos para functional_call
+        self.base_network = copy.deepcopy(networks[0]).to('meta')
+
+        self.optimizer = optim.Adam(self.params.values(), lr=self.lr)
+
+        # Replay buffers de todos los miembros en arrays [N, capacidad, ...]
+        capacity = self.replay_buffer_size
+        self.replay_states = np.zeros((num_members, capacity, self.input_dim), dtype=np.float32)
+        self.replay_actions = np.zeros((num_members, capacity), dtype=np.int64)
+        self.replay_rewards = np.zeros((num_members, capacity), dtype=np.float32)
+        self.replay_next_states = np.zeros((num_members, capacity, self.input_dim), dtype=np.float32)
+        self.replay_dones = np.zeros((num_members, capacity), dtype=np.float32)
+        self.replay_position = 0
+        self.replay_size = 0
+        self.update_counter = 0
+
+        # Estadísticas por miembro
+        self.episode_rewards = [[] for _ in range(num_members)]
+        self.steps = [[] for _ in range(num_members)]
+        self.losses = [[] for _ in range(num_members)]
+        self.final_params = [None] * num_members
+
+    def _q_values(self, params, states, members: np.ndarray = None):
+        """
+        Forward vectorizado de los miembros
+
+        Args:
+            params: Parámetros apilados de los N miembros
+            states: Tensor [M, B, input_dim] con M = len(members) (o N)
+            members: Miembros que se evalúan (por defecto todos)
+
+        Returns:
+            Tensor [M, B, n_actions]
+        """
+        buffers = self.buffers
+        if members is not None and len(members) < self.num_members:
+            index = torch.as_tensor(members, device=self.device)
+            params = {name: p[index] for name, p in params.items()}
+            buffers = {name: b[index] for name, b in buffers.items()}
+
+        def forward(member_params, member_buffers, x):
+            return functional_call(self.base_network, (member_params, member_buffers), (x,))
+        return vmap(forward)(params, buffers, states)
+
+    def get_action_values(self, states: np.ndarray, members: np.ndarray = None) -> np.ndarray:
+        """
+        Valores Q de cada miembro para su estado actual
+
+        Args:
+            states: Array [M, input_dim] con un estado por miembro
+            members: Miembros a los que corresponden los estados (por defecto todos)
+
+        Returns:
+            Array [M, n_actions]
+        """
+        with torch.no_grad():
+            states_tensor = torch.as_tensor(states, dtype=torch.float32, device=self.device).unsqueeze(1)
+            q_values = self._q_values(self.params, states_tensor, members)
+        return q_values[:, 0].cpu().numpy()
+
+    def _store(self, active, states, actions, rewards, next_states, dones):
+        """
+        Guarda una transición por miembro activo en los replay buffers.
+        Las filas de los miembros que ya han terminado no se escriben; sus
+        parámetros finales están congelados en final_params.
+        """
+        position = self.replay_position
+        self.replay_states[active, position] = states[active]
+        self.replay_actions[active, position] = actions[active]
+        self.replay_rewards[active, position] = rewards[active]
+        self.replay_next_states[active, position] = next_states[active]
+        self.replay_dones[active, position] = dones[active]
+        self.replay_position = (position + 1) % self.replay_buffer_size
+        self.replay_size = min(self.replay_size + 1, self.replay_buffer_size)
+
+    def _update(self, members: np.ndarray):
+        """
+        Un paso de optimización de los miembros activos con un único backward.
+        Los que ya han terminado no entran en el forward ni en la pérdida.
+
+        Args:
+            members: Miembros activos
+
+        Returns:
+            Array con la pérdida de cada miembro activo
+        """
+        rows = members[:, None]
+        indices = np.random.randint(0, self.replay_size, size=(len(members), self.batch_size))
+
+        to_tensor = lambda array, dtype: torch.as_tensor(array, dtype=dtype, device=self.device)
+        states = to_tensor(self.replay_states[rows, indices], torch.float32)
+        actions = to_tensor(self.replay_actions[rows, indices], torch.int64).unsqueeze(-1)
+        rewards = to_tensor(self.replay_rewards[rows, indices], torch.float32)
+        next_states = to_tensor(self.replay_next_states[rows, indices], torch.float32)
+        dones = to_tensor(self.replay_dones[rows, indices], torch.float32)
+
+        q_values = self._q_values(self.params, states, members).gather(2, actions).squeeze(-1)
+        with torch.no_grad():
+            max_next_q_values = self._q_values(self.target_params, next_states, members).max(dim=2).values
+            target = rewards + self.gamma * max_next_q_values * (1 - dones)
+
+        # Error cuadrático medio de cada miembro; la suma mantiene los gradientes separados
+        member_losses = ((q_values - target) ** 2).mean(dim=1)
+        self.optimizer.zero_grad()
+        member_losses.sum().backward()
+        self.optimizer.step()
+
+        self.update_counter += 1
+        if self.update_counter % self.target_update_freq == 0:
+            with torch.no_grad():
+                for name, p in self.params.items():
+                    self.target_params[name].copy_(p)
+
+        return member_losses.detach().cpu().numpy()
+
+    def _freeze_member(self, member: int):
+        """
+        Congela los parámetros de un miembro que ha terminado. Su gradiente es
+        cero a partir de ahora; al poner a cero también sus momentos de Adam,
+        el paso del optimizador deja de modificar su fila.
+
+        Args:
+            member: Índice del miembro
+        """
+        self.final_params[member] = self.member_state_dict(member)
+        for p in self.params.values():
+            state = self.optimizer.state.get(p)
+            if state:
+                state['exp_avg'][member].zero_()
+                state['exp_avg_sq'][member].zero_()
+
+    def train(self, num_episodes: int, max_steps_per_episode: int = 500, decay: bool = True):
+        """
+        Entrena todos los miembros hasta que cada uno completa num_episodes
+
+        Args:
+            num_episodes: Episodios por miembro
+            max_steps_per_episode: Máximo de pasos por episodio
+            decay: Si se aplica decaimiento a epsilon al final de cada episodio
+
+        Returns:
+            El propio conjunto
+        """
+        N = self.num_members
+        states = np.zeros((N, self.input_dim), dtype=np.float32)
+        for i, env in enumerate(self.envs):
+            states[i], _ = env.reset(seed=self.seed + i)
+        episode_reward = np.zeros(N)
+        episode_steps = np.zeros(N, dtype=np.int64)
+        active = np.array([len(rewards) < num_episodes for rewards in self.episode_rewards])
+
+        actions = np.zeros(N, dtype=np.int64)
+        rewards = np.zeros(N, dtype=np.float32)
+        next_states = np.zeros_like(states)
+        dones = np.zeros(N, dtype=np.float32)
+
+        while active.any():
+            # Selección de acciones de los miembros activos con un único forward
+            members = np.flatnonzero(active)
+            q_values = self.get_action_values(states[members], members)
+            for k, i in enumerate(members):
+                actions[i] = self.policies[i].select_action(states[i], q_values[k])
+                next_states[i], rewards[i], terminated, truncated, _ = self.envs[i].step(int(actions[i]))
+                dones[i] = terminated or truncated
+
+            self._store(active, states, actions, rewards, next_states, dones)
+            if self.replay_size >= self.batch_size:
+                losses = self._update(members)
+                for k, i in enumerate(members):
+                    self.losses[i].append(float(losses[k]))
+
+            for i in np.flatnonzero(active):
+                episode_reward[i] += rewards[i]
+                episode_steps[i] += 1
+                states[i] = next_states[i]
+                if dones[i] or episode_steps[i] >= max_steps_per_episode:
+                    self.episode_rewards[i].append(float(episode_reward[i]))
+                    self.steps[i].append(int(episode_steps[i]))
+                    episode_reward[i] = 0
+                    episode_steps[i] = 0
+                    if decay:
+                        self.policies[i].decay()
+                    if len(self.episode_rewards[i]) >= num_episodes:
+                        active[i] = False
+                        self._freeze_member(i)
+                    else:
+                        states[i], _ = self.envs[i].reset()
+
+        return self
+
+    def member_state_dict(self, member: int):
+        """
+        Parámetros de un miembro en el formato de state_dict de DQNNetwork
+
+        Args:
+            member: Índice del miembro
+
+        Returns:
+            Diccionario nombre -> tensor
+        """
+        if self.final_params[member] is not None:
+            return self.final_params[member]
+        return {name: p[member].detach().clone() for name, p in self.params.items()}
+
+    def member_network(self, member: int) -> DQNNetwork:
+        """
+        Reconstruye la red Q de un miembro como DQNNetwork independiente
+
+        Args:
+            member: Índice del miembro
+
+        Returns:
+            Red Q del miembro
+        """
+        network = DQNNetwork(self.input_dim, self.n_actions, self.params['net.0.weight'].shape[1]).to(self.device)
+        network.load_state_dict(self.member_state_dict(member))
+        return network
+
+    def stats(self):
+        """
+        Devuelve las estadísticas de cada miembro por separado
+
+        Returns:
+            Lista con un diccionario de estadísticas por miembro
+        """
+        member_stats = []
+        for i in range(self.num_members):
+            rewards = self.episode_rewards[i]
+            member_stats.append({
+                "member": i,
+                "seed": self.seed + i,
+                "episode_rewards": rewards,
+                "mean_reward": np.mean(rewards) if rewards else 0,
+                "episodes": len(rewards),
+                "reward_ratio": (np.cumsum(rewards) / np.arange(1, len(rewards) + 1)).tolist(),
+                "episode_lengths": self.steps[i],
+                "mean_loss": np.mean(self.losses[i]) if self.losses[i] else 0,
+            })
+        return member_stats
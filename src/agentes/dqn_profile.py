@@ -0,0 +1,159 @@
+"""
+Module: agentes/dqn_profile.py
+Description: Perfiles de rendimiento de DeepQAgent ajustados para la máquina actual.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import Any, Dict, Union
+import warnings
+import logging
+import platform
+import json
+import os
+
+# Variable de entorno que sustituye a la ruta por defecto del perfil
+PROFILE_ENV_VAR = 'RL_DQN_PROFILE'
+
+logger = logging.getLogger(__name__)
+
+# Parámetros de DeepQAgent que puede fijar un perfil
+PROFILE_PARAMS = ('batch_size', 'updates_per_step', 'num_threads', 'num_interop_threads')
+
+
+def default_profile_path() -> str:
+    """
+    Ruta del perfil: la de RL_DQN_PROFILE o ~/.cache/rl_mc_ol/dqn_profile.json
+
+    Returns:
+        Ruta del fichero
+    """
+    return os.environ.get(PROFILE_ENV_VAR) or os.path.join(
+        os.path.expanduser('~'), '.cache', 'rl_mc_ol', 'dqn_profile.json')
+
+
+def host_fingerprint() -> Dict[str, Any]:
+    """
+    Identifica la máquina y la versión de torch para las que vale un perfil
+
+    Returns:
+        Diccionario con nombre de la máquina, arquitectura, CPUs y versión de torch
+    """
+    import torch
+    return {
+        'hostname': platform.node(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'torch': torch.__version__,
+    }
+
+
+def save_profile(profile: Dict[str, Any], path: str = None) -> str:
+    """
+    Guarda un perfil en formato JSON
+
+    Args:
+        profile: Perfil (ver benchmark.autotune.run_autotune)
+        path: Ruta del fichero (por defecto default_profile_path())
+
+    Returns:
+        Ruta en la que se ha guardado
+    """
+    path = path or default_profile_path()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(profile, f, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_profile(path: Union[str, bool] = True) -> Dict[str, Any]:
+    """
+    Carga los parámetros de un perfil si corresponde a esta máquina
+
+    Args:
+        path: Ruta del perfil, True para la ruta por defecto (si no existe no
+            se carga nada) o False/None para no cargar ninguno
+
+    Returns:
+        Diccionario con los parámetros del perfil y samples_per_step (vacío
+        si no hay perfil, si está dañado o si se generó en otra máquina)
+    """
+    if path is None or path is False:
+        return {}
+    if path is True:
+        path = default_profile_path()
+        if not os.path.exists(path):
+            return {}
+
+    try:
+        with open(path) as f:
+            profile = json.load(f)
+        config = profile['config']
+        params = {name: config[name] for name in PROFILE_PARAMS if name in config}
+        params['samples_per_step'] = profile.get('samples_per_step')
+    except (ValueError, KeyError, TypeError) as error:
+        warnings.warn(f"El perfil {path} está dañado y se ignora ({error!r}); "
+                      "vuelve a ejecutar python -m benchmark autotune")
+        return {}
+
+    if profile.get('host') != host_fingerprint():
+        warnings.warn(f"El perfil {path} se generó en otra máquina o con otra versión de torch; "
+                      "se ignora (vuelve a ejecutar python -m benchmark autotune)")
+        return {}
+    logger.info("Perfil de DeepQAgent cargado de %s: %s", path, params)
+    return params
+
+
+def merge_profile(profile: Dict[str, Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Combina un perfil con los argumentos explícitos, que tienen prioridad.
+
+    updates_per_step del perfil se derivó de su batch_size para procesar
+    samples_per_step muestras por paso del entorno. Si se indica otro
+    batch_size sin updates_per_step, se recalcula para mantener esas muestras
+    (o se usa 1 si el perfil no las indica).
+
+    Args:
+        profile: Resultado de load_profile
+        kwargs: Argumentos explícitos del agente
+
+    Returns:
+        Argumentos combinados
+    """
+    profile = dict(profile)
+    samples_per_step = profile.pop('samples_per_step', None)
+    params = {**profile, **kwargs}
+    if 'batch_size' in kwargs and 'updates_per_step' not in kwargs and 'updates_per_step' in profile:
+        params['updates_per_step'] = samples_per_step / kwargs['batch_size'] if samples_per_step else 1
+    return params
+
+
+def apply_thread_settings(num_threads: int = None, num_interop_threads: int = None):
+    """
+    Fija los hilos de torch. Son globales al proceso, y los hilos inter-op
+    solo pueden fijarse antes de que torch ejecute trabajo en paralelo; si ya
+    no es posible se mantiene el valor actual.
+
+    Args:
+        num_threads: Hilos intra-op (None para no cambiarlos)
+        num_interop_threads: Hilos inter-op (None para no cambiarlos)
+    """
+    import torch
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+    if num_interop_threads is not None and torch.get_num_interop_threads() != num_interop_threads:
+        try:
+            torch.set_num_interop_threads(num_interop_threads)
+        except RuntimeError:
+            warnings.warn(f"No se pueden fijar {num_interop_threads} hilos inter-op: torch ya los ha iniciado")
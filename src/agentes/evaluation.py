@@ -0,0 +1,242 @@
+"""
+Module: agentes/evaluation.py
+Description: Evaluación greedy por lotes de agentes entrenados.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict
+import multiprocessing as mp
+import gymnasium as gym
+import numpy as np
+
+
+class TabularGreedySnapshot:
+    """
+    Copia congelada de una tabla Q que selecciona acciones greedy por lotes
+    """
+
+    def __init__(self, Q: np.ndarray):
+        self.Q = np.array(Q)
+
+    def __call__(self, states: np.ndarray) -> np.ndarray:
+        return np.argmax(self.Q[states], axis=1)
+
+
+class NetworkGreedySnapshot:
+    """
+    Copia congelada (en CPU) de una red Q que selecciona acciones greedy por lotes
+    """
+
+    def __init__(self, network):
+        import copy
+        self.network = copy.deepcopy(network).cpu().eval()
+
+    def __call__(self, states: np.ndarray) -> np.ndarray:
+        import torch
+        with torch.no_grad():
+            q_values = self.network(torch.as_tensor(states, dtype=torch.float32))
+        return q_values.argmax(dim=1).numpy()
+
+
+def _make_env(env_fn) -> gym.Env:
+    """
+    Crea un entorno a partir de un EnvSpec, un identificador o una función
+
+    Args:
+        env_fn: EnvSpec, identificador de gymnasium o función sin argumentos
+
+    Returns:
+        Entorno nuevo
+    """
+    if isinstance(env_fn, (str, gym.envs.registration.EnvSpec)):
+        return gym.make(env_fn)
+    return env_fn()
+
+
+def reached_goal(episode_return: float, terminated: bool, reward: float) -> bool:
+    """
+    Criterio de éxito de entornos con meta (FrozenLake, ...): el episodio
+    termina con recompensa positiva
+
+    Args:
+        episode_return: Retorno del episodio
+        terminated: Si el episodio terminó en un estado terminal
+        reward: Última recompensa
+
+    Returns:
+        Si el episodio es un éxito
+    """
+    return terminated and reward > 0
+
+
+def run_greedy_episodes(select_actions: Callable, env_fn, num_episodes: int = 100, num_envs: int = 16,
+                        max_steps: int = 1000, seed: int = None, success_fn: Callable = None,
+                        success_threshold: float = None) -> Dict[str, Any]:
+    """
+    Ejecuta num_episodes episodios greedy repartidos en num_envs entornos.
+    En cada paso se agrupan los estados de todos los entornos activos y se
+    seleccionan sus acciones con una única llamada a select_actions.
+
+    Qué es un éxito depende del entorno, así que success_rate solo se
+    incluye si se indica un criterio.
+
+    Args:
+        select_actions: Función que recibe un array de estados y devuelve sus acciones
+        env_fn: EnvSpec, identificador de gymnasium o función que crea un entorno
+        num_episodes: Número de episodios
+        num_envs: Número de entornos simultáneos
+        max_steps: Máximo de pasos por episodio
+        seed: Semilla; el episodio i se inicia con seed + i
+        success_fn: Función (retorno, terminated, última recompensa) -> bool
+            que decide si un episodio es un éxito (por ejemplo reached_goal)
+        success_threshold: Alternativa a success_fn: éxito si el retorno es
+            mayor o igual que este valor
+
+    Returns:
+        Diccionario con las distribuciones de retorno y longitud y, si hay
+        criterio de éxito, la tasa de éxito
+    """
+    if success_fn is None and success_threshold is not None:
+        success_fn = partial(_return_above, threshold=success_threshold)
+
+    num_envs = max(1, min(num_envs, num_episodes))
+    envs = [_make_env(env_fn) for _ in range(num_envs)]
+
+    returns = np.zeros(num_episodes)
+    lengths = np.zeros(num_episodes, dtype=np.int64)
+    successes = np.zeros(num_episodes, dtype=bool)
+
+    states = [None] * num_envs
+    slot_episode = [-1] * num_envs
+    next_episode = 0
+
+    def start(slot):
+        nonlocal next_episode
+        if next_episode >= num_episodes:
+            slot_episode[slot] = -1
+            return
+        episode_seed = None if seed is None else seed + next_episode
+        states[slot], _ = envs[slot].reset(seed=episode_seed)
+        slot_episode[slot] = next_episode
+        next_episode += 1
+
+    for slot in range(num_envs):
+        start(slot)
+
+    active = [slot for slot in range(num_envs) if slot_episode[slot] >= 0]
+    while active:
+        actions = select_actions(np.asarray([states[slot] for slot in active]))
+        for slot, action in zip(active, actions):
+            episode = slot_episode[slot]
+            next_state, reward, terminated, truncated, _ = envs[slot].step(int(action))
+            returns[episode] += reward
+            lengths[episode] += 1
+            states[slot] = next_state
+            if terminated or truncated or lengths[episode] >= max_steps:
+                if success_fn is not None:
+                    successes[episode] = success_fn(returns[episode], terminated, reward)
+                start(slot)
+        active = [slot for slot in range(num_envs) if slot_episode[slot] >= 0]
+
+    for env in envs:
+        env.close()
+
+    results = {
+        "episodes": num_episodes,
+        "mean_return": float(returns.mean()),
+        "std_return": float(returns.std()),
+        "return_percentiles": dict(zip(("p5", "p25", "p50", "p75", "p95"),
+                                       np.percentile(returns, [5, 25, 50, 75, 95]).tolist())),
+        "mean_length": float(lengths.mean()),
+        "length_percentiles": dict(zip(("p5", "p25", "p50", "p75", "p95"),
+                                       np.percentile(lengths, [5, 25, 50, 75, 95]).tolist())),
+        "returns": returns,
+        "lengths": lengths,
+    }
+    if success_fn is not None:
+        results["success_rate"] = float(successes.mean())
+    return results
+
+
+def _return_above(episode_return: float, terminated: bool, reward: float, threshold: float) -> bool:
+    """Éxito si el retorno alcanza el umbral (se define a nivel de módulo para poder serializarse)"""
+    return episode_return >= threshold
+
+
+class BackgroundEvaluator:
+    """
+    Evalúa periódicamente un agente en un proceso aparte para no detener el
+    entrenamiento. Cada evaluación trabaja sobre una copia congelada de la
+    función de valor (greedy_snapshot), así que el agente puede seguir
+    aprendiendo mientras tanto.
+    """
+
+    def __init__(self, agent, num_episodes: int = 100, num_envs: int = 16, max_steps: int = 1000,
+                 seed: int = None, env_fn=None, success_fn: Callable = None, success_threshold: float = None):
+        """
+        Args:
+            agent: Agente a evaluar
+            num_episodes: Episodios por evaluación
+            num_envs: Entornos simultáneos por evaluación
+            max_steps: Máximo de pasos por episodio
+            seed: Semilla de los episodios de evaluación
+            env_fn: Entorno de evaluación (EnvSpec, identificador o función
+                serializable); por defecto el spec del entorno del agente
+            success_fn: Ver run_greedy_episodes (debe poder serializarse)
+            success_threshold: Ver run_greedy_episodes
+        """
+        self.agent = agent
+        self.num_episodes = num_episodes
+        self.num_envs = num_envs
+        self.max_steps = max_steps
+        self.seed = seed
+        self.env_fn = env_fn if env_fn is not None else agent.env.spec
+        self.success_fn = success_fn
+        self.success_threshold = success_threshold
+        self.executor = ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context('spawn'))
+        self.pending = []
+        self.history = []
+
+    def submit(self, episode: int = None):
+        """
+        Lanza una evaluación del estado actual del agente
+
+        Args:
+            episode: Episodio de entrenamiento al que corresponde (por defecto episode_count)
+        """
+        episode = self.agent.episode_count if episode is None else episode
+        future = self.executor.submit(run_greedy_episodes, self.agent.greedy_snapshot(), self.env_fn,
+                                      self.num_episodes, self.num_envs, self.max_steps, self.seed,
+                                      self.success_fn, self.success_threshold)
+        self.pending.append((episode, future))
+
+    def poll(self, wait: bool = False):
+        """
+        Recoge las evaluaciones terminadas
+
+        Args:
+            wait: Si se espera a que terminen todas las pendientes
+
+        Returns:
+            Lista de (episodio, resultados) recogidos en esta llamada
+        """
+        finished = [(episode, future) for episode, future in self.pending if wait or future.done()]
+        self.pending = [item for item in self.pending if item not in finished]
+        collected = [(episode, future.result()) for episode, future in finished]
+        self.history.extend(collected)
+        return collected
+
+    def close(self):
+        """Espera a las evaluaciones pendientes y cierra el proceso evaluador"""
+        self.poll(wait=True)
+        self.executor.shutdown()
@@ -0,0 +1,93 @@
+"""
+Module: agentes/expected_sarsa_agent.py
+Description: Implementación del agente Expected SARSA.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from agentes.tabular_agent import TabularAgent
+import numpy as np
+from typing import Any, Dict
+
+class ExpectedSARSAAgent(TabularAgent):
+    """
+    Agente Expected SARSA para aprendizaje por refuerzo.
+
+    Actualiza la función Q con la fórmula:
+
+        Q(s, a) ← Q(s, a) + α [r + γ * Σ_a' π(a'|s') Q(s', a') - Q(s, a)]
+
+    El valor de s' se calcula en forma cerrada como el producto escalar de
+    las probabilidades de la política y la fila Q(s', ·), sin muestrear a'.
+    Al eliminar la varianza del muestreo admite tasas de aprendizaje mayores
+    que SARSA.
+    """
+
+    def _init_algorithm_params(self, **kwargs):
+        """
+        Inicializa los parámetros específicos para el agente Expected SARSA.
+
+        Args:
+            **kwargs: Parámetros adicionales, entre ellos:
+                - alpha: tasa de aprendizaje (learning rate)
+        """
+        # Inicializa los parámetros comunes para agentes tabulares
+        super()._init_algorithm_params(**kwargs)
+        # Tasa de aprendizaje
+        self.alpha = kwargs.get('alpha', 0.1)
+
+    def update(self, state: Any, action: int, next_state: Any, reward: float,
+               done: bool, info: Dict = None) -> None:
+        """
+        Actualiza la función Q en base a la transición (s, a, r, s') con el
+        objetivo esperado de Expected SARSA.
+
+        Args:
+            state: Estado actual
+            action: Acción tomada en el estado actual
+            next_state: Estado resultante tras la acción
+            reward: Recompensa recibida
+            done: Indicador de fin de episodio
+            info: Información adicional del entorno (opcional)
+        """
+        if done:
+            td_target = reward
+        else:
+            pi = self.policy.get_action_probabilities(next_state, self.Q)
+            td_target = reward + self.gamma * np.dot(pi, self.Q[next_state])
+
+        td_error = td_target - self.Q[state, action]
+        self._update_q(state, action, self.alpha * td_error)
+
+    def update_batch(self, states: np.ndarray, actions: np.ndarray, next_states: np.ndarray,
+                     rewards: np.ndarray, dones: np.ndarray) -> None:
+        """
+        Actualiza un lote de transiciones (por ejemplo de varios entornos o de
+        un registro de trayectorias). Todos los objetivos se calculan con la
+        tabla Q previa a la actualización.
+
+        Args:
+            states: Array de estados
+            actions: Array de acciones
+            next_states: Array de estados siguientes
+            rewards: Array de recompensas
+            dones: Array de indicadores de fin de episodio
+        """
+        states = np.asarray(states, dtype=np.int64)
+        actions = np.asarray(actions, dtype=np.int64)
+        next_states = np.asarray(next_states, dtype=np.int64)
+        next_q = self.Q[next_states]
+
+        pi = self.policy.get_action_probabilities_batch(next_q, next_states)
+        expected = np.einsum('ij,ij->i', pi, next_q)
+        td_targets = np.asarray(rewards) + self.gamma * np.where(dones, 0.0, expected)
+
+        td_errors = td_targets - self.Q[states, actions]
+        self._update_q_batch(states, actions, self.alpha * td_errors)
@@ -0,0 +1,262 @@
+"""
+Module: agentes/hogwild_qlearning_agent.py
+Description: Implementación de Q-Learning tabular paralelo (Hogwild) con memoria compartida.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from agentes.qlearning_agent import QLearningAgent
+from multiprocessing import shared_memory
+from typing import Dict
+import multiprocessing as mp
+import traceback
+import time
+import queue as queue_module
+import gymnasium as gym
+import numpy as np
+
+
+def _hogwild_worker(shm_name: str, shape: tuple, agent_params: Dict, policy, env_id: str,
+                    env_kwargs: Dict, num_episodes: int, max_steps_per_episode: int,
+                    decay: bool, decay_alpha: bool, stats_interval: int, seed: int, queue, worker: int):
+    """
+    Proceso trabajador: entrena un QLearningAgent cuya tabla Q es una vista
+    de la memoria compartida y envía periódicamente sus estadísticas al padre.
+
+    Args:
+        shm_name: Nombre del bloque de memoria compartida con la tabla Q
+        shape: Forma de la tabla Q
+        agent_params: Parámetros del agente (gamma, alpha, ...)
+        policy: Copia de la política de selección de acciones
+        env_id: Identificador del entorno de gymnasium
+        env_kwargs: Argumentos para crear el entorno
+        num_episodes: Número de episodios a ejecutar por este trabajador
+        max_steps_per_episode: Máximo de pasos por episodio
+        decay: Si se aplica decaimiento a epsilon
+        decay_alpha: Si se aplica decaimiento a alpha
+        stats_interval: Cada cuántos episodios se envían estadísticas
+        seed: Semilla del trabajador
+        queue: Cola para enviar al proceso padre pares (worker, contenido): las
+            estadísticas, la traza si el trabajador falla y None al terminar
+        worker: Índice del trabajador
+    """
+    shm = env = agent = None
+    try:
+        np.random.seed(seed)
+        shm = shared_memory.SharedMemory(name=shm_name)
+        env = gym.make(env_id, **env_kwargs)
+
+        agent = QLearningAgent(env, policy=policy, **agent_params)
+        # La tabla Q es la compartida; las escrituras se hacen sin bloqueo
+        agent.set_q_table(np.ndarray(shape, dtype=np.float64, buffer=shm.buf))
+
+        rewards, lengths = [], []
+        for episode in range(num_episodes):
+            state, info = env.reset(seed=seed + episode)
+            agent.start_episode()
+
+            done = False
+            step = 0
+            episode_reward = 0
+            while not done and step < max_steps_per_episode:
+                action = agent.get_action(state)
+                next_state, reward, terminated, truncated, info = env.step(action)
+                done = terminated or truncated
+                agent.update(state, action, next_state, reward, done, info)
+                episode_reward += reward
+                state = next_state
+                step += 1
+
+            rewards.append(episode_reward)
+            lengths.append(step)
+
+            if decay_alpha:
+                agent.decay_learning_rate()
+            if decay:
+                agent.policy.decay()
+
+            if len(rewards) >= stats_interval:
+                queue.put((worker, (rewards, lengths)))
+                rewards, lengths = [], []
+
+        if rewards:
+            queue.put((worker, (rewards, lengths)))
+    except Exception:
+        queue.put((worker, traceback.format_exc()))
+        raise
+    finally:
+        # Señal de fin del trabajador
+        queue.put((worker, None))
+        # La vista de la tabla Q debe liberarse antes de cerrar la memoria compartida
+        agent = None
+        if env is not None:
+            env.close()
+        if shm is not None:
+            shm.close()
+
+
+class HogwildQLearningAgent(QLearningAgent):
+    """
+    Q-Learning tabular paralelo al estilo Hogwild.
+
+    La tabla Q vive en un bloque de multiprocessing.shared_memory y varios
+    procesos, cada uno con su propio entorno y su copia de la política,
+    aplican actualizaciones Q[s, a] concurrentes sin bloqueos. El proceso
+    padre recoge periódicamente las estadísticas de los trabajadores y las
+    añade a las del agente, de modo que stats() refleja todo el entrenamiento.
+    """
+
+    def _init_algorithm_params(self, **kwargs):
+        """
+        Inicializa parámetros específicos para Hogwild Q-Learning
+
+        Args:
+            **kwargs: Parámetros adicionales, entre ellos:
+                - num_workers: número de procesos trabajadores
+                - stats_interval: cada cuántos episodios envía estadísticas cada trabajador
+                - poll_interval: segundos entre comprobaciones de trabajadores caídos
+        """
+        super()._init_algorithm_params(**kwargs)
+
+        self.num_workers = kwargs.get('num_workers', mp.cpu_count())
+        self.stats_interval = kwargs.get('stats_interval', 100)
+        # Segundos entre comprobaciones de que los trabajadores siguen vivos
+        self.poll_interval = kwargs.get('poll_interval', 1.0)
+
+        # Parámetros con los que se construye el agente de cada trabajador
+        self.worker_params = {key: value for key, value in kwargs.items()
+                              if key not in ('num_workers', 'stats_interval', 'poll_interval')}
+        self.worker_params['gamma'] = self.gamma
+        # Los demás trabajadores escriben en la misma tabla, así que las
+        # estadísticas de convergencia de cada uno no tendrían sentido
+        self.worker_params['track_convergence'] = False
+
+        # Traslada la tabla Q a memoria compartida
+        self.shared_memory = shared_memory.SharedMemory(create=True, size=self.Q.nbytes)
+        shared_Q = np.ndarray(self.Q.shape, dtype=np.float64, buffer=self.shared_memory.buf)
+        shared_Q[:] = self.Q
+        self.set_q_table(shared_Q)
+
+    def train(self, env_id: str, num_episodes: int, env_kwargs: Dict = None,
+              max_steps_per_episode: int = 1000, decay: bool = False,
+              decay_alpha: bool = False, seed: int = 0):
+        """
+        Entrena el agente repartiendo los episodios entre los trabajadores
+
+        Args:
+            env_id: Identificador del entorno de gymnasium (cada trabajador crea el suyo)
+            num_episodes: Número total de episodios
+            env_kwargs: Argumentos para gym.make
+            max_steps_per_episode: Máximo de pasos por episodio
+            decay: Si se aplica decaimiento a epsilon en cada trabajador
+            decay_alpha: Si se aplica decaimiento a alpha en cada trabajador
+            seed: Semilla base; el trabajador i usa seed + i * num_episodes
+
+        Returns:
+            El propio agente
+        """
+        if self.shared_memory is None:
+            raise RuntimeError("El agente ya se ha cerrado con close()")
+
+        env_kwargs = env_kwargs or {}
+        episodes_per_worker = np.full(self.num_workers, num_episodes // self.num_workers)
+        episodes_per_worker[:num_episodes % self.num_workers] += 1
+
+        queue = mp.Queue()
+        workers = []
+        for i, worker_episodes in enumerate(episodes_per_worker):
+            if worker_episodes == 0:
+                continue
+            process = mp.Process(target=_hogwild_worker,
+                                 args=(self.shared_memory.name, self.Q.shape, self.worker_params,
+                                       self.policy, env_id, env_kwargs, int(worker_episodes),
+                                       max_steps_per_episode, decay, decay_alpha,
+                                       self.stats_interval, seed + i * num_episodes, queue, len(workers)))
+            process.start()
+            workers.append(process)
+
+        # Recoge las estadísticas hasta que todos los trabajadores terminan.
+        # Cada poll_interval segundos se comprueba que ninguno haya muerto sin
+        # enviar su señal de fin (por ejemplo, terminado por el sistema)
+        finished = set()
+        next_check = time.monotonic() + self.poll_interval
+        while len(finished) < len(workers):
+            try:
+                self._handle_message(queue.get(timeout=self.poll_interval), finished, workers)
+            except queue_module.Empty:
+                pass
+            if time.monotonic() < next_check:
+                continue
+            next_check = time.monotonic() + self.poll_interval
+            if any(process.exitcode not in (None, 0) for process in workers):
+                # Los mensajes de un proceso que ha terminado ya están en la
+                # cola: se leen antes para informar de su error si lo envió
+                try:
+                    while True:
+                        self._handle_message(queue.get(timeout=0.1), finished, workers)
+                except queue_module.Empty:
+                    pass
+                dead = [process for i, process in enumerate(workers)
+                        if process.exitcode not in (None, 0) and i not in finished]
+                if dead:
+                    self._stop_workers(workers)
+                    raise RuntimeError(f"Un trabajador Hogwild terminó con código {dead[0].exitcode}")
+
+        for process in workers:
+            process.join()
+
+        # Los trabajadores han modificado la tabla por su cuenta
+        self.greedy_actions = np.argmax(self.Q, axis=1)
+        return self
+
+    def _handle_message(self, message, finished: set, workers):
+        """
+        Procesa un mensaje (trabajador, contenido) de la cola de un trabajador
+
+        Args:
+            message: Estadísticas (rewards, lengths), traza de un error o None al terminar
+            finished: Trabajadores que han terminado (se actualiza)
+            workers: Procesos trabajadores
+        """
+        worker, content = message
+        if content is None:
+            finished.add(worker)
+        elif isinstance(content, str):
+            self._stop_workers(workers)
+            raise RuntimeError(f"Error en un trabajador Hogwild:\n{content}")
+        else:
+            rewards, lengths = content
+            self.episode_rewards.extend(rewards)
+            self.steps.extend(lengths)
+            self.episode_count += len(rewards)
+
+    @staticmethod
+    def _stop_workers(workers):
+        """
+        Detiene los trabajadores que sigan vivos tras un fallo
+
+        Args:
+            workers: Procesos trabajadores
+        """
+        for process in workers:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+    def close(self):
+        """
+        Copia la tabla Q a memoria local y libera la memoria compartida
+        """
+        if self.shared_memory is None:
+            return
+        self.set_q_table(np.array(self.Q))
+        self.shared_memory.close()
+        self.shared_memory.unlink()
+        self.shared_memory = None
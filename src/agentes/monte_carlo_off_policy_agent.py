@@ -62,4 +62,4 @@ class MonteCarloOffPolicyAgent(MonteCarloAgent):
             # Actualización con Importance Sampling
             self.visit_counts[state, action] += 1
             alpha = 1.0 / self.visit_counts[state, action]
-            self.Q[state, action] += W * alpha * (G - self.Q[state, action])
\ No newline at end of file
+            self._update_q(state, action, W * alpha * (G - self.Q[state, action]))
\ No newline at end of file
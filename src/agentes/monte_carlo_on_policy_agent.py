@@ -51,4 +51,4 @@ class MonteCarloOnPolicyAgent(MonteCarloAgent):
              # Actualización incremental
              self.visit_counts[state, action] += 1
              alpha = 1.0 / self.visit_counts[state, action]
-             self.Q[state, action] += alpha * (G - self.Q[state, action])
\ No newline at end of file
+             self._update_q(state, action, alpha * (G - self.Q[state, action]))
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+Module: agentes/n_step_agent.py
+Description: Implementación de la clase base para agentes TD de n pasos.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from abc import abstractmethod
+from agentes.tabular_agent import TabularAgent
+import numpy as np
+from typing import Any, Dict
+
+class NStepAgent(TabularAgent):
+    """
+    Clase base para agentes TD de n pasos.
+
+    Guarda las últimas n transiciones en un buffer circular preasignado y
+    mantiene el retorno parcial descontado de la transición más antigua:
+
+        G = R_{τ+1} + γ R_{τ+2} + ... + γ^{k-1} R_{τ+k}
+
+    Cuando el buffer está lleno se actualiza Q(S_τ, A_τ) con el objetivo
+    G + γ^n * bootstrap(S_{τ+n}). Al terminar el episodio se vacía el buffer
+    de una sola vez (ver _flush: con pares (s, a) repetidos no equivale a
+    las actualizaciones secuenciales).
+    """
+
+    def _init_algorithm_params(self, **kwargs):
+        """
+        Inicializa los parámetros específicos para agentes de n pasos
+
+        Args:
+            **kwargs: Parámetros adicionales, entre ellos:
+                - alpha: tasa de aprendizaje
+                - n: número de pasos antes de hacer bootstrap
+        """
+        super()._init_algorithm_params(**kwargs)
+
+        # Tasa de aprendizaje
+        self.alpha = kwargs.get('alpha', 0.1)
+
+        # Número de pasos
+        self.n = kwargs.get('n', 4)
+        if self.n < 1:
+            raise ValueError("n debe ser mayor o igual que 1")
+
+        # Buffer circular con las últimas n transiciones
+        self.buffer_states = np.zeros(self.n, dtype=np.int64)
+        self.buffer_actions = np.zeros(self.n, dtype=np.int64)
+        self.buffer_rewards = np.zeros(self.n, dtype=np.float64)
+        self.buffer_head = 0
+        self.buffer_size = 0
+
+        # Retorno parcial descontado de la transición más antigua del buffer
+        self.partial_return = 0.0
+
+        # Potencias de gamma precalculadas: γ^0, ..., γ^n
+        self.gamma_powers = self.gamma ** np.arange(self.n + 1)
+
+        # Matriz triangular superior con γ^(j-i) para calcular los retornos
+        # de todas las transiciones pendientes al final del episodio
+        offsets = np.subtract.outer(np.arange(self.n), np.arange(self.n)).T
+        self.discount_matrix = np.where(offsets >= 0, self.gamma_powers[np.clip(offsets, 0, self.n)], 0.0)
+
+    @abstractmethod
+    def _bootstrap_value(self, next_state: int) -> float:
+        """
+        Valor estimado del estado S_{τ+n} usado para completar el retorno
+        (a implementar en subclases)
+
+        Args:
+            next_state: Estado alcanzado tras la última transición del buffer
+
+        Returns:
+            Valor de bootstrap
+        """
+        pass
+
+    def _n_step_target(self, next_state: int) -> float:
+        """
+        Calcula el objetivo de n pasos para la transición más antigua del buffer
+
+        Args:
+            next_state: Estado alcanzado tras la última transición del buffer
+
+        Returns:
+            Objetivo de la actualización
+        """
+        return self.partial_return + self.gamma_powers[self.n] * self._bootstrap_value(next_state)
+
+    def _terminal_targets(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Calcula los objetivos de todas las transiciones pendientes cuando el
+        episodio ha terminado (no hay bootstrap tras el estado terminal)
+
+        Args:
+            indices: Posiciones en el buffer, de la más antigua a la más reciente
+
+        Returns:
+            Array con el objetivo de cada transición
+        """
+        k = len(indices)
+        return self.discount_matrix[:k, :k] @ self.buffer_rewards[indices]
+
+    def _pop_oldest(self):
+        """
+        Elimina la transición más antigua del buffer y recalcula el retorno parcial
+        """
+        self.buffer_head = (self.buffer_head + 1) % self.n
+        self.buffer_size -= 1
+
+        # Se recalcula desde el buffer (n es pequeño): deshacer la suma
+        # dividiendo por γ multiplicaría el error de redondeo por 1/γ en cada paso
+        indices = (self.buffer_head + np.arange(self.buffer_size)) % self.n
+        self.partial_return = self.gamma_powers[:self.buffer_size] @ self.buffer_rewards[indices]
+
+    def _flush(self):
+        """
+        Actualiza de forma agrupada todas las transiciones pendientes al final del episodio.
+        Los objetivos se calculan con la tabla Q previa a la actualización.
+        """
+        if self.buffer_size == 0:
+            return
+
+        indices = (self.buffer_head + np.arange(self.buffer_size)) % self.n
+        states = self.buffer_states[indices]
+        actions = self.buffer_actions[indices]
+        targets = self._terminal_targets(indices)
+
+        # Actualización por lotes al estilo Jacobi: todos los errores de TD se
+        # calculan con la Q previa al vaciado y se suman con np.add.at. Si un
+        # par (s, a) aparece varias veces en el buffer, el resultado difiere
+        # de aplicar las actualizaciones de n pasos una tras otra (donde la
+        # segunda vería la Q ya modificada por la primera)
+        td_errors = targets - self.Q[states, actions]
+        self._update_q_batch(states, actions, self.alpha * td_errors)
+
+        self._reset_buffer()
+
+    def _reset_buffer(self):
+        """Vacía el buffer circular"""
+        self.buffer_head = 0
+        self.buffer_size = 0
+        self.partial_return = 0.0
+
+    def update(self, state: Any, action: int, next_state: Any, reward: float,
+               done: bool, info: Dict = None) -> None:
+        """
+        Guarda la transición en el buffer y, cuando hay n transiciones,
+        actualiza la más antigua con el objetivo de n pasos
+
+        Args:
+            state: Estado actual
+            action: Acción tomada
+            next_state: Estado siguiente
+            reward: Recompensa recibida
+            done: Indicador de fin de episodio
+            info: Información adicional
+        """
+        # Inserta la transición en la posición libre del buffer circular
+        tail = (self.buffer_head + self.buffer_size) % self.n
+        self.buffer_states[tail] = state
+        self.buffer_actions[tail] = action
+        self.buffer_rewards[tail] = reward
+        self.partial_return += self.gamma_powers[self.buffer_size] * reward
+        self.buffer_size += 1
+
+        if done:
+            self._flush()
+            return
+
+        if self.buffer_size == self.n:
+            s, a = self.buffer_states[self.buffer_head], self.buffer_actions[self.buffer_head]
+            target = self._n_step_target(next_state)
+            self._update_q(s, a, self.alpha * (target - self.Q[s, a]))
+            self._pop_oldest()
+
+    def start_episode(self):
+        """
+        Prepara el agente para un nuevo episodio
+        """
+        super().start_episode()
+        self._reset_buffer()
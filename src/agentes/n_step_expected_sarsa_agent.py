@@ -0,0 +1,40 @@
+"""
+Module: agentes/n_step_expected_sarsa_agent.py
+Description: Implementación del algoritmo Expected SARSA de n pasos.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from agentes.n_step_agent import NStepAgent
+import numpy as np
+
+class NStepExpectedSARSAAgent(NStepAgent):
+    """
+    Agente Expected SARSA de n pasos.
+
+    Actualiza la función Q con el objetivo:
+
+        G = R_{τ+1} + ... + γ^{n-1} R_{τ+n} + γ^n Σ_a π(a|S_{τ+n}) Q(S_{τ+n}, a)
+
+    Usar el valor esperado en lugar de una acción muestreada reduce la varianza.
+    """
+
+    def _bootstrap_value(self, next_state: int) -> float:
+        """
+        Valor esperado de Q en el estado S_{τ+n} según la política del agente
+
+        Args:
+            next_state: Estado alcanzado tras la última transición del buffer
+
+        Returns:
+            Valor de bootstrap
+        """
+        pi = self.policy.get_action_probabilities(next_state, self.Q)
+        return np.dot(pi, self.Q[next_state])
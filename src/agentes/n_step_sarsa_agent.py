@@ -0,0 +1,39 @@
+"""
+Module: agentes/n_step_sarsa_agent.py
+Description: Implementación del algoritmo SARSA de n pasos.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from agentes.n_step_agent import NStepAgent
+
+class NStepSARSAAgent(NStepAgent):
+    """
+    Agente SARSA de n pasos.
+
+    Actualiza la función Q con el objetivo:
+
+        G = R_{τ+1} + ... + γ^{n-1} R_{τ+n} + γ^n Q(S_{τ+n}, A_{τ+n})
+
+    donde A_{τ+n} se selecciona siguiendo la política del agente.
+    """
+
+    def _bootstrap_value(self, next_state: int) -> float:
+        """
+        Valor Q de la acción seleccionada por la política en el estado S_{τ+n}
+
+        Args:
+            next_state: Estado alcanzado tras la última transición del buffer
+
+        Returns:
+            Valor de bootstrap
+        """
+        next_action = self.policy.select_action(next_state, self.Q)
+        return self.Q[next_state, next_action]
@@ -0,0 +1,114 @@
+"""
+Module: agentes/n_step_tree_backup_agent.py
+Description: Implementación del algoritmo Tree Backup de n pasos.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from agentes.n_step_agent import NStepAgent
+import numpy as np
+
+class NStepTreeBackupAgent(NStepAgent):
+    """
+    Agente Tree Backup de n pasos (off-policy sin importance sampling).
+
+    El objetivo se construye hacia atrás desde la última transición:
+
+        G_k = R_{k+1} + γ [Σ_{a≠A_{k+1}} π(a|S_{k+1}) Q(S_{k+1}, a) + π(A_{k+1}|S_{k+1}) G_{k+1}]
+
+    Por defecto la política objetivo π es greedy respecto a Q.
+    """
+
+    def _init_algorithm_params(self, **kwargs):
+        """
+        Inicializa los parámetros específicos para Tree Backup
+
+        Args:
+            **kwargs: Parámetros adicionales, entre ellos:
+                - target_policy: política objetivo (greedy si no se indica)
+        """
+        super()._init_algorithm_params(**kwargs)
+        self.target_policy = kwargs.get('target_policy', None)
+
+    def _target_probabilities(self, state: int) -> np.ndarray:
+        """
+        Probabilidades de la política objetivo en un estado
+
+        Args:
+            state: Estado
+
+        Returns:
+            Array con probabilidades para cada acción
+        """
+        if self.target_policy is not None:
+            return self.target_policy.get_action_probabilities(state, self.Q)
+        pi = np.zeros(self.n_actions)
+        pi[np.argmax(self.Q[state])] = 1.0
+        return pi
+
+    def _bootstrap_value(self, next_state: int) -> float:
+        """
+        Valor esperado de S_{τ+n} bajo la política objetivo
+
+        Args:
+            next_state: Estado alcanzado tras la última transición del buffer
+
+        Returns:
+            Σ_a π(a|s) Q(s, a)
+        """
+        return np.dot(self._target_probabilities(next_state), self.Q[next_state])
+
+    def _backup(self, indices: np.ndarray, last_target: float) -> np.ndarray:
+        """
+        Recorre el buffer hacia atrás calculando el objetivo de cada transición
+
+        Args:
+            indices: Posiciones en el buffer, de la más antigua a la más reciente
+            last_target: Objetivo de la transición más reciente
+
+        Returns:
+            Array con el objetivo de cada transición
+        """
+        targets = np.empty(len(indices))
+        targets[-1] = last_target
+        for k in range(len(indices) - 2, -1, -1):
+            next_state = self.buffer_states[indices[k + 1]]
+            next_action = self.buffer_actions[indices[k + 1]]
+            pi = self._target_probabilities(next_state)
+            q_next = self.Q[next_state]
+            expected = np.dot(pi, q_next) - pi[next_action] * q_next[next_action]
+            targets[k] = self.buffer_rewards[indices[k]] + self.gamma * (expected + pi[next_action] * targets[k + 1])
+        return targets
+
+    def _n_step_target(self, next_state: int) -> float:
+        """
+        Calcula el objetivo Tree Backup para la transición más antigua del buffer
+
+        Args:
+            next_state: Estado alcanzado tras la última transición del buffer
+
+        Returns:
+            Objetivo de la actualización
+        """
+        indices = (self.buffer_head + np.arange(self.buffer_size)) % self.n
+        last_target = self.buffer_rewards[indices[-1]] + self.gamma * self._bootstrap_value(next_state)
+        return self._backup(indices, last_target)[0]
+
+    def _terminal_targets(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Calcula los objetivos Tree Backup de las transiciones pendientes al final del episodio
+
+        Args:
+            indices: Posiciones en el buffer, de la más antigua a la más reciente
+
+        Returns:
+            Array con el objetivo de cada transición
+        """
+        return self._backup(indices, self.buffer_rewards[indices[-1]])
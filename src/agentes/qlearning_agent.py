@@ -64,7 +64,7 @@ class QLearningAgent(TabularAgent):
             target = reward + self.gamma * max_next_q
         
         # Actualiza el valor Q usando la tasa de aprendizaje (alpha)
-        self.Q[state, action] += self.alpha * (target - current_q)
+        self._update_q(state, action, self.alpha * (target - current_q))
     
     def decay_learning_rate(self):
         """
@@ -0,0 +1,215 @@
+"""
+Module: agentes/replay_buffer.py
+Description: Replay buffer circular que guarda cada observación una sola vez.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import Any, Dict, Sequence
+import numpy as np
+
+OBS_DTYPES = ('float32', 'float16', 'uint8')
+
+
+class ReplayBuffer:
+    """
+    Replay buffer circular con observaciones deduplicadas.
+
+    En lugar de guardar (s, a, r, s', done) con dos copias de cada
+    observación, la posición i guarda la observación s_i junto con a_i, r_i
+    y done_i, y s' se reconstruye como la observación de la posición i + 1:
+
+        obs:   s_0  s_1  s_2  s_3(s')  s_0'  s_1' ...
+        valid:  1    1    1     0       1     1
+
+    Tras cada transición no terminal se escribe s' en la posición siguiente
+    como marcador no muestreable. Si la siguiente transición continúa el
+    episodio (su estado coincide con ese s') el marcador pasa a ser su
+    posición; si no (episodio cortado sin done), el marcador se conserva como
+    s' de la transición anterior y el nuevo estado va en la posición
+    siguiente. En transiciones terminales s' no se guarda, porque el
+    objetivo no hace bootstrap. Así se guarda una observación por paso más,
+    como mucho, una por episodio truncado.
+
+    Con n_step > 1 los objetivos de n pasos se calculan al muestrear, de
+    forma vectorizada: para cada transición se acumulan hasta n recompensas
+    descontadas mientras el episodio continúa y se devuelve la observación
+    de bootstrap junto con γ^k, siendo k los pasos realmente usados (menos
+    de n si el episodio termina o se corta antes). El aprendiz solo tiene
+    que calcular r + γ^k * max_a Q(s_k, a) * (1 - done).
+
+    Las observaciones pueden almacenarse comprimidas:
+        - 'float16': mitad de memoria que float32
+        - 'uint8': observaciones que ya son uint8 (imágenes) se guardan tal
+          cual; las continuas se cuantizan linealmente entre obs_low y obs_high
+    """
+
+    def __init__(self, capacity: int, obs_shape: Sequence[int], obs_dtype: str = 'float32',
+                 obs_low: Any = None, obs_high: Any = None, n_step: int = 1, gamma: float = 0.99):
+        """
+        Args:
+            capacity: Número máximo de posiciones (transiciones y marcadores)
+            obs_shape: Forma de una observación
+            obs_dtype: Tipo de almacenamiento de las observaciones ('float32', 'float16' o 'uint8')
+            obs_low: Límite inferior para cuantizar a uint8 observaciones continuas
+            obs_high: Límite superior para cuantizar a uint8 observaciones continuas
+            n_step: Número de pasos de los objetivos
+            gamma: Factor de descuento para los retornos de n pasos
+        """
+        if obs_dtype not in OBS_DTYPES:
+            raise ValueError(f"obs_dtype debe ser uno de {OBS_DTYPES}")
+        if n_step < 1:
+            raise ValueError("n_step debe ser mayor o igual que 1")
+        self.capacity = capacity
+        self.n_step = n_step
+        self.gamma = gamma
+        # γ^0, ..., γ^n
+        self.gamma_powers = (gamma ** np.arange(n_step + 1)).astype(np.float32)
+        self.obs_shape = tuple(obs_shape)
+        self.obs_dtype = obs_dtype
+
+        # Cuantización lineal a uint8 (si no hay límites se guardan los valores tal cual)
+        self.quantize = obs_dtype == 'uint8' and obs_low is not None and obs_high is not None
+        if self.quantize:
+            self.obs_low = np.asarray(obs_low, dtype=np.float32)
+            self.obs_scale = (np.asarray(obs_high, dtype=np.float32) - self.obs_low) / 255.0
+
+        self.observations = np.zeros((capacity,) + self.obs_shape, dtype=np.dtype(obs_dtype))
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.dones = np.zeros(capacity, dtype=bool)
+        self.valid = np.zeros(capacity, dtype=bool)
+
+        self.cursor = 0
+        self.num_valid = 0
+        # Posiciones escritas alguna vez (se muestrea solo entre ellas)
+        self.filled = 0
+        # True si en self.cursor hay un s' pendiente de la última transición
+        self.continuing = False
+
+    def _encode(self, observation: Any) -> np.ndarray:
+        """Convierte una observación al tipo de almacenamiento"""
+        observation = np.asarray(observation)
+        if self.quantize:
+            scaled = np.rint((observation - self.obs_low) / self.obs_scale)
+            return np.clip(scaled, 0, 255).astype(np.uint8)
+        return observation.astype(self.observations.dtype, copy=False)
+
+    def _decode(self, observations: np.ndarray) -> np.ndarray:
+        """Convierte observaciones almacenadas a float32"""
+        if self.quantize:
+            return observations.astype(np.float32) * self.obs_scale + self.obs_low
+        return observations.astype(np.float32)
+
+    def _write_slot(self, index: int, observation: np.ndarray, valid: bool):
+        """Escribe una observación en una posición, actualizando el recuento de válidas"""
+        self.num_valid += int(valid) - int(self.valid[index])
+        self.valid[index] = valid
+        self.observations[index] = observation
+        self.filled = max(self.filled, index + 1)
+
+    def add(self, state: Any, action: int, reward: float, next_state: Any, done: bool):
+        """
+        Añade una transición
+
+        Args:
+            state: Estado
+            action: Acción
+            reward: Recompensa
+            next_state: Estado siguiente
+            done: Indicador de fin de episodio
+        """
+        encoded = self._encode(state)
+        if self.continuing and np.array_equal(self.observations[self.cursor], encoded):
+            # El estado es el s' de la transición anterior, ya guardado
+            slot = self.cursor
+        else:
+            if self.continuing:
+                # Episodio cortado sin done: se conserva el marcador con el s' anterior
+                self.cursor = (self.cursor + 1) % self.capacity
+            slot = self.cursor
+
+        self._write_slot(slot, encoded, True)
+        self.actions[slot] = action
+        self.rewards[slot] = reward
+        self.dones[slot] = done
+
+        self.cursor = (slot + 1) % self.capacity
+        self.continuing = not done
+        if self.continuing:
+            self._write_slot(self.cursor, self._encode(next_state), False)
+
+    def __len__(self) -> int:
+        """Número de transiciones muestreables"""
+        return self.num_valid
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupada por los arrays del buffer"""
+        return sum(array.nbytes for array in (self.observations, self.actions, self.rewards,
+                                              self.dones, self.valid))
+
+    def sample_indices(self, batch_size: int) -> np.ndarray:
+        """
+        Posiciones aleatorias (con reemplazo) de transiciones válidas
+
+        Args:
+            batch_size: Número de transiciones
+
+        Returns:
+            Array de posiciones
+        """
+        if self.num_valid == 0:
+            raise ValueError("El replay buffer está vacío")
+        # Los marcadores son como mucho uno por episodio: el rechazo es barato
+        indices = np.random.randint(0, self.filled, size=batch_size)
+        rejected = ~self.valid[indices]
+        while rejected.any():
+            indices[rejected] = np.random.randint(0, self.filled, size=int(rejected.sum()))
+            rejected = ~self.valid[indices]
+        return indices
+
+    def sample(self, batch_size: int) -> Dict[str, np.ndarray]:
+        """
+        Muestrea un lote de transiciones con sus objetivos de n pasos
+
+        Args:
+            batch_size: Número de transiciones
+
+        Returns:
+            Diccionario con states, actions, rewards (retorno descontado de
+            hasta n pasos), next_states (observación de bootstrap), dones
+            (si el último paso usado es terminal) y discounts (γ^k);
+            observaciones en float32
+        """
+        indices = self.sample_indices(batch_size)
+
+        # Posiciones de los n pasos siguientes a cada transición: (batch, n)
+        steps = (indices[:, None] + np.arange(self.n_step)) % self.capacity
+        dones = self.dones[steps]
+        continues = ~dones & self.valid[(steps + 1) % self.capacity]
+
+        # El paso k se usa si todos los anteriores continúan el episodio
+        used = np.ones(steps.shape, dtype=bool)
+        used[:, 1:] = np.cumprod(continues[:, :-1], axis=1, dtype=bool)
+        num_steps = used.sum(axis=1)
+
+        returns = (self.rewards[steps] * self.gamma_powers[:self.n_step] * used).sum(axis=1)
+        last = steps[np.arange(batch_size), num_steps - 1]
+        bootstrap = (last + 1) % self.capacity
+
+        return {
+            'states': self._decode(self.observations[indices]),
+            'actions': self.actions[indices],
+            'rewards': returns.astype(np.float32),
+            'next_states': self._decode(self.observations[bootstrap]),
+            'dones': self.dones[last],
+            'discounts': self.gamma_powers[num_steps],
+        }
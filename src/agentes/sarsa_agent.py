@@ -65,4 +65,4 @@ class SARSAAgent(TabularAgent):
         td_error = td_target - self.Q[state, action]
         
         # Actualiza la función Q de manera incremental
-        self.Q[state, action] += self.alpha * td_error
\ No newline at end of file
+        self._update_q(state, action, self.alpha * td_error)
\ No newline at end of file
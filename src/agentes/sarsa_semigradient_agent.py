@@ -13,9 +13,11 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
 from agentes.agent import Agent
+from agentes.evaluation import NetworkGreedySnapshot
 import torch.nn as nn
 import torch.optim as optim
 import torch
+import numpy as np
 
 class DQNNetwork(nn.Module):
     def __init__(self, input_dim, output_dim, hidden_dim=64):
@@ -35,9 +37,12 @@ class SARSASemiGradientAgent(Agent):
     """
     Agente basado en SARSA semi-gradiente para aproximar la función Q mediante una red neuronal.
     Actualiza la red de forma on-policy utilizando la política epsilon-greedy.
+    Con expected=True usa el objetivo de Expected SARSA (valor esperado de
+    Q(s', ·) según la política) en lugar de muestrear a'.
     """
     def _init_algorithm_params(self, **kwargs):
         self.lr = kwargs.get('lr', 0.001)
+        self.expected = kwargs.get('expected', False)
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.input_dim = self.observation_space.shape[0]
         self.n_actions = self.action_space.n
@@ -58,36 +63,81 @@ class SARSASemiGradientAgent(Agent):
             state_tensor = torch.tensor(state, dtype=torch.float32).unsqueeze(0).to(self.device)
             q_values = self.q_network(state_tensor)
         return q_values.cpu().numpy()[0]
+
+    def get_action_values_batch(self, states):
+        """
+        Valores Q de un lote de estados con un único forward de la red Q.
+        """
+        self.q_network.eval()
+        with torch.no_grad():
+            states_tensor = torch.as_tensor(np.asarray(states), dtype=torch.float32).to(self.device)
+            q_values = self.q_network(states_tensor)
+        return q_values.cpu().numpy()
+
+    def get_greedy_actions(self, states):
+        """
+        Acciones greedy de un lote de estados con un único forward de la red Q.
+        """
+        self.q_network.eval()
+        with torch.no_grad():
+            states_tensor = torch.as_tensor(np.asarray(states), dtype=torch.float32).to(self.device)
+            q_values = self.q_network(states_tensor)
+        return q_values.argmax(dim=1).cpu().numpy()
+
+    def greedy_snapshot(self):
+        """
+        Copia congelada (en CPU) de la red Q para evaluación en segundo plano.
+        """
+        return NetworkGreedySnapshot(self.q_network)
     
+    def _optimize(self, loss):
+        """
+        Retropropaga la pérdida y aplica un paso del optimizador
+        """
+        self.optimizer.zero_grad()
+        loss.backward()
+        self.optimizer.step()
+
+    def _instrument(self, timer):
+        """
+        Además de las fases comunes, mide el forward de la red y el
+        backward con el paso del optimizador.
+        """
+        super()._instrument(timer)
+        undo = self._instrumentation_undo
+        undo.append(timer.wrap_module(self.q_network, 'forward'))
+        undo.append(timer.wrap_method(self, '_optimize', 'backward'))
+
     def update(self, state, action, next_state, reward, done, info=None):
         """
         Actualiza la red Q usando la regla de SARSA semi-gradiente:
         
             Q(s,a) ← Q(s,a) + lr * [r + γ * Q(s',a';θ) - Q(s,a;θ)]
             
-        donde a' se selecciona utilizando la política epsilon-greedy.
+        donde a' se selecciona utilizando la política epsilon-greedy. Con
+        expected=True, Q(s',a';θ) se sustituye por Σ_a' π(a'|s') Q(s',a';θ).
         """
-        self.q_network.train()
-        
-        # Convertir estados a tensores
+        # Convertir el estado a tensor
         state_tensor = torch.tensor(state, dtype=torch.float32).unsqueeze(0).to(self.device)
-        next_state_tensor = torch.tensor(next_state, dtype=torch.float32).unsqueeze(0).to(self.device)
         
-        # Valor Q para el estado actual
-        q_values = self.q_network(state_tensor)
-        current_q = q_values[0, action]
-        
-        # Calcular el target
+        # Calcular el target (un único forward sin gradiente sobre s')
         if done:
-            target = torch.tensor(reward, dtype=torch.float32).to(self.device)
+            target = float(reward)
         else:
-            # Seleccionar la siguiente acción con la política (epsilon-greedy)
             next_q_values = self.get_action_values(next_state)
-            next_action = self.policy.select_action(next_state, next_q_values)
-            self.q_network.eval()
-            with torch.no_grad():
-                q_next = self.q_network(next_state_tensor)[0, next_action]
-            target = torch.tensor(reward, dtype=torch.float32).to(self.device) + self.gamma * q_next
+            if self.expected:
+                pi = self.policy.get_action_probabilities(next_state, next_q_values)
+                q_next = np.dot(pi, next_q_values)
+            else:
+                # Seleccionar la siguiente acción con la política (epsilon-greedy)
+                next_action = self.policy.select_action(next_state, next_q_values)
+                q_next = next_q_values[next_action]
+            target = float(reward + self.gamma * q_next)
+        
+        # Valor Q para el estado actual
+        self.q_network.train()
+        q_values = self.q_network(state_tensor)
+        current_q = q_values[0, action]
         
         # Calcular el error TD
         td_error = target - current_q
@@ -96,6 +146,4 @@ class SARSASemiGradientAgent(Agent):
         loss = td_error.pow(2)
         
         # Actualizar la red mediante gradiente descendiente
-        self.optimizer.zero_grad()
-        loss.backward()
-        self.optimizer.step()
\ No newline at end of file
+        self._optimize(loss)
\ No newline at end of file
@@ -13,6 +13,7 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
 from agentes.agent import Agent
+from agentes.evaluation import TabularGreedySnapshot
 import numpy as np
 import gymnasium as gym
 
@@ -40,8 +41,160 @@ class TabularAgent(Agent):
         else:
             # Inicialización a cero o valor específico
             self.Q = np.zeros((self.n_states, self.n_actions))
+
+        # Seguimiento de la convergencia (diagnóstico opcional: añade trabajo a
+        # cada actualización de Q)
+        self.track_convergence = kwargs.get('track_convergence', False)
+        self.convergence_tol = kwargs.get('convergence_tol', 1e-4)
+        self.convergence_patience = kwargs.get('convergence_patience', 100)
+        self.greedy_actions = np.argmax(self.Q, axis=1)
+        self.max_delta_history = []
+        self.mean_delta_history = []
+        self.policy_changes_history = []
+        self.quiet_episodes = 0
+        self.max_delta_seen = 0.0
+        self.converged_episode = None
+        self._reset_episode_deltas()
+
+    def set_q_table(self, Q: np.ndarray):
+        """
+        Sustituye la tabla Q (por ejemplo por una vista de memoria compartida)
+        y recalcula la acción greedy de cada estado que usa el seguimiento de
+        la convergencia
+
+        Args:
+            Q: Nueva tabla Q con forma (n_states, n_actions)
+        """
+        self.Q = Q
+        self.greedy_actions = np.argmax(self.Q, axis=1)
+
+    def _reset_episode_deltas(self):
+        """Reinicia los acumuladores de |ΔQ| del episodio actual"""
+        self.episode_max_delta = 0.0
+        self.episode_sum_delta = 0.0
+        self.episode_updates = 0
+        self.episode_policy_changes = 0
+
+    def _update_q(self, state: int, action: int, delta: float):
+        """
+        Aplica Q(s, a) += delta y actualiza de forma incremental las
+        estadísticas de convergencia (|ΔQ| y cambios de la acción greedy)
         
-    
+        Args:
+            state: Estado
+            action: Acción
+            delta: Incremento a aplicar
+        """
+        self.Q[state, action] += delta
+        if not self.track_convergence:
+            return
+
+        magnitude = abs(delta)
+        if magnitude > self.episode_max_delta:
+            self.episode_max_delta = magnitude
+        self.episode_sum_delta += magnitude
+        self.episode_updates += 1
+
+        # Solo cambia la acción greedy si baja la mejor o si otra la supera
+        best = self.greedy_actions[state]
+        q_row = self.Q[state]
+        if action == best:
+            if delta < 0:
+                new_best = np.argmax(q_row)
+                if new_best != best:
+                    self.greedy_actions[state] = new_best
+                    self.episode_policy_changes += 1
+        elif q_row[action] > q_row[best] or (q_row[action] == q_row[best] and action < best):
+            self.greedy_actions[state] = action
+            self.episode_policy_changes += 1
+
+    def _update_q_batch(self, states: np.ndarray, actions: np.ndarray, deltas: np.ndarray):
+        """
+        Versión vectorizada de _update_q; acumula correctamente los pares repetidos
+        
+        Args:
+            states: Array de estados
+            actions: Array de acciones
+            deltas: Array de incrementos
+        """
+        np.add.at(self.Q, (states, actions), deltas)
+        if not self.track_convergence or len(deltas) == 0:
+            return
+
+        magnitudes = np.abs(deltas)
+        self.episode_max_delta = max(self.episode_max_delta, float(magnitudes.max()))
+        self.episode_sum_delta += float(magnitudes.sum())
+        self.episode_updates += len(deltas)
+
+        rows = np.unique(states)
+        new_best = np.argmax(self.Q[rows], axis=1)
+        self.episode_policy_changes += int(np.count_nonzero(new_best != self.greedy_actions[rows]))
+        self.greedy_actions[rows] = new_best
+
+    def start_episode(self):
+        """
+        Prepara el agente para un nuevo episodio
+        """
+        super().start_episode()
+        self._reset_episode_deltas()
+
+    def end_episode(self, episode_reward: float, steps: float):
+        """
+        Finaliza el episodio registrando sus estadísticas de convergencia
+        
+        Args:
+            episode_reward: Recompensa total del episodio
+            steps: Número de pasos del episodio
+        """
+        super().end_episode(episode_reward, steps)
+        if not self.track_convergence:
+            return
+
+        self.max_delta_history.append(self.episode_max_delta)
+        self.mean_delta_history.append(self.episode_sum_delta / self.episode_updates if self.episode_updates else 0.0)
+        self.policy_changes_history.append(self.episode_policy_changes)
+
+        # Episodios seguidos sin cambios apreciables en Q ni en la política greedy.
+        # Solo se cuentan una vez que Q ha cambiado alguna vez: con recompensas
+        # escasas los primeros episodios no modifican Q y no indican convergencia.
+        if self.episode_max_delta < self.convergence_tol and self.episode_policy_changes == 0:
+            if self.max_delta_seen >= self.convergence_tol:
+                self.quiet_episodes += 1
+        else:
+            self.quiet_episodes = 0
+        self.max_delta_seen = max(self.max_delta_seen, self.episode_max_delta)
+
+        if self.converged_episode is None and self.quiet_episodes >= self.convergence_patience:
+            self.converged_episode = self.episode_count
+
+    def has_converged(self) -> bool:
+        """
+        Criterio de parada: en los últimos convergence_patience episodios
+        ningún |ΔQ| ha superado convergence_tol y la política greedy no ha cambiado.
+        Con recompensas escasas conviene una paciencia amplia: un episodio sin
+        éxito tampoco cambia Q.
+        
+        Returns:
+            True si el agente ha convergido
+        """
+        return self.quiet_episodes >= self.convergence_patience
+
+    def stats(self):
+        """
+        Devuelve estadísticas sobre el proceso de aprendizaje, incluidas las de convergencia
+        
+        Returns:
+            Diccionario con estadísticas
+        """
+        stats = super().stats()
+        if self.track_convergence:
+            stats["max_delta_q"] = self.max_delta_history
+            stats["mean_delta_q"] = self.mean_delta_history
+            stats["policy_changes"] = self.policy_changes_history
+            stats["converged"] = self.has_converged()
+            stats["converged_episode"] = self.converged_episode
+        return stats
+
     def get_action_values(self, state = None):
         """
         Devuelve la tabla Q
@@ -49,4 +202,34 @@ class TabularAgent(Agent):
         Returns:
             Tabla Q
         """
-        return self.Q
\ No newline at end of file
+        return self.Q
+
+    def get_action_values_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Filas de Q de un lote de estados
+        
+        Args:
+            states: Array de índices de estado
+            
+        Returns:
+            Array (batch, n_actions)
+        """
+        return self.Q[np.asarray(states, dtype=np.int64)]
+
+    def get_greedy_actions(self, states: np.ndarray) -> np.ndarray:
+        """
+        Acciones greedy de un lote de estados mediante una única lectura de filas de Q
+        
+        Args:
+            states: Array de índices de estado
+            
+        Returns:
+            Array con la acción greedy de cada estado
+        """
+        return np.argmax(self.Q[np.asarray(states, dtype=np.int64)], axis=1)
+
+    def greedy_snapshot(self):
+        """
+        Copia congelada de la tabla Q para evaluación en segundo plano
+        """
+        return TabularGreedySnapshot(self.Q)
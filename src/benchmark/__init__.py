@@ -0,0 +1,22 @@
+"""
+Module: benchmark/__init__.py
+Description: Contiene las importaciones y modulos/clases públicas del paquete benchmark.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+# Importación de módulos o clases
+from .suite import AGENTS, ENVIRONMENTS, run_case, run_suite, save_results, load_results, compare_results
+from .import_time import measure_import, run_import_benchmark, check_tabular_startup
+from .autotune import run_autotune, run_trial
+from .async_scaling import run_async_case, run_async_benchmark, check_async_scaling
+
+# Lista de módulos o clases públicas
+__all__ = ['AGENTS', 'ENVIRONMENTS', 'run_case', 'run_suite', 'save_results', 'load_results', 'compare_results', 'measure_import', 'run_import_benchmark', 'check_tabular_startup', 'run_autotune', 'run_trial', 'run_async_case', 'run_async_benchmark', 'check_async_scaling']
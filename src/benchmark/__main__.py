@@ -0,0 +1,119 @@
+"""
+Module: benchmark/__main__.py
+Description: Punto de entrada de línea de comandos de la suite de benchmarks.
+
+Uso (desde src/):
+    python -m benchmark run --output resultados.json
+    python -m benchmark compare referencia.json resultados.json
+    python -m benchmark imports
+    python -m benchmark autotune
+    python -m benchmark async
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import argparse
+import sys
+
+from benchmark.suite import AGENTS, ENVIRONMENTS, run_suite, save_results, load_results, compare_results
+from benchmark.import_time import IMPORT_SCENARIOS, run_import_benchmark
+from benchmark.autotune import run_autotune
+from benchmark.async_scaling import run_async_benchmark, check_async_scaling
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='benchmark', description='Benchmarks de agentes y entornos')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Ejecuta la suite y guarda los resultados en JSON')
+    run_parser.add_argument('--output', default='benchmark_results.json', help='Fichero de salida')
+    run_parser.add_argument('--agents', nargs='+', choices=list(AGENTS), help='Agentes a evaluar')
+    run_parser.add_argument('--envs', nargs='+', choices=list(ENVIRONMENTS), help='Entornos a evaluar')
+    run_parser.add_argument('--seeds', nargs='+', type=int, default=[0], help='Semillas')
+    run_parser.add_argument('--episodes', type=int, default=None, help='Episodios por caso')
+    run_parser.add_argument('--no-isolate', action='store_true', help='Ejecuta todos los casos en este proceso')
+
+    compare_parser = subparsers.add_parser('compare', help='Compara dos ficheros de resultados')
+    compare_parser.add_argument('baseline', help='Resultados de referencia')
+    compare_parser.add_argument('current', help='Resultados actuales')
+    compare_parser.add_argument('--tolerance', type=float, default=0.1, help='Tolerancia relativa')
+
+    imports_parser = subparsers.add_parser('imports', help='Mide el tiempo de importación de los paquetes')
+    imports_parser.add_argument('--scenarios', nargs='+', choices=list(IMPORT_SCENARIOS), help='Escenarios')
+    imports_parser.add_argument('--repeats', type=int, default=3, help='Repeticiones por escenario')
+    imports_parser.add_argument('--output', default=None, help='Fichero JSON de salida')
+
+    autotune_parser = subparsers.add_parser('autotune', help='Ajusta DeepQAgent a esta máquina y guarda el perfil')
+    autotune_parser.add_argument('--env', default='CartPole-v1', help='Entorno de las pruebas')
+    autotune_parser.add_argument('--batch-sizes', nargs='+', type=int, default=[16, 32, 64, 128],
+                                 help='Tamaños de batch')
+    autotune_parser.add_argument('--threads', nargs='+', type=int, default=None, help='Hilos intra-op de torch')
+    autotune_parser.add_argument('--interop-threads', nargs='+', type=int, default=[1, 2],
+                                 help='Hilos inter-op de torch')
+    autotune_parser.add_argument('--samples-per-step', type=int, default=32,
+                                 help='Muestras del replay por paso del entorno (batch_size * updates_per_step)')
+    autotune_parser.add_argument('--steps', type=int, default=2000, help='Pasos medidos por prueba')
+    autotune_parser.add_argument('--repeats', type=int, default=1, help='Repeticiones por prueba')
+    autotune_parser.add_argument('--output', default=None, help='Fichero del perfil (por defecto el que carga DeepQAgent con autotune_profile=True)')
+
+    async_parser = subparsers.add_parser('async', help='Comprueba que train_async escala con el número de entornos')
+    async_parser.add_argument('--envs', nargs='+', type=int, default=[1, 8, 32], help='Números de entornos')
+    async_parser.add_argument('--latency', type=float, default=0.002, help='Latencia simulada por llamada (s)')
+    async_parser.add_argument('--episodes', type=int, default=128, help='Episodios por caso')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run_suite(args.agents, args.envs, args.seeds, args.episodes,
+                            isolate=not args.no_isolate, verbose=True)
+        save_results(results, args.output)
+        print(f"Resultados guardados en {args.output}")
+        return 0
+
+    if args.command == 'imports':
+        results = run_import_benchmark(args.scenarios, args.repeats)
+        for name, result in results.items():
+            print(f"{name:<10} {result['seconds'] * 1000:>8.1f} ms  rss={result['peak_rss_mb']:.0f}MB  "
+                  f"cargados={result['loaded']}")
+        if args.output:
+            save_results(results, args.output)
+        # El arranque tabular no debe cargar torch ni matplotlib
+        return 1 if results.get('tabular', {}).get('loaded') else 0
+
+    if args.command == 'autotune':
+        from agentes.dqn_profile import save_profile
+        profile = run_autotune(args.env, args.batch_sizes, args.threads, args.interop_threads,
+                               args.samples_per_step, args.steps, repeats=args.repeats, verbose=True)
+        path = save_profile(profile, args.output)
+        speedup = f" ({profile['speedup']:.2f}x frente a la configuración por defecto)" if profile['speedup'] else ''
+        print(f"Mejor configuración: {profile['config']}  {profile['steps_per_sec']:.0f} pasos/s{speedup}")
+        print(f"Perfil guardado en {path} (se usa con DeepQAgent(..., autotune_profile=True))")
+        return 0
+
+    if args.command == 'async':
+        results = run_async_benchmark(args.envs, args.latency, args.episodes)
+        for num_envs, result in results.items():
+            print(f"{num_envs:>4} entornos {result['steps_per_sec']:>10.0f} pasos/s  "
+                  f"lote medio={result['mean_batch_size']:.1f}")
+        problems = check_async_scaling(results)
+        for problem in problems:
+            print(problem)
+        return 1 if problems else 0
+
+    regressions = compare_results(load_results(args.baseline), load_results(args.current), args.tolerance)
+    for regression in regressions:
+        print(regression)
+    if not regressions:
+        print("Sin regresiones")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
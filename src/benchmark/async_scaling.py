@@ -0,0 +1,87 @@
+"""
+Module: benchmark/async_scaling.py
+Description: Comprueba que el entrenamiento asíncrono escala con el número de entornos en vuelo.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import Any, Dict, List, Sequence
+import gymnasium as gym
+
+
+def run_async_case(num_envs: int, env_id: str = 'FrozenLake-v1', env_kwargs: Dict = None,
+                   latency: float = 0.002, num_episodes: int = 128, seed: int = 0) -> Dict[str, Any]:
+    """
+    Entrena un QLearningAgent con train_async sobre num_envs entornos con latencia simulada
+
+    Args:
+        num_envs: Entornos en vuelo
+        env_id: Entorno de gymnasium envuelto en cada LatencyEnv
+        env_kwargs: Argumentos para gym.make
+        latency: Latencia por reset y step en segundos
+        num_episodes: Episodios en total (iguales para todos los casos)
+        seed: Semilla
+
+    Returns:
+        Resultados de train_async
+    """
+    from agentes import QLearningAgent, train_async
+    from entornos import LatencyEnv
+    from politicas import EpsilonGreedyPolicy
+
+    env_kwargs = env_kwargs if env_kwargs is not None else {'is_slippery': False}
+    envs = [LatencyEnv(gym.make(env_id, **env_kwargs), latency=latency, seed=seed + i) for i in range(num_envs)]
+    envs[0].action_space.seed(seed)
+    agent = QLearningAgent(envs[0].env, policy=EpsilonGreedyPolicy(envs[0].action_space, epsilon=0.3),
+                           alpha=0.2, gamma=0.99)
+    try:
+        return train_async(agent, envs, num_episodes, max_steps_per_episode=100, seed=seed)
+    finally:
+        for env in envs:
+            env.close()
+
+
+def run_async_benchmark(env_counts: Sequence[int] = (1, 8, 32), latency: float = 0.002,
+                        num_episodes: int = 128, seed: int = 0) -> Dict[str, Any]:
+    """
+    Mide los pasos por segundo de train_async con distintos números de
+    entornos. Con la E/S simulada por LatencyEnv, más entornos en vuelo
+    deben dar más pasos por segundo.
+
+    Args:
+        env_counts: Números de entornos a probar, de menor a mayor
+        latency: Latencia por llamada en segundos
+        num_episodes: Episodios por caso
+        seed: Semilla
+
+    Returns:
+        Diccionario número de entornos -> resultados de train_async
+    """
+    return {num_envs: run_async_case(num_envs, latency=latency, num_episodes=num_episodes, seed=seed)
+            for num_envs in sorted(env_counts)}
+
+
+def check_async_scaling(results: Dict[int, Dict[str, Any]]) -> List[str]:
+    """
+    Comprueba que los pasos por segundo crecen con el número de entornos
+
+    Args:
+        results: Resultados de run_async_benchmark
+
+    Returns:
+        Lista de problemas encontrados (vacía si escala)
+    """
+    problems = []
+    counts = sorted(results)
+    for fewer, more in zip(counts, counts[1:]):
+        if results[more]['steps_per_sec'] <= results[fewer]['steps_per_sec']:
+            problems.append(f"{more} entornos: {results[more]['steps_per_sec']:.0f} pasos/s, "
+                            f"no mejora a {fewer} entornos ({results[fewer]['steps_per_sec']:.0f} pasos/s)")
+    return problems
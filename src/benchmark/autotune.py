@@ -0,0 +1,180 @@
+"""
+Module: benchmark/autotune.py
+Description: Ajuste de batch_size, hilos de torch y pasos de gradiente por paso de DeepQAgent en la máquina actual.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Any, Dict, List, Sequence
+import multiprocessing as mp
+import datetime
+import os
+import gymnasium as gym
+import numpy as np
+
+
+# Valores por defecto de DeepQAgent, para medir la mejora del perfil
+DEFAULT_BATCH_SIZE = 32
+
+
+def default_thread_counts() -> List[int]:
+    """
+    Hilos intra-op a probar: potencias de 2 hasta el número de CPUs y el propio número de CPUs
+
+    Returns:
+        Lista ordenada de valores
+    """
+    cpus = os.cpu_count() or 1
+    return sorted({2 ** k for k in range(cpus.bit_length()) if 2 ** k <= cpus} | {cpus})
+
+
+def grid(batch_sizes: Sequence[int] = (16, 32, 64, 128), thread_counts: Sequence[int] = None,
+         interop_counts: Sequence[int] = (1, 2), samples_per_step: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, Any]]:
+    """
+    Configuraciones a probar.
+
+    Todas procesan el mismo número de muestras del replay por paso del
+    entorno (samples_per_step), así que updates_per_step se deriva del
+    batch: batch 16 hace 2 pasos de gradiente por paso, batch 128 uno cada 4.
+    De lo contrario la configuración más rápida sería siempre la que menos
+    aprende.
+
+    Args:
+        batch_sizes: Tamaños de batch
+        thread_counts: Hilos intra-op (por defecto default_thread_counts())
+        interop_counts: Hilos inter-op (se descartan los mayores que el número de CPUs)
+        samples_per_step: Muestras por paso del entorno (batch_size * updates_per_step)
+
+    Returns:
+        Lista de configuraciones
+    """
+    cpus = os.cpu_count() or 1
+    thread_counts = thread_counts or default_thread_counts()
+    interop_counts = sorted({n for n in interop_counts if n <= cpus}) or [1]
+    return [{'batch_size': batch_size,
+             'updates_per_step': samples_per_step / batch_size,
+             'num_threads': threads,
+             'num_interop_threads': interop}
+            for batch_size in batch_sizes
+            for threads in thread_counts
+            for interop in interop_counts]
+
+
+def run_trial(config: Dict[str, Any], env_id: str = 'CartPole-v1', steps: int = 2000,
+              warmup_steps: int = 500, seed: int = 0) -> Dict[str, Any]:
+    """
+    Entrena un DeepQAgent con una configuración y mide los pasos por segundo.
+
+    Debe ejecutarse en un proceso nuevo: los hilos inter-op de torch solo
+    pueden fijarse una vez por proceso.
+
+    Args:
+        config: Configuración (ver grid)
+        env_id: Entorno de gymnasium con observaciones vectoriales
+        steps: Pasos medidos
+        warmup_steps: Pasos previos sin medir (llenado del replay y arranque de los hilos)
+        seed: Semilla
+
+    Returns:
+        Configuración con los pasos por segundo y los pasos de gradiente medidos
+    """
+    # Los hilos se fijan antes de que torch haga ningún trabajo
+    from agentes.dqn_profile import apply_thread_settings
+    apply_thread_settings(config['num_threads'], config['num_interop_threads'])
+
+    import torch
+    from agentes import DeepQAgent
+    from politicas import EpsilonGreedyPolicy
+
+    torch.manual_seed(seed)
+    np.random.seed(seed)
+    env = gym.make(env_id)
+    env.action_space.seed(seed)
+    policy = EpsilonGreedyPolicy(env.action_space, epsilon=0.1, epsilon_decay=1.0)
+    agent = DeepQAgent(env, policy=policy, autotune_profile=False, **config)
+
+    state, _ = env.reset(seed=seed)
+    start = None
+    updates = 0
+    for step in range(warmup_steps + steps):
+        if step == warmup_steps:
+            updates = agent.update_counter
+            start = perf_counter()
+        action = agent.get_action(state)
+        next_state, reward, terminated, truncated, _ = env.step(action)
+        agent.update(state, action, next_state, reward, terminated)
+        state = next_state
+        if terminated or truncated:
+            state, _ = env.reset()
+    elapsed = perf_counter() - start
+    env.close()
+
+    return dict(config, steps_per_sec=steps / elapsed, updates=agent.update_counter - updates)
+
+
+def run_autotune(env_id: str = 'CartPole-v1', batch_sizes: Sequence[int] = (16, 32, 64, 128),
+                 thread_counts: Sequence[int] = None, interop_counts: Sequence[int] = (1, 2),
+                 samples_per_step: int = DEFAULT_BATCH_SIZE, steps: int = 2000, warmup_steps: int = 500,
+                 repeats: int = 1, seed: int = 0, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Prueba todas las configuraciones de grid, cada una en un proceso nuevo,
+    y elige la de más pasos del entorno por segundo
+
+    Args:
+        env_id: Entorno de gymnasium con observaciones vectoriales
+        batch_sizes: Ver grid
+        thread_counts: Ver grid
+        interop_counts: Ver grid
+        samples_per_step: Ver grid
+        steps: Pasos medidos por prueba
+        warmup_steps: Pasos sin medir por prueba
+        repeats: Repeticiones de cada prueba (se usa la mediana)
+        seed: Semilla
+        verbose: Si se muestra el progreso
+
+    Returns:
+        Perfil con la máquina, la configuración elegida y todas las pruebas,
+        listo para agentes.dqn_profile.save_profile
+    """
+    from agentes.dqn_profile import host_fingerprint
+
+    trials = []
+    for config in grid(batch_sizes, thread_counts, interop_counts, samples_per_step):
+        speeds = []
+        for _ in range(repeats):
+            with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context('spawn')) as executor:
+                result = executor.submit(run_trial, config, env_id, steps, warmup_steps, seed).result()
+            speeds.append(result['steps_per_sec'])
+        result['steps_per_sec'] = float(np.median(speeds))
+        trials.append(result)
+        if verbose:
+            print(f"batch={config['batch_size']:<4} updates/paso={config['updates_per_step']:<6.3g} "
+                  f"hilos={config['num_threads']:<3} inter-op={config['num_interop_threads']:<3} "
+                  f"{result['steps_per_sec']:>8.0f} pasos/s")
+
+    best = max(trials, key=lambda trial: trial['steps_per_sec'])
+    # Referencia: batch por defecto con todos los hilos (lo que usa torch sin perfil)
+    baseline = [trial for trial in trials if trial['batch_size'] == DEFAULT_BATCH_SIZE
+                and trial['num_threads'] == max(trial['num_threads'] for trial in trials)]
+    baseline_speed = max((trial['steps_per_sec'] for trial in baseline), default=None)
+
+    return {
+        'host': host_fingerprint(),
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'env_id': env_id,
+        'samples_per_step': samples_per_step,
+        'config': {name: best[name] for name in ('batch_size', 'updates_per_step',
+                                                 'num_threads', 'num_interop_threads')},
+        'steps_per_sec': best['steps_per_sec'],
+        'speedup': best['steps_per_sec'] / baseline_speed if baseline_speed else None,
+        'trials': trials,
+    }
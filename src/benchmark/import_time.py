@@ -0,0 +1,94 @@
+"""
+Module: benchmark/import_time.py
+Description: Mide el coste de importación de los paquetes y qué dependencias pesadas cargan.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import Any, Dict, List
+import subprocess
+import json
+import sys
+import os
+
+
+# Módulos cuya carga queremos detectar
+HEAVY_MODULES = ['torch', 'matplotlib', 'matplotlib.pyplot']
+
+# Escenarios de importación: nombre -> código a ejecutar en un intérprete limpio
+IMPORT_SCENARIOS = {
+    'tabular': "import agentes, politicas, plotting; agentes.QLearningAgent; politicas.EpsilonGreedyPolicy",
+    'neural': "import agentes; agentes.DeepQAgent",
+    'plotting': "import plotting; plotting.plot_episode_lengths",
+}
+
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+exec({code!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'seconds': elapsed,
+    'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'loaded': [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure_import(code: str, src_dir: str = None) -> Dict[str, Any]:
+    """
+    Ejecuta código de importación en un intérprete nuevo y mide su coste
+
+    Args:
+        code: Código a ejecutar (normalmente imports)
+        src_dir: Directorio con los paquetes (por defecto, el padre de benchmark)
+
+    Returns:
+        Diccionario con el tiempo, el pico de RSS y los módulos pesados cargados
+    """
+    src_dir = src_dir or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=src_dir + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    probe = _PROBE.format(code=code, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True,
+                            check=True, env=env, cwd=src_dir).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_import_benchmark(scenarios: List[str] = None, repeats: int = 3) -> Dict[str, Any]:
+    """
+    Mide todos los escenarios de importación
+
+    Args:
+        scenarios: Escenarios a medir (todos por defecto)
+        repeats: Repeticiones por escenario; se guarda el mejor tiempo
+
+    Returns:
+        Diccionario escenario -> métricas
+    """
+    results = {}
+    for name in scenarios or IMPORT_SCENARIOS:
+        runs = [measure_import(IMPORT_SCENARIOS[name]) for _ in range(repeats)]
+        best = min(runs, key=lambda run: run['seconds'])
+        results[name] = {
+            'seconds': best['seconds'],
+            'peak_rss_mb': best['peak_rss_mb'],
+            'loaded': best['loaded'],
+        }
+    return results
+
+
+def check_tabular_startup() -> List[str]:
+    """
+    Comprueba que el arranque tabular no carga torch ni matplotlib
+
+    Returns:
+        Lista de módulos pesados cargados indebidamente (vacía si todo va bien)
+    """
+    return measure_import(IMPORT_SCENARIOS['tabular'])['loaded']
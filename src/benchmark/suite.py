@@ -0,0 +1,352 @@
+"""
+Module: benchmark/suite.py
+Description: Suite de benchmarks reproducibles para todos los pares agente/entorno.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Any, Dict, List
+import multiprocessing as mp
+import platform
+import resource
+import subprocess
+import datetime
+import random
+import json
+import sys
+import gymnasium as gym
+import numpy as np
+
+
+# Entornos de la suite. 'kind' indica qué tipo de agente puede usarlos y
+# 'threshold' la recompensa media (sobre 'window' episodios) a alcanzar.
+ENVIRONMENTS = {
+    'FrozenLake4x4': {
+        'id': 'FrozenLake-v1',
+        'kwargs': {'is_slippery': False, 'map_name': '4x4'},
+        'kind': 'tabular',
+        'episodes': 3000,
+        'max_steps': 100,
+        'threshold': 0.7,
+    },
+    'FrozenLake8x8': {
+        'id': 'FrozenLake-v1',
+        'kwargs': {'is_slippery': False, 'map_name': '8x8'},
+        'kind': 'tabular',
+        'episodes': 5000,
+        'max_steps': 200,
+        'threshold': 0.5,
+    },
+    'Taxi': {
+        'id': 'Taxi-v3',
+        'kwargs': {},
+        'kind': 'tabular',
+        'episodes': 3000,
+        'max_steps': 200,
+        'threshold': 0.0,
+    },
+    'CartPole': {
+        'id': 'CartPole-v1',
+        'kwargs': {},
+        'kind': 'neural',
+        'episodes': 300,
+        'max_steps': 500,
+        'threshold': 150.0,
+    },
+}
+
+# Agentes de la suite con sus hiperparámetros
+AGENTS = {
+    'QLearningAgent': {'kind': 'tabular', 'params': {'alpha': 0.2, 'gamma': 0.99}},
+    'SARSAAgent': {'kind': 'tabular', 'params': {'alpha': 0.2, 'gamma': 0.99}},
+    'ExpectedSARSAAgent': {'kind': 'tabular', 'params': {'alpha': 0.5, 'gamma': 0.99}},
+    'NStepSARSAAgent': {'kind': 'tabular', 'params': {'alpha': 0.2, 'gamma': 0.99, 'n': 4}},
+    'NStepExpectedSARSAAgent': {'kind': 'tabular', 'params': {'alpha': 0.2, 'gamma': 0.99, 'n': 4}},
+    'NStepTreeBackupAgent': {'kind': 'tabular', 'params': {'alpha': 0.2, 'gamma': 0.99, 'n': 4}},
+    'MonteCarloOnPolicyAgent': {'kind': 'tabular', 'params': {'gamma': 0.99}},
+    'MonteCarloOffPolicyAgent': {'kind': 'tabular', 'params': {'gamma': 0.99}},
+    'SARSASemiGradientAgent': {'kind': 'neural', 'params': {'gamma': 0.99, 'lr': 0.001}},
+    'DeepQAgent': {'kind': 'neural', 'params': {'gamma': 0.99, 'lr': 0.001}},
+}
+
+# Parámetros de la política epsilon-greedy usada por todos los agentes
+POLICY_PARAMS = {'epsilon': 0.3, 'epsilon_decay': 0.999, 'epsilon_min': 0.01}
+
+
+def _seed_everything(seed: int):
+    """
+    Fija las semillas de random, numpy y torch (si está cargado)
+
+    Args:
+        seed: Semilla
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    if 'torch' in sys.modules:
+        sys.modules['torch'].manual_seed(seed)
+
+
+def _peak_rss_mb() -> float:
+    """
+    Pico de memoria residente del proceso actual en MB
+
+    Returns:
+        Pico de RSS en MB
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux devuelve KB y macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _episodes_to_threshold(rewards: List[float], threshold: float, window: int):
+    """
+    Primer episodio en el que la media móvil de la recompensa alcanza el umbral
+
+    Args:
+        rewards: Recompensa de cada episodio
+        threshold: Umbral de recompensa media
+        window: Tamaño de la ventana de la media móvil
+
+    Returns:
+        Número de episodios o None si no se alcanza
+    """
+    if len(rewards) < window:
+        return None
+    cumsum = np.cumsum(np.insert(np.asarray(rewards, dtype=float), 0, 0.0))
+    moving_average = (cumsum[window:] - cumsum[:-window]) / window
+    reached = np.flatnonzero(moving_average >= threshold)
+    return int(reached[0] + window) if len(reached) else None
+
+
+def run_case(agent_name: str, env_name: str, seed: int = 0, num_episodes: int = None,
+             window: int = 100) -> Dict[str, Any]:
+    """
+    Entrena un agente en un entorno y mide su rendimiento
+
+    Args:
+        agent_name: Nombre del agente (clave de AGENTS)
+        env_name: Nombre del entorno (clave de ENVIRONMENTS)
+        seed: Semilla
+        num_episodes: Número de episodios (por defecto el del entorno)
+        window: Ventana para calcular los episodios hasta el umbral
+
+    Returns:
+        Diccionario con las métricas del caso
+    """
+    import agentes
+    from politicas import EpsilonGreedyPolicy
+
+    agent_spec = AGENTS[agent_name]
+    env_spec = ENVIRONMENTS[env_name]
+    if agent_spec['kind'] != env_spec['kind']:
+        raise ValueError(f"{agent_name} no es compatible con {env_name}")
+    num_episodes = num_episodes or env_spec['episodes']
+    max_steps = env_spec['max_steps']
+
+    env = gym.make(env_spec['id'], **env_spec['kwargs'])
+    env.action_space.seed(seed)
+    policy = EpsilonGreedyPolicy(env.action_space, **POLICY_PARAMS)
+    # La clase se resuelve antes de fijar semillas para que torch ya esté
+    # cargado (los agentes neuronales se importan bajo demanda)
+    agent_class = getattr(agentes, agent_name)
+    _seed_everything(seed)
+    agent = agent_class(env, policy=policy, **agent_spec['params'])
+
+    update_latencies = []
+    total_steps = 0
+    start = perf_counter()
+    for episode in range(num_episodes):
+        state, info = env.reset(seed=seed + episode)
+        agent.start_episode()
+
+        done = False
+        step = 0
+        episode_reward = 0
+        while not done and step < max_steps:
+            action = agent.get_action(state)
+            next_state, reward, terminated, truncated, info = env.step(action)
+            done = terminated or truncated
+
+            update_start = perf_counter()
+            agent.update(state, action, next_state, reward, done, info)
+            update_latencies.append(perf_counter() - update_start)
+
+            episode_reward += reward
+            state = next_state
+            step += 1
+
+        agent.end_episode(episode_reward, step)
+        total_steps += step
+        policy.decay()
+        if hasattr(agent, 'decay_learning_rate'):
+            agent.decay_learning_rate()
+    wall_time = perf_counter() - start
+    env.close()
+
+    latencies_us = np.asarray(update_latencies) * 1e6
+    p50, p90, p99 = np.percentile(latencies_us, [50, 90, 99]) if len(latencies_us) else (0.0, 0.0, 0.0)
+    rewards = agent.episode_rewards
+
+    return {
+        'agent': agent_name,
+        'env': env_name,
+        'seed': seed,
+        'episodes': num_episodes,
+        'total_steps': total_steps,
+        'wall_time': wall_time,
+        'steps_per_sec': total_steps / wall_time if wall_time > 0 else 0.0,
+        'update_latency_us': {
+            'p50': float(p50),
+            'p90': float(p90),
+            'p99': float(p99),
+            'max': float(latencies_us.max()) if len(latencies_us) else 0.0,
+        },
+        'peak_rss_mb': _peak_rss_mb(),
+        'threshold': env_spec['threshold'],
+        'episodes_to_threshold': _episodes_to_threshold(rewards, env_spec['threshold'], window),
+        'final_mean_reward': float(np.mean(rewards[-window:])) if rewards else 0.0,
+    }
+
+
+def _metadata() -> Dict[str, Any]:
+    """
+    Información del entorno de ejecución para poder comparar resultados
+
+    Returns:
+        Diccionario con versiones, plataforma y commit actual
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'gymnasium': gym.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': mp.cpu_count(),
+    }
+
+
+def run_suite(agents: List[str] = None, environments: List[str] = None, seeds: List[int] = (0,),
+              num_episodes: int = None, isolate: bool = True, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Ejecuta todos los pares compatibles agente/entorno para cada semilla
+
+    Args:
+        agents: Agentes a evaluar (todos por defecto)
+        environments: Entornos a evaluar (todos por defecto)
+        seeds: Semillas
+        num_episodes: Número de episodios (por defecto el de cada entorno)
+        isolate: Si cada caso se ejecuta en un proceso nuevo, de modo que el
+            pico de memoria y los tiempos no dependan de los casos anteriores
+        verbose: Si se muestra el progreso
+
+    Returns:
+        Diccionario con los metadatos de la ejecución y la lista de resultados
+    """
+    agents = list(agents or AGENTS)
+    environments = list(environments or ENVIRONMENTS)
+    cases = [(agent_name, env_name, seed)
+             for agent_name in agents
+             for env_name in environments
+             if AGENTS[agent_name]['kind'] == ENVIRONMENTS[env_name]['kind']
+             for seed in seeds]
+
+    results = []
+    for agent_name, env_name, seed in cases:
+        if isolate:
+            with ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context('spawn')) as executor:
+                result = executor.submit(run_case, agent_name, env_name, seed, num_episodes).result()
+        else:
+            result = run_case(agent_name, env_name, seed, num_episodes)
+        results.append(result)
+        if verbose:
+            print(f"{agent_name:<26} {env_name:<14} seed={seed} "
+                  f"{result['steps_per_sec']:>10.0f} pasos/s  "
+                  f"p99={result['update_latency_us']['p99']:.1f}us  "
+                  f"rss={result['peak_rss_mb']:.0f}MB  "
+                  f"umbral={result['episodes_to_threshold']}")
+
+    return {'metadata': _metadata(), 'results': results}
+
+
+def save_results(results: Dict[str, Any], path: str):
+    """
+    Guarda los resultados en formato JSON
+
+    Args:
+        results: Resultados de run_suite
+        path: Ruta del fichero
+    """
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Carga unos resultados guardados con save_results
+
+    Args:
+        path: Ruta del fichero
+
+    Returns:
+        Resultados
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.1) -> List[str]:
+    """
+    Compara dos ejecuciones de la suite y detecta regresiones
+
+    Se considera regresión una caída del throughput, un aumento de la latencia
+    p99 o del pico de memoria mayor que la tolerancia relativa, o necesitar más
+    episodios para alcanzar el umbral (o dejar de alcanzarlo).
+
+    Args:
+        baseline: Resultados de referencia
+        current: Resultados actuales
+        tolerance: Tolerancia relativa (0.1 = 10%)
+
+    Returns:
+        Lista con la descripción de cada regresión
+    """
+    reference = {(r['agent'], r['env'], r['seed']): r for r in baseline['results']}
+    regressions = []
+
+    for result in current['results']:
+        key = (result['agent'], result['env'], result['seed'])
+        if key not in reference:
+            continue
+        old = reference[key]
+        name = f"{key[0]}/{key[1]}/seed={key[2]}"
+
+        if result['steps_per_sec'] < old['steps_per_sec'] * (1 - tolerance):
+            regressions.append(f"{name}: pasos/s {old['steps_per_sec']:.0f} -> {result['steps_per_sec']:.0f}")
+        if result['update_latency_us']['p99'] > old['update_latency_us']['p99'] * (1 + tolerance):
+            regressions.append(f"{name}: latencia p99 {old['update_latency_us']['p99']:.1f}us "
+                               f"-> {result['update_latency_us']['p99']:.1f}us")
+        if result['peak_rss_mb'] > old['peak_rss_mb'] * (1 + tolerance):
+            regressions.append(f"{name}: pico RSS {old['peak_rss_mb']:.0f}MB -> {result['peak_rss_mb']:.0f}MB")
+
+        old_episodes, new_episodes = old['episodes_to_threshold'], result['episodes_to_threshold']
+        if old_episodes is not None and (new_episodes is None or new_episodes > old_episodes):
+            regressions.append(f"{name}: episodios hasta el umbral {old_episodes} -> {new_episodes}")
+
+    return regressions
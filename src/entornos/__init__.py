@@ -0,0 +1,21 @@
+"""
+Module: entornos/__init__.py
+Description: Contiene las importaciones y modulos/clases públicas del paquete entornos.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+# Importación de módulos o clases
+from .memo_wrapper import TransitionMemoWrapper, make_memoized_env
+from .async_env import LatencyEnv, ThreadedAsyncEnv
+from .discretize_wrapper import StateDiscretizer, DiscretizeObservation, collect_observations, make_discretized_env
+
+# Lista de módulos o clases públicas
+__all__ = ['TransitionMemoWrapper', 'make_memoized_env', 'StateDiscretizer', 'DiscretizeObservation', 'collect_observations', 'make_discretized_env', 'LatencyEnv', 'ThreadedAsyncEnv']
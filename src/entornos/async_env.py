@@ -0,0 +1,95 @@
+"""
+Module: entornos/async_env.py
+Description: Entornos asíncronos para simuladores lentos o limitados por E/S.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import gymnasium as gym
+import numpy as np
+
+
+class LatencyEnv:
+    """
+    Entorno de prueba que simula un simulador externo: cada reset y step
+    espera latency segundos (más un ruido uniforme de hasta jitter) sin
+    ocupar la CPU y después ejecuta el entorno de gymnasium envuelto.
+
+    Interfaz asíncrona: await env.reset(seed) y await env.step(action).
+    """
+
+    def __init__(self, env: gym.Env, latency: float = 0.005, jitter: float = 0.0, seed: int = None):
+        """
+        Args:
+            env: Entorno de gymnasium envuelto
+            latency: Latencia fija por llamada en segundos
+            jitter: Latencia aleatoria adicional máxima en segundos
+            seed: Semilla del ruido de latencia
+        """
+        self.env = env
+        self.latency = latency
+        self.jitter = jitter
+        self.rng = np.random.default_rng(seed)
+        self.action_space = env.action_space
+        self.observation_space = env.observation_space
+
+    async def _wait(self):
+        """Simula la espera de E/S"""
+        await asyncio.sleep(self.latency + self.jitter * self.rng.random())
+
+    async def reset(self, seed: int = None):
+        """Reinicia el entorno tras la latencia simulada"""
+        await self._wait()
+        return self.env.reset(seed=seed)
+
+    async def step(self, action: int):
+        """Ejecuta un paso tras la latencia simulada"""
+        await self._wait()
+        return self.env.step(action)
+
+    def close(self):
+        """Cierra el entorno envuelto"""
+        self.env.close()
+
+
+class ThreadedAsyncEnv:
+    """
+    Adapta un entorno síncrono cuyo step bloquea esperando E/S (por ejemplo
+    un cliente de un simulador externo) a la interfaz asíncrona, ejecutando
+    cada llamada en un hilo. Mientras un hilo espera, el bucle de eventos
+    sigue atendiendo al resto de entornos.
+    """
+
+    def __init__(self, env: gym.Env, executor: ThreadPoolExecutor = None):
+        """
+        Args:
+            env: Entorno de gymnasium
+            executor: Pool de hilos (por defecto el del bucle de eventos)
+        """
+        self.env = env
+        self.executor = executor
+        self.action_space = env.action_space
+        self.observation_space = env.observation_space
+
+    async def reset(self, seed: int = None):
+        """Reinicia el entorno en un hilo"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, lambda: self.env.reset(seed=seed))
+
+    async def step(self, action: int):
+        """Ejecuta un paso en un hilo"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.env.step, action)
+
+    def close(self):
+        """Cierra el entorno"""
+        self.env.close()
@@ -0,0 +1,231 @@
+"""
+Module: entornos/discretize_wrapper.py
+Description: Agregación de estados para usar agentes tabulares en entornos con observaciones continuas.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from bisect import bisect_right
+from typing import Sequence, Union
+import gymnasium as gym
+import numpy as np
+
+# Límites por encima de este valor se consideran no acotados (CartPole usa
+# el máximo de float32 para las velocidades)
+UNBOUNDED = 1e6
+
+
+class StateDiscretizer:
+    """
+    Convierte observaciones continuas en un índice entero plano.
+
+    Cada dimensión d se divide con sus bordes interiores (bins_d - 1 valores
+    ordenados), de modo que np.digitize devuelve una celda en [0, bins_d) y
+    los valores fuera de rango caen en las celdas extremas. Las celdas se
+    combinan con una tabla de strides:
+
+        índice = Σ_d celda_d * stride_d
+    """
+
+    def __init__(self, edges: Sequence[np.ndarray]):
+        """
+        Args:
+            edges: Bordes interiores de cada dimensión
+        """
+        self.edges = [np.asarray(e, dtype=np.float64) for e in edges]
+        # Listas de Python para el camino de una sola observación (bisect es
+        # más rápido que NumPy con escalares)
+        self._edge_lists = [e.tolist() for e in self.edges]
+
+        self.bins = np.array([len(e) + 1 for e in self.edges], dtype=np.int64)
+        self.strides = np.ones(len(self.bins), dtype=np.int64)
+        self.strides[:-1] = np.cumprod(self.bins[::-1])[::-1][1:]
+        self._stride_list = self.strides.tolist()
+        self.n_states = int(np.prod(self.bins))
+
+    @classmethod
+    def uniform(cls, low: Sequence[float], high: Sequence[float],
+                bins: Union[int, Sequence[int]] = 10) -> 'StateDiscretizer':
+        """
+        Celdas de igual anchura entre low y high
+
+        Args:
+            low: Límite inferior de cada dimensión
+            high: Límite superior de cada dimensión
+            bins: Número de celdas (común o por dimensión)
+
+        Returns:
+            Discretizador
+        """
+        low = np.asarray(low, dtype=np.float64)
+        high = np.asarray(high, dtype=np.float64)
+        bins = np.broadcast_to(bins, low.shape)
+        return cls([np.linspace(lo, hi, b + 1)[1:-1] for lo, hi, b in zip(low, high, bins)])
+
+    @classmethod
+    def from_space(cls, space: gym.spaces.Box, bins: Union[int, Sequence[int]] = 10,
+                   low: Sequence[float] = None, high: Sequence[float] = None) -> 'StateDiscretizer':
+        """
+        Celdas de igual anchura dentro de los límites de un espacio Box
+
+        Args:
+            space: Espacio de observación
+            bins: Número de celdas (común o por dimensión)
+            low: Límites inferiores que sustituyen a los del espacio
+            high: Límites superiores que sustituyen a los del espacio
+
+        Returns:
+            Discretizador
+        """
+        low = np.asarray(space.low if low is None else low, dtype=np.float64).ravel()
+        high = np.asarray(space.high if high is None else high, dtype=np.float64).ravel()
+        unbounded = ~np.isfinite(low) | ~np.isfinite(high) | (np.abs(low) > UNBOUNDED) | (np.abs(high) > UNBOUNDED)
+        if unbounded.any():
+            raise ValueError(f"Las dimensiones {np.flatnonzero(unbounded).tolist()} no están acotadas: "
+                             "indica low/high o usa celdas por cuantiles (from_samples)")
+        return cls.uniform(low, high, bins)
+
+    @classmethod
+    def from_samples(cls, samples: np.ndarray, bins: Union[int, Sequence[int]] = 10) -> 'StateDiscretizer':
+        """
+        Celdas adaptativas: los bordes son cuantiles de una muestra de
+        observaciones, así que cada celda recibe aproximadamente las mismas visitas
+
+        Args:
+            samples: Array (num_samples, dims) de observaciones
+            bins: Número de celdas (común o por dimensión)
+
+        Returns:
+            Discretizador
+        """
+        samples = np.asarray(samples, dtype=np.float64).reshape(len(samples), -1)
+        bins = np.broadcast_to(bins, samples.shape[1:])
+        # np.unique elimina bordes repetidos en dimensiones con pocos valores distintos
+        return cls([np.unique(np.quantile(samples[:, d], np.linspace(0, 1, b + 1)[1:-1]))
+                    for d, b in enumerate(bins)])
+
+    def transform(self, observation: np.ndarray) -> int:
+        """
+        Índice de una observación
+
+        Args:
+            observation: Vector de observación
+
+        Returns:
+            Índice del estado agregado
+        """
+        index = 0
+        for x, edges, stride in zip(np.ravel(observation).tolist(), self._edge_lists, self._stride_list):
+            index += bisect_right(edges, x) * stride
+        return index
+
+    def transform_batch(self, observations: np.ndarray) -> np.ndarray:
+        """
+        Índices de un lote de observaciones
+
+        Args:
+            observations: Array (batch, dims)
+
+        Returns:
+            Array de índices
+        """
+        observations = np.asarray(observations).reshape(len(observations), -1)
+        cells = np.stack([np.digitize(observations[:, d], edges) for d, edges in enumerate(self.edges)], axis=1)
+        return cells @ self.strides
+
+
+def collect_observations(env: gym.Env, num_steps: int = 10000, seed: int = None) -> np.ndarray:
+    """
+    Recoge observaciones con una política aleatoria para ajustar celdas por cuantiles
+
+    Args:
+        env: Entorno con observaciones Box
+        num_steps: Número de pasos
+        seed: Semilla
+
+    Returns:
+        Array (num_steps, dims) de observaciones
+    """
+    env.action_space.seed(seed)
+    observation, _ = env.reset(seed=seed)
+    samples = np.empty((num_steps,) + np.shape(observation), dtype=np.float64)
+    for i in range(num_steps):
+        samples[i] = observation
+        observation, _, terminated, truncated, _ = env.step(env.action_space.sample())
+        if terminated or truncated:
+            observation, _ = env.reset()
+    return samples
+
+
+class DiscretizeObservation(gym.ObservationWrapper, gym.utils.RecordConstructorArgs):
+    """
+    Expone un entorno con observaciones Box como un entorno Discrete para que
+    cualquier agente tabular pueda usarlo.
+
+    Las celdas se fijan al construir el wrapper: uniformes dentro de los
+    límites del espacio (o de low/high) o, con warmup_steps > 0, por cuantiles
+    de las observaciones de una política aleatoria. El discretizador ajustado
+    se guarda en el spec del entorno, así que gym.make(env.spec) reproduce la
+    misma agregación (por ejemplo en Agent.evaluate).
+    """
+
+    def __init__(self, env: gym.Env, bins: Union[int, Sequence[int]] = 10,
+                 low: Sequence[float] = None, high: Sequence[float] = None,
+                 warmup_steps: int = 0, seed: int = None, discretizer: StateDiscretizer = None):
+        """
+        Args:
+            env: Entorno con espacio de observación Box
+            bins: Número de celdas (común o por dimensión)
+            low: Límites inferiores para celdas uniformes
+            high: Límites superiores para celdas uniformes
+            warmup_steps: Pasos aleatorios para ajustar celdas por cuantiles (0 para uniformes)
+            seed: Semilla del calentamiento
+            discretizer: Discretizador ya construido (ignora el resto de opciones)
+        """
+        if not isinstance(env.observation_space, gym.spaces.Box):
+            raise ValueError("DiscretizeObservation requiere un espacio de observación Box")
+
+        if discretizer is None:
+            if warmup_steps > 0:
+                discretizer = StateDiscretizer.from_samples(collect_observations(env, warmup_steps, seed), bins)
+            else:
+                discretizer = StateDiscretizer.from_space(env.observation_space, bins, low, high)
+
+        gym.utils.RecordConstructorArgs.__init__(self, discretizer=discretizer)
+        gym.ObservationWrapper.__init__(self, env)
+
+        self.discretizer = discretizer
+        self.observation_space = gym.spaces.Discrete(discretizer.n_states)
+
+    def observation(self, observation: np.ndarray) -> int:
+        """Índice del estado agregado"""
+        return self.discretizer.transform(observation)
+
+
+def make_discretized_env(env_id: str, bins: Union[int, Sequence[int]] = 10, low: Sequence[float] = None,
+                         high: Sequence[float] = None, warmup_steps: int = 0, seed: int = None,
+                         **kwargs) -> gym.Env:
+    """
+    Crea un entorno de gymnasium con observaciones discretizadas
+
+    Args:
+        env_id: Identificador del entorno
+        bins: Ver DiscretizeObservation
+        low: Ver DiscretizeObservation
+        high: Ver DiscretizeObservation
+        warmup_steps: Ver DiscretizeObservation
+        seed: Ver DiscretizeObservation
+        **kwargs: Argumentos para gym.make
+
+    Returns:
+        Entorno envuelto
+    """
+    return DiscretizeObservation(gym.make(env_id, **kwargs), bins=bins, low=low, high=high,
+                                 warmup_steps=warmup_steps, seed=seed)
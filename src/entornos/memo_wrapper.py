@@ -0,0 +1,179 @@
+"""
+Module: entornos/memo_wrapper.py
+Description: Wrapper que memoriza las transiciones de entornos discretos deterministas.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from gymnasium.wrappers import TimeLimit
+import gymnasium as gym
+import numpy as np
+
+
+class TransitionMemoWrapper(gym.Wrapper):
+    """
+    Memoriza (s, a) -> (s', r, terminated) en arrays preasignados para
+    entornos con estados y acciones discretos y dinámica determinista
+    (por ejemplo FrozenLake no resbaladizo o Taxi).
+
+    Una transición se sirve desde la caché cuando se ha observado
+    verify_visits veces con el mismo resultado. Si alguna repetición no
+    coincide, el entorno se considera estocástico y la caché se desactiva.
+    Si el entorno expone su modelo (atributo P de los entornos toy_text) y
+    este tiene transiciones con varios resultados, no se cachea nunca.
+
+    En un acierto no se llama a env.step, así que el estado interno del
+    entorno base (atributo s) se actualiza directamente; si el entorno no
+    tiene ese atributo, no se cachea. Por eso el wrapper
+    debe aplicarse sobre el entorno base y el límite de pasos por fuera
+    (ver make_memoized_env).
+    """
+
+    def __init__(self, env: gym.Env, verify_visits: int = 2):
+        """
+        Inicializa el wrapper
+
+        Args:
+            env: Entorno base con espacios Discrete
+            verify_visits: Veces que se ejecuta de verdad cada (s, a) antes de
+                servirla desde la caché (mínimo 1)
+        """
+        super().__init__(env)
+        if not isinstance(env.observation_space, gym.spaces.Discrete) or \
+                not isinstance(env.action_space, gym.spaces.Discrete):
+            raise ValueError("TransitionMemoWrapper requiere espacios de observación y acción discretos")
+
+        wrapper = env
+        while isinstance(wrapper, gym.Wrapper):
+            if isinstance(wrapper, TimeLimit):
+                raise ValueError("El límite de pasos debe aplicarse por fuera del wrapper (usa make_memoized_env)")
+            wrapper = wrapper.env
+
+        self.verify_visits = max(1, verify_visits)
+        self.n_states = env.observation_space.n
+        self.n_actions = env.action_space.n
+
+        # Caché preasignada
+        shape = (self.n_states, self.n_actions)
+        self.next_states = np.full(shape, -1, dtype=np.int64)
+        self.rewards = np.zeros(shape, dtype=np.float64)
+        self.terminated = np.zeros(shape, dtype=bool)
+        self.infos = np.empty(shape, dtype=object)
+        self.visits = np.zeros(shape, dtype=np.int64)
+
+        self.cacheable = self._model_is_deterministic()
+        self.state = None
+        self.hits = 0
+        self.misses = 0
+
+    def _model_is_deterministic(self) -> bool:
+        """
+        Comprueba el modelo de transiciones P si el entorno lo expone
+
+        Returns:
+            False si alguna transición tiene varios resultados posibles
+        """
+        model = getattr(self.env.unwrapped, 'P', None)
+        if model is None:
+            return True
+        return all(len([t for t in transitions if t[0] > 0]) <= 1
+                   for actions in model.values() for transitions in actions.values())
+
+    def reset(self, **kwargs):
+        """Reinicia el entorno y registra el estado inicial"""
+        observation, info = self.env.reset(**kwargs)
+        # Sin un estado interno que sincronizar no se pueden servir aciertos
+        if not hasattr(self.env.unwrapped, 's'):
+            self.cacheable = False
+        self.state = int(observation)
+        return observation, info
+
+    @property
+    def spec(self):
+        """
+        El wrapper es transparente: se devuelve el spec del entorno base para
+        que gym.make(env.spec) cree un entorno equivalente
+        """
+        return self.env.spec
+
+    def step(self, action):
+        """
+        Devuelve la transición memorizada si existe; si no, ejecuta el paso
+        real y lo guarda (o lo contrasta con el guardado)
+        """
+        state = self.state
+        action = int(action)
+
+        if self.cacheable and self.visits[state, action] >= self.verify_visits:
+            next_state = int(self.next_states[state, action])
+            unwrapped = self.env.unwrapped
+            unwrapped.s = next_state
+            if hasattr(unwrapped, 'lastaction'):
+                unwrapped.lastaction = action
+            self.state = next_state
+            self.hits += 1
+            return (next_state, self.rewards[state, action], bool(self.terminated[state, action]),
+                    False, self.infos[state, action])
+
+        observation, reward, terminated, truncated, info = self.env.step(action)
+        self.misses += 1
+
+        if self.cacheable:
+            if self.visits[state, action] == 0:
+                self.next_states[state, action] = int(observation)
+                self.rewards[state, action] = reward
+                self.terminated[state, action] = terminated
+                self.infos[state, action] = info
+            elif (self.next_states[state, action] != int(observation)
+                  or self.rewards[state, action] != reward
+                  or self.terminated[state, action] != terminated):
+                # Resultado distinto para el mismo (s, a): el entorno es estocástico
+                self.cacheable = False
+            self.visits[state, action] += 1
+
+        self.state = int(observation)
+        return observation, reward, terminated, truncated, info
+
+    def cache_stats(self):
+        """
+        Estadísticas de uso de la caché
+
+        Returns:
+            Diccionario con aciertos, fallos, tasa de aciertos y si la caché está activa
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "cached_transitions": int((self.visits >= self.verify_visits).sum()),
+            "cacheable": self.cacheable,
+        }
+
+
+def make_memoized_env(env_id: str, verify_visits: int = 2, **kwargs) -> gym.Env:
+    """
+    Crea un entorno de gymnasium con memorización de transiciones, aplicando
+    el límite de pasos del spec por fuera del wrapper
+
+    Args:
+        env_id: Identificador del entorno
+        verify_visits: Ver TransitionMemoWrapper
+        **kwargs: Argumentos para gym.make (is_slippery, map_name, render_mode, ...)
+
+    Returns:
+        Entorno envuelto
+    """
+    env = gym.make(env_id, **kwargs)
+    max_episode_steps = env.spec.max_episode_steps if env.spec is not None else None
+    memo_env = TransitionMemoWrapper(env.unwrapped, verify_visits=verify_visits)
+    if max_episode_steps is not None:
+        return TimeLimit(memo_env, max_episode_steps)
+    return memo_env
@@ -0,0 +1,23 @@
+"""
+Module: inferencia/__init__.py
+Description: Contiene las importaciones y modulos/clases públicas del paquete inferencia.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+# Importación de módulos o clases
+from .artifact import (TabularPolicyArtifact, MLPPolicyArtifact, TorchScriptPolicyArtifact,
+                       export_policy, export_torchscript, load_policy)
+from .server import PolicyServer
+from .load_test import run_load_test
+
+# Lista de módulos o clases públicas
+__all__ = ['TabularPolicyArtifact', 'MLPPolicyArtifact', 'TorchScriptPolicyArtifact', 'export_policy',
+           'export_torchscript', 'load_policy', 'PolicyServer', 'run_load_test']
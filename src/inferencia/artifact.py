@@ -0,0 +1,218 @@
+"""
+Module: inferencia/artifact.py
+Description: Artefactos de inferencia congelados para servir la política greedy de un agente.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import List
+import numpy as np
+
+
+class TabularPolicyArtifact:
+    """
+    Política greedy de un agente tabular: tabla precalculada estado -> acción
+    """
+
+    def __init__(self, actions: np.ndarray):
+        """
+        Args:
+            actions: Array con la acción greedy de cada estado
+        """
+        self.actions = np.asarray(actions, dtype=np.int64)
+        # Cada estado es un índice escalar
+        self.state_shape = ()
+
+    def validate_states(self, states: np.ndarray) -> np.ndarray:
+        """
+        Comprueba que los estados sean índices enteros válidos (sin esta
+        comprobación -1 indexaría el último estado y 2.7 se truncaría a 2)
+
+        Args:
+            states: Estado o array de estados
+
+        Returns:
+            Estados como array de enteros
+        """
+        states = np.asarray(states)
+        if states.dtype.kind not in 'iu':
+            raise ValueError(f"Los estados de una política tabular deben ser enteros (tipo {states.dtype})")
+        if states.size and (states.min() < 0 or states.max() >= len(self.actions)):
+            raise ValueError(f"Estado fuera de rango: los estados válidos son 0..{len(self.actions) - 1}")
+        return states.astype(np.int64, copy=False)
+
+    def predict(self, states: np.ndarray) -> np.ndarray:
+        """
+        Acciones para un lote de estados
+
+        Args:
+            states: Array de índices de estado
+
+        Returns:
+            Array de acciones
+        """
+        return self.actions[self.validate_states(states)]
+
+    def save(self, path: str):
+        """Guarda el artefacto en un fichero .npz"""
+        np.savez(path, kind='tabular', actions=self.actions)
+
+
+class MLPPolicyArtifact:
+    """
+    Política greedy de un agente neuronal como MLP en NumPy (capas lineales
+    con ReLU entre ellas), sin depender de torch en inferencia
+    """
+
+    def __init__(self, weights: List[np.ndarray], biases: List[np.ndarray]):
+        """
+        Args:
+            weights: Matrices de pesos de cada capa con forma (salida, entrada)
+            biases: Sesgos de cada capa
+        """
+        # Se guardan traspuestas para multiplicar por la derecha
+        self.weights = [np.ascontiguousarray(np.asarray(w, dtype=np.float32).T) for w in weights]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self.state_shape = (self.weights[0].shape[0],)
+
+    def q_values(self, states: np.ndarray) -> np.ndarray:
+        """
+        Valores Q para un lote de estados
+
+        Args:
+            states: Array (batch, input_dim)
+
+        Returns:
+            Array (batch, n_actions)
+        """
+        x = np.asarray(states, dtype=np.float32)
+        for w, b in zip(self.weights[:-1], self.biases[:-1]):
+            x = np.maximum(x @ w + b, 0.0)
+        return x @ self.weights[-1] + self.biases[-1]
+
+    def predict(self, states: np.ndarray) -> np.ndarray:
+        """
+        Acciones greedy para un lote de estados
+
+        Args:
+            states: Array (batch, input_dim)
+
+        Returns:
+            Array de acciones
+        """
+        return np.argmax(self.q_values(states), axis=1)
+
+    def save(self, path: str):
+        """Guarda el artefacto en un fichero .npz"""
+        arrays = {}
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            arrays[f'w{i}'] = w.T
+            arrays[f'b{i}'] = b
+        np.savez(path, kind='mlp', num_layers=len(self.weights), **arrays)
+
+
+class TorchScriptPolicyArtifact:
+    """
+    Política greedy de un agente neuronal como módulo TorchScript
+    """
+
+    def __init__(self, module):
+        """
+        Args:
+            module: Módulo TorchScript o ruta del fichero guardado con export_torchscript
+        """
+        import torch
+        self.module = torch.jit.load(module) if isinstance(module, str) else module
+        self.module.eval()
+
+    def predict(self, states: np.ndarray) -> np.ndarray:
+        """
+        Acciones greedy para un lote de estados
+
+        Args:
+            states: Array (batch, input_dim)
+
+        Returns:
+            Array de acciones
+        """
+        import torch
+        with torch.no_grad():
+            q_values = self.module(torch.as_tensor(np.asarray(states), dtype=torch.float32))
+        return q_values.argmax(dim=1).numpy()
+
+
+def export_policy(agent, path: str = None):
+    """
+    Congela la política greedy de un agente en un artefacto de inferencia:
+    tabla argmax para agentes tabulares y MLP en NumPy para agentes neuronales
+
+    Args:
+        agent: Agente entrenado (con tabla Q o con q_network)
+        path: Si se indica, fichero .npz donde guardar el artefacto
+
+    Returns:
+        Artefacto de inferencia
+    """
+    if hasattr(agent, 'Q'):
+        artifact = TabularPolicyArtifact(np.argmax(agent.Q, axis=1))
+    elif hasattr(agent, 'q_network'):
+        import torch.nn as nn
+        layers = [layer for layer in agent.q_network.modules() if isinstance(layer, nn.Linear)]
+        artifact = MLPPolicyArtifact([layer.weight.detach().cpu().numpy() for layer in layers],
+                                     [layer.bias.detach().cpu().numpy() for layer in layers])
+    else:
+        raise ValueError(f"No se puede exportar la política de {type(agent).__name__}")
+
+    if path is not None:
+        artifact.save(path)
+    return artifact
+
+
+def export_torchscript(agent, path: str = None) -> TorchScriptPolicyArtifact:
+    """
+    Exporta la red Q de un agente neuronal como TorchScript
+
+    Args:
+        agent: Agente con q_network
+        path: Si se indica, fichero donde guardar el módulo
+
+    Returns:
+        Artefacto TorchScript
+    """
+    import torch
+    import copy
+    network = copy.deepcopy(agent.q_network).cpu().eval()
+    example = torch.zeros(1, agent.input_dim)
+    module = torch.jit.trace(network, example)
+    if path is not None:
+        module.save(path)
+    return TorchScriptPolicyArtifact(module)
+
+
+def load_policy(path: str):
+    """
+    Carga un artefacto guardado con export_policy (.npz) o export_torchscript
+
+    Args:
+        path: Ruta del fichero
+
+    Returns:
+        Artefacto de inferencia
+    """
+    if not path.endswith('.npz'):
+        return TorchScriptPolicyArtifact(path)
+
+    with np.load(path) as data:
+        kind = str(data['kind'])
+        if kind == 'tabular':
+            return TabularPolicyArtifact(data['actions'])
+        num_layers = int(data['num_layers'])
+        return MLPPolicyArtifact([data[f'w{i}'] for i in range(num_layers)],
+                                 [data[f'b{i}'] for i in range(num_layers)])
@@ -0,0 +1,116 @@
+"""
+Module: inferencia/load_test.py
+Description: Prueba de carga por socket local del servidor de inferencia (latencia p50/p99 y throughput).
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from inferencia.server import PolicyServer
+from time import perf_counter
+from typing import Any, Dict
+import asyncio
+import json
+import os
+import tempfile
+import numpy as np
+
+
+async def _client(open_connection, states: np.ndarray, num_requests: int, latencies: list):
+    """
+    Cliente en bucle cerrado: envía una petición, espera la respuesta y repite
+
+    Args:
+        open_connection: Corrutina que abre la conexión con el servidor
+        states: Estados de los que se eligen las peticiones
+        num_requests: Número de peticiones
+        latencies: Lista donde se añade la latencia de cada petición
+    """
+    reader, writer = await open_connection()
+    rng = np.random.default_rng()
+    try:
+        for _ in range(num_requests):
+            state = states[rng.integers(len(states))]
+            request = json.dumps({'state': state.tolist() if isinstance(state, np.ndarray) else int(state)})
+            start = perf_counter()
+            writer.write(request.encode() + b'\n')
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            latencies.append(perf_counter() - start)
+            if 'error' in response:
+                raise RuntimeError(response['error'])
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def _run_load_test(artifact, states, num_clients, requests_per_client, max_batch_size,
+                         max_latency_ms, transport):
+    server = PolicyServer(artifact, max_batch_size=max_batch_size, max_latency_ms=max_latency_ms)
+    tmpdir = None
+    if transport == 'unix':
+        tmpdir = tempfile.mkdtemp()
+        path = os.path.join(tmpdir, 'policy.sock')
+        await server.serve_unix(path)
+        open_connection = lambda: asyncio.open_unix_connection(path)
+    else:
+        tcp_server = await server.serve_tcp()
+        host, port = tcp_server.sockets[0].getsockname()[:2]
+        open_connection = lambda: asyncio.open_connection(host, port)
+
+    latencies = []
+    try:
+        start = perf_counter()
+        await asyncio.gather(*(_client(open_connection, states, requests_per_client, latencies)
+                               for _ in range(num_clients)))
+        elapsed = perf_counter() - start
+    finally:
+        await server.close()
+        if tmpdir is not None:
+            os.remove(path)
+            os.rmdir(tmpdir)
+
+    latencies_ms = np.asarray(latencies) * 1000
+    return {
+        'clients': num_clients,
+        'requests': len(latencies),
+        'max_batch_size': max_batch_size,
+        'max_latency_ms': max_latency_ms,
+        'transport': transport,
+        'throughput': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'latency_ms': {
+            'p50': float(np.percentile(latencies_ms, 50)),
+            'p99': float(np.percentile(latencies_ms, 99)),
+            'max': float(latencies_ms.max()),
+        },
+        'mean_batch_size': float(np.mean(server.batch_sizes)) if server.batch_sizes else 0.0,
+    }
+
+
+def run_load_test(artifact, states: np.ndarray, num_clients: int = 64, requests_per_client: int = 200,
+                  max_batch_size: int = 256, max_latency_ms: float = 1.0,
+                  transport: str = 'unix') -> Dict[str, Any]:
+    """
+    Arranca un servidor local y lo somete a num_clients clientes concurrentes
+
+    Args:
+        artifact: Artefacto de inferencia
+        states: Estados de ejemplo con los que se construyen las peticiones
+        num_clients: Número de clientes concurrentes
+        requests_per_client: Peticiones por cliente
+        max_batch_size: Tamaño máximo de micro-lote del servidor
+        max_latency_ms: Presupuesto de latencia del servidor para llenar un lote
+        transport: 'unix' o 'tcp' (en 127.0.0.1)
+
+    Returns:
+        Diccionario con throughput (peticiones/s), latencias p50/p99 en ms y
+        tamaño medio de lote
+    """
+    return asyncio.run(_run_load_test(artifact, np.asarray(states), num_clients, requests_per_client,
+                                      max_batch_size, max_latency_ms, transport))
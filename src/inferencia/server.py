@@ -0,0 +1,216 @@
+"""
+Module: inferencia/server.py
+Description: Servidor asyncio que agrupa peticiones concurrentes en micro-lotes de inferencia.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from typing import Any
+import asyncio
+import json
+import numpy as np
+
+
+class PolicyServer:
+    """
+    Sirve la política de un artefacto de inferencia a muchos clientes.
+
+    Las peticiones concurrentes se acumulan en una cola y un bucle las agrupa
+    en un micro-lote que se resuelve con una única llamada a predict. Un lote
+    se cierra cuando alcanza max_batch_size o cuando la primera petición lleva
+    esperando max_latency_ms.
+
+    Protocolo por socket: una línea JSON {"state": ...} por petición y una
+    línea JSON {"action": ...} por respuesta.
+
+    Cada estado se valida antes de encolarse (numérico, con la forma del
+    artefacto, o la del primer estado válido si el artefacto no la declara,
+    y con las comprobaciones de su validate_states si lo tiene), así que una
+    petición mal formada solo falla ella misma.
+    """
+
+    def __init__(self, artifact, max_batch_size: int = 256, max_latency_ms: float = 1.0):
+        """
+        Args:
+            artifact: Artefacto con un método predict(states) -> actions
+            max_batch_size: Tamaño máximo de cada micro-lote
+            max_latency_ms: Tiempo máximo que una petición espera a que se llene el lote
+        """
+        self.artifact = artifact
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000.0
+        self.queue = None
+        self.batcher = None
+        self.servers = []
+        self.batch_sizes = []
+        self.state_shape = getattr(artifact, 'state_shape', None)
+
+    def _check_state(self, state: Any) -> np.ndarray:
+        """
+        Convierte un estado a array y comprueba que pueda entrar en un lote
+
+        Args:
+            state: Estado recibido
+
+        Returns:
+            Estado como array NumPy
+        """
+        try:
+            state = np.asarray(state)
+        except ValueError as error:
+            raise ValueError(f"Estado mal formado: {error}") from None
+        if state.dtype.kind not in 'biuf':
+            raise ValueError(f"El estado debe ser numérico (tipo {state.dtype})")
+        if self.state_shape is None:
+            self.state_shape = state.shape
+        elif state.shape != tuple(self.state_shape):
+            raise ValueError(f"Forma del estado {state.shape}, se esperaba {tuple(self.state_shape)}")
+        # Comprobaciones propias del artefacto (rango de índices en los tabulares)
+        validate_states = getattr(self.artifact, 'validate_states', None)
+        if validate_states is not None:
+            state = validate_states(state)
+        return state
+
+    async def start(self):
+        """Arranca el bucle de agrupación de peticiones"""
+        if self.batcher is None:
+            self.queue = asyncio.Queue()
+            self.batcher = asyncio.create_task(self._batch_loop())
+
+    async def predict(self, state: Any) -> int:
+        """
+        Encola un estado y espera su acción
+
+        Args:
+            state: Estado (índice o vector)
+
+        Returns:
+            Acción
+        """
+        state = self._check_state(state)
+        await self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((state, future))
+        return await future
+
+    async def _batch_loop(self):
+        """Agrupa peticiones en micro-lotes y las resuelve"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_latency
+
+            while len(batch) < self.max_batch_size:
+                # Primero toma lo que ya está en cola sin esperar
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                actions = self.artifact.predict(np.stack([state for state, _ in batch]))
+            except Exception as error:
+                self._resolve_one_by_one(batch, error)
+                continue
+
+            self.batch_sizes.append(len(batch))
+            for (_, future), action in zip(batch, actions):
+                if not future.done():
+                    future.set_result(int(action))
+
+    def _resolve_one_by_one(self, batch, error: Exception):
+        """
+        Si falla el lote completo, resuelve cada petición por separado para
+        que el error solo llegue a las que lo provocan
+
+        Args:
+            batch: Lista de (estado, future)
+            error: Error del lote
+        """
+        if len(batch) == 1:
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(error)
+            return
+        for state, future in batch:
+            if future.done():
+                continue
+            try:
+                future.set_result(int(self.artifact.predict(state[np.newaxis])[0]))
+            except Exception as single_error:
+                future.set_exception(single_error)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Atiende las peticiones de una conexión, una línea JSON por petición"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    action = await self.predict(json.loads(line)['state'])
+                    response = {'action': action}
+                except Exception as error:
+                    response = {'error': str(error)}
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve_tcp(self, host: str = '127.0.0.1', port: int = 0):
+        """
+        Escucha en un socket TCP local
+
+        Args:
+            host: Dirección
+            port: Puerto (0 para que el sistema elija uno libre)
+
+        Returns:
+            Servidor asyncio; el puerto real está en server.sockets[0].getsockname()
+        """
+        await self.start()
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        self.servers.append(server)
+        return server
+
+    async def serve_unix(self, path: str):
+        """
+        Escucha en un socket Unix
+
+        Args:
+            path: Ruta del socket
+
+        Returns:
+            Servidor asyncio
+        """
+        await self.start()
+        server = await asyncio.start_unix_server(self._handle_connection, path)
+        self.servers.append(server)
+        return server
+
+    async def close(self):
+        """Cierra los sockets y detiene el bucle de agrupación"""
+        for server in self.servers:
+            server.close()
+            await server.wait_closed()
+        self.servers = []
+        if self.batcher is not None:
+            self.batcher.cancel()
+            try:
+                await self.batcher
+            except asyncio.CancelledError:
+                pass
+            self.batcher = None
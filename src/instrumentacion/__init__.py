@@ -0,0 +1,21 @@
+"""
+Module: instrumentacion/__init__.py
+Description: Contiene las importaciones y modulos/clases públicas del paquete instrumentacion.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+# Importación de módulos o clases
+from .phase_timer import PhaseTimer
+from .trajectory_recorder import TrajectoryRecorder, TrajectoryReader
+from .q_history import QTableHistory, QTableHistoryReader
+
+# Lista de módulos o clases públicas
+__all__ = ['PhaseTimer', 'TrajectoryRecorder', 'TrajectoryReader', 'QTableHistory', 'QTableHistoryReader']
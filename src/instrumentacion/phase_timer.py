@@ -0,0 +1,194 @@
+"""
+Module: instrumentacion/phase_timer.py
+Description: Temporizador por fases para medir dónde se gasta el tiempo del bucle agente/entorno.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from collections import defaultdict
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+
+class PhaseTimer:
+    """
+    Acumula el tiempo de reloj y el número de llamadas de cada fase.
+
+    La instrumentación se aplica envolviendo métodos de instancia, por lo que
+    cuando está desactivada el código original se ejecuta sin ningún coste.
+    Los tiempos son inclusivos: si una fase llama a otra (get_action llama a
+    select_action), el tiempo de la interna también cuenta en la externa.
+    """
+
+    def __init__(self):
+        """Inicializa los contadores"""
+        self.total_time = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.start_time = perf_counter()
+
+    def record(self, phase: str, elapsed: float):
+        """
+        Registra una ejecución de una fase
+
+        Args:
+            phase: Nombre de la fase
+            elapsed: Tiempo transcurrido en segundos
+        """
+        self.total_time[phase] += elapsed
+        self.calls[phase] += 1
+
+    def wrap(self, phase: str, fn: Callable) -> Callable:
+        """
+        Devuelve una versión de fn que registra su tiempo en la fase indicada
+
+        Args:
+            phase: Nombre de la fase
+            fn: Función a medir
+
+        Returns:
+            Función envuelta
+        """
+        total_time = self.total_time
+        calls = self.calls
+
+        @wraps(fn)
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                total_time[phase] += perf_counter() - start
+                calls[phase] += 1
+
+        return timed
+
+    def wrap_method(self, obj: Any, name: str, phase: str) -> Callable:
+        """
+        Sustituye el método obj.name por una versión medida a nivel de instancia
+
+        Args:
+            obj: Objeto cuyo método se mide
+            name: Nombre del método
+            phase: Nombre de la fase
+
+        Returns:
+            Función sin argumentos que deshace el cambio (sin quitar los
+            envoltorios que se hayan añadido después)
+        """
+        had_attribute = name in vars(obj)
+        previous = vars(obj).get(name)
+        original = getattr(obj, name)
+        timed = self.wrap(phase, original)
+        active = True
+
+        @wraps(original)
+        def wrapper(*args, **kwargs):
+            if active:
+                return timed(*args, **kwargs)
+            return original(*args, **kwargs)
+
+        setattr(obj, name, wrapper)
+
+        def undo():
+            nonlocal active
+            active = False
+            # Si después se ha envuelto el mismo método (TrajectoryRecorder,
+            # QTableHistory, ...), se deja ese envoltorio y este solo llama al original
+            if vars(obj).get(name) is not wrapper:
+                return
+            if had_attribute:
+                setattr(obj, name, previous)
+            else:
+                delattr(obj, name)
+
+        return undo
+
+    def wrap_module(self, module: Any, phase: str) -> Callable:
+        """
+        Mide el forward de un módulo de torch mediante hooks
+
+        Args:
+            module: Módulo de torch (nn.Module)
+            phase: Nombre de la fase
+
+        Returns:
+            Función sin argumentos que elimina los hooks
+        """
+        starts = []
+
+        def pre_hook(mod, inputs):
+            starts.append(perf_counter())
+
+        def hook(mod, inputs, output):
+            self.record(phase, perf_counter() - starts.pop())
+
+        pre_handle = module.register_forward_pre_hook(pre_hook)
+        handle = module.register_forward_hook(hook)
+
+        def undo():
+            pre_handle.remove()
+            handle.remove()
+
+        return undo
+
+    def elapsed(self) -> float:
+        """
+        Tiempo de reloj desde que se creó el temporizador
+
+        Returns:
+            Segundos transcurridos
+        """
+        return perf_counter() - self.start_time
+
+    def rate(self, phase: str) -> float:
+        """
+        Llamadas por segundo de una fase desde que se creó el temporizador
+
+        Args:
+            phase: Nombre de la fase
+
+        Returns:
+            Llamadas por segundo
+        """
+        elapsed = self.elapsed()
+        return self.calls[phase] / elapsed if elapsed > 0 else 0.0
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Devuelve un informe estructurado de las fases medidas
+
+        Returns:
+            Diccionario con el tiempo total, las fases (llamadas, tiempo total,
+            tiempo medio y fracción del total) y las tasas de pasos y actualizaciones
+        """
+        wall_time = self.elapsed()
+        phases = {}
+        for phase, total in sorted(self.total_time.items(), key=lambda item: -item[1]):
+            calls = self.calls[phase]
+            phases[phase] = {
+                "calls": calls,
+                "total_time": total,
+                "mean_time": total / calls if calls else 0.0,
+                "fraction": total / wall_time if wall_time > 0 else 0.0,
+            }
+
+        return {
+            "wall_time": wall_time,
+            "phases": phases,
+            "steps_per_sec": self.rate("env_step"),
+            "updates_per_sec": self.rate("update"),
+        }
+
+    def reset(self):
+        """Reinicia los contadores"""
+        self.total_time.clear()
+        self.calls.clear()
+        self.start_time = perf_counter()
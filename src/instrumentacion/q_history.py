@@ -0,0 +1,352 @@
+"""
+Module: instrumentacion/q_history.py
+Description: Historial comprimido por deltas de la tabla Q de un agente tabular.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, Sequence, Tuple
+import os
+import numpy as np
+
+DATA_FILE = 'deltas.bin'
+INDEX_FILE = 'index.npz'
+
+
+class QTableHistory:
+    """
+    Guarda instantáneas periódicas de la tabla Q (y de visit_counts si el
+    agente la tiene) sin copiar la tabla entera cada vez.
+
+    Cada instantánea guarda solo las celdas (s, a) que han cambiado desde la
+    anterior: sus índices planos y sus valores nuevos. Cada keyframe_every
+    instantáneas se guarda la tabla completa (keyframe), para que reconstruir
+    una instantánea no obligue a aplicar todos los deltas desde el principio.
+
+    Los bloques se añaden a un fichero binario a medida que se generan y el
+    índice (episodio, desplazamiento y número de celdas de cada bloque) se
+    reescribe en cada keyframe y al cerrar, así que el historial puede
+    leerse con QTableHistoryReader mientras el entrenamiento sigue.
+    En memoria solo se mantiene una copia de cada tabla.
+    """
+
+    def __init__(self, directory: str, every: int = 10, keyframe_every: int = 50,
+                 tables: Sequence[str] = ('Q', 'visit_counts')):
+        """
+        Args:
+            directory: Directorio de salida (se crea si no existe)
+            every: Episodios entre instantáneas cuando se usa attach
+            keyframe_every: Instantáneas entre tablas completas
+            tables: Atributos del agente a registrar (los que no existan se ignoran)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.every = every
+        self.keyframe_every = keyframe_every
+        self.requested_tables = tuple(tables)
+        self.tables = None
+
+        self.file = open(os.path.join(directory, DATA_FILE), 'wb')
+        self.offset = 0
+        self.previous = {}
+        self.shapes = {}
+        self.episodes = []
+        self.keyframes = []
+        self.offsets = {}
+        self.counts = {}
+
+    def _start(self, agent):
+        """Fija las tablas registradas y sus copias a partir de la primera instantánea"""
+        self.tables = [name for name in self.requested_tables if getattr(agent, name, None) is not None]
+        if 'Q' not in self.tables:
+            raise ValueError("QTableHistory requiere un agente con tabla Q")
+        for name in self.tables:
+            table = np.asarray(getattr(agent, name))
+            self.shapes[name] = table.shape
+            self.previous[name] = table.ravel().copy()
+            self.offsets[name] = []
+            self.counts[name] = []
+
+    @staticmethod
+    def _index_dtype(size: int):
+        """Tipo entero más pequeño para los índices planos de una tabla"""
+        return np.int32 if size < 2 ** 31 else np.int64
+
+    def snapshot(self, agent, episode: int = None):
+        """
+        Registra el estado actual de las tablas del agente
+
+        Args:
+            agent: Agente tabular
+            episode: Episodio al que corresponde (por defecto agent.episode_count)
+        """
+        if self.tables is None:
+            self._start(agent)
+
+        keyframe = len(self.episodes) % self.keyframe_every == 0
+        for name in self.tables:
+            flat = np.asarray(getattr(agent, name)).ravel()
+            previous = self.previous[name]
+            if keyframe:
+                block = flat.tobytes()
+                count = flat.size
+            else:
+                changed = np.flatnonzero(flat != previous)
+                block = changed.astype(self._index_dtype(flat.size)).tobytes() + flat[changed].tobytes()
+                count = len(changed)
+            np.copyto(previous, flat)
+
+            self.file.write(block)
+            self.offsets[name].append(self.offset)
+            self.counts[name].append(count)
+            self.offset += len(block)
+
+        self.episodes.append(agent.episode_count if episode is None else episode)
+        self.keyframes.append(keyframe)
+        if keyframe:
+            self.flush()
+
+    def flush(self):
+        """Vuelca los datos pendientes y reescribe el índice"""
+        self.file.flush()
+        if self.tables is None:
+            return
+        arrays = {
+            'episodes': np.asarray(self.episodes, dtype=np.int64),
+            'keyframes': np.asarray(self.keyframes, dtype=bool),
+            'tables': np.asarray(self.tables),
+        }
+        for name in self.tables:
+            arrays[f'{name}_offsets'] = np.asarray(self.offsets[name], dtype=np.int64)
+            arrays[f'{name}_counts'] = np.asarray(self.counts[name], dtype=np.int64)
+            arrays[f'{name}_shape'] = np.asarray(self.shapes[name], dtype=np.int64)
+            arrays[f'{name}_dtype'] = np.asarray(self.previous[name].dtype.str)
+        # Se escribe en un temporal y se renombra para que un lector nunca vea un índice a medias
+        tmp_path = os.path.join(self.directory, 'index.tmp.npz')
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, os.path.join(self.directory, INDEX_FILE))
+
+    def attach(self, agent) -> Callable:
+        """
+        Registra una instantánea cada self.every episodios envolviendo a nivel
+        de instancia el método end_episode del agente
+
+        Args:
+            agent: Agente tabular
+
+        Returns:
+            Función sin argumentos que deshace el cambio
+        """
+        end_episode = agent.end_episode
+        had_attribute = 'end_episode' in vars(agent)
+        snapshot = self.snapshot
+        every = self.every
+        active = True
+
+        @wraps(end_episode)
+        def recorded_end_episode(*args, **kwargs):
+            result = end_episode(*args, **kwargs)
+            if active and agent.episode_count % every == 0:
+                snapshot(agent)
+            return result
+
+        agent.end_episode = recorded_end_episode
+
+        def undo():
+            nonlocal active
+            active = False
+            # Si después se ha envuelto end_episode, se deja ese envoltorio
+            # y el de este historial solo llama al original
+            if vars(agent).get('end_episode') is not recorded_end_episode:
+                return
+            if had_attribute:
+                agent.end_episode = end_episode
+            else:
+                del agent.end_episode
+
+        return undo
+
+    def close(self):
+        """Escribe el índice final y cierra el fichero"""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class QTableHistoryReader:
+    """
+    Lectura de un historial escrito por QTableHistory.
+
+    El fichero de datos se abre con np.memmap, así que solo se leen los
+    bloques necesarios. Una instantánea se reconstruye desde el keyframe
+    anterior aplicando los deltas intermedios; para recorrer todo el
+    historial, iter_snapshots aplica los deltas en orden sobre una única
+    tabla.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: Directorio del historial
+        """
+        self.directory = directory
+        with np.load(os.path.join(directory, INDEX_FILE)) as index:
+            self.episodes = index['episodes']
+            self.keyframes = index['keyframes']
+            self.tables = [str(name) for name in index['tables']]
+            self.offsets = {name: index[f'{name}_offsets'] for name in self.tables}
+            self.counts = {name: index[f'{name}_counts'] for name in self.tables}
+            self.shapes = {name: tuple(index[f'{name}_shape']) for name in self.tables}
+            self.dtypes = {name: np.dtype(str(index[f'{name}_dtype'])) for name in self.tables}
+        self.data = np.memmap(os.path.join(directory, DATA_FILE), dtype=np.uint8, mode='r')
+
+    def __len__(self) -> int:
+        """Número de instantáneas"""
+        return len(self.episodes)
+
+    def _block(self, name: str, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Lee el bloque de la instantánea k de una tabla
+
+        Returns:
+            Tupla (índices planos o None si es un keyframe, valores)
+        """
+        offset, count = int(self.offsets[name][k]), int(self.counts[name][k])
+        dtype = self.dtypes[name]
+        if self.keyframes[k]:
+            return None, self.data[offset:offset + count * dtype.itemsize].view(dtype)
+        index_dtype = np.dtype(QTableHistory._index_dtype(int(np.prod(self.shapes[name]))))
+        split = offset + count * index_dtype.itemsize
+        indices = self.data[offset:split].view(index_dtype)
+        values = self.data[split:split + count * dtype.itemsize].view(dtype)
+        return indices, values
+
+    def snapshot(self, k: int, table: str = 'Q') -> np.ndarray:
+        """
+        Reconstruye una instantánea
+
+        Args:
+            k: Número de instantánea (admite índices negativos)
+            table: Tabla a reconstruir ('Q' o 'visit_counts')
+
+        Returns:
+            Copia de la tabla en esa instantánea
+        """
+        n = len(self)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError(f"Instantánea {k} fuera de rango (hay {n})")
+        keyframe = int(np.flatnonzero(self.keyframes[:k + 1])[-1])
+        flat = np.array(self._block(table, keyframe)[1])
+        for j in range(keyframe + 1, k + 1):
+            indices, values = self._block(table, j)
+            flat[indices] = values
+        return flat.reshape(self.shapes[table])
+
+    def iter_snapshots(self, table: str = 'Q') -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Recorre todas las instantáneas en orden manteniendo una sola tabla
+
+        Args:
+            table: Tabla a recorrer
+
+        Returns:
+            Iterador de (episodio, tabla); la tabla se reutiliza entre
+            iteraciones, así que hay que copiarla si se quiere conservar
+        """
+        flat = None
+        for k in range(len(self)):
+            indices, values = self._block(table, k)
+            if indices is None:
+                flat = np.array(values)
+            else:
+                flat[indices] = values
+            yield int(self.episodes[k]), flat.reshape(self.shapes[table])
+
+    def reduce(self, fn: Callable[[np.ndarray], Any], table: str = 'Q',
+               snapshots: Sequence[int] = None) -> np.ndarray:
+        """
+        Aplica una función a cada instantánea sin materializarlas todas
+
+        Args:
+            fn: Función que recibe la tabla y devuelve un array o escalar
+            table: Tabla a recorrer
+            snapshots: Instantáneas en las que evaluar fn (por defecto todas)
+
+        Returns:
+            Array con el resultado de cada instantánea apilado
+        """
+        selected = np.ones(len(self), dtype=bool) if snapshots is None else np.isin(np.arange(len(self)), snapshots)
+        return np.stack([np.asarray(fn(values)) for k, (_, values) in enumerate(self.iter_snapshots(table))
+                         if selected[k]])
+
+    def value_history(self, states: Sequence[int] = None, snapshots: Sequence[int] = None) -> np.ndarray:
+        """
+        V(s) = max_a Q(s, a) en cada instantánea
+
+        Args:
+            states: Estados a incluir (por defecto todos)
+            snapshots: Instantáneas a incluir (por defecto todas)
+
+        Returns:
+            Array (instantáneas, estados)
+        """
+        states = slice(None) if states is None else np.asarray(states)
+        return self.reduce(lambda Q: Q[states].max(axis=1), snapshots=snapshots)
+
+    def greedy_history(self, snapshots: Sequence[int] = None) -> np.ndarray:
+        """
+        Acción greedy de cada estado en cada instantánea
+
+        Args:
+            snapshots: Instantáneas a incluir (por defecto todas)
+
+        Returns:
+            Array (instantáneas, estados)
+        """
+        return self.reduce(lambda Q: np.argmax(Q, axis=1).astype(np.int16), snapshots=snapshots)
+
+    def changed_cells(self, table: str = 'Q') -> np.ndarray:
+        """
+        Celdas cambiadas respecto a la instantánea anterior (los keyframes
+        cuentan la tabla entera)
+
+        Args:
+            table: Tabla
+
+        Returns:
+            Array con el número de celdas de cada bloque
+        """
+        return self.counts[table]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Tamaño del historial frente a guardar todas las tablas completas
+
+        Returns:
+            Diccionario con instantáneas, bytes en disco, bytes sin comprimir y ratio
+        """
+        dense = sum(int(np.prod(self.shapes[name])) * self.dtypes[name].itemsize * len(self)
+                    for name in self.tables)
+        stored = int(self.data.size)
+        return {
+            'snapshots': len(self),
+            'bytes': stored,
+            'dense_bytes': dense,
+            'compression_ratio': dense / stored if stored else 0.0,
+        }
@@ -0,0 +1,338 @@
+"""
+Module: instrumentacion/trajectory_recorder.py
+Description: Registro de transiciones en columnas tipadas con escritura a disco en segundo plano.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict
+import os
+import queue
+import threading
+import numpy as np
+
+COLUMNS = ('states', 'actions', 'rewards', 'next_states', 'dones')
+
+
+class TrajectoryRecorder:
+    """
+    Guarda todas las transiciones (s, a, r, s', done) de un entrenamiento.
+
+    Las transiciones se copian en columnas NumPy preasignadas de chunk_size
+    filas. Cuando un bloque se llena se entrega a un hilo escritor, que lo
+    guarda como un fragmento .npz (shard_00000.npz, ...), y el bucle de
+    entrenamiento sigue con un bloque nuevo sin esperar a la E/S. Al cerrar se
+    escribe index.npz con el desplazamiento de inicio de cada episodio y de
+    cada fragmento, que TrajectoryReader usa para acceder a cualquier episodio.
+
+    Los tipos de las columnas se deducen de la primera transición: enteros
+    (int64) para estados discretos y float32 para observaciones vectoriales.
+    """
+
+    def __init__(self, directory: str, chunk_size: int = 65536, max_pending_chunks: int = 4,
+                 compress: bool = False):
+        """
+        Args:
+            directory: Directorio donde se escriben los fragmentos (se crea si no existe)
+            chunk_size: Transiciones por fragmento
+            max_pending_chunks: Fragmentos que pueden esperar al escritor antes de
+                que el bucle de entrenamiento se bloquee
+            compress: Si es True los fragmentos se guardan con np.savez_compressed
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.compress = compress
+
+        # Columnas del bloque en curso (se crean con la primera transición)
+        self.columns = None
+        self.position = 0
+
+        # Índices globales
+        self.total_transitions = 0
+        self.episode_offsets = [0]
+        self.shard_offsets = []
+
+        # Hilo escritor
+        self._queue = queue.Queue(maxsize=max_pending_chunks)
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+        self._error = None
+        self.write_time = 0.0
+        self.closed = False
+
+    def _allocate(self, state: Any):
+        """
+        Crea las columnas de un bloque nuevo
+
+        Args:
+            state: Estado de ejemplo para deducir forma y tipo
+        """
+        state = np.asarray(state)
+        state_dtype = np.int64 if np.issubdtype(state.dtype, np.integer) else np.float32
+        n = self.chunk_size
+        self.columns = {
+            'states': np.empty((n,) + state.shape, dtype=state_dtype),
+            'actions': np.empty(n, dtype=np.int64),
+            'rewards': np.empty(n, dtype=np.float32),
+            'next_states': np.empty((n,) + state.shape, dtype=state_dtype),
+            'dones': np.empty(n, dtype=bool),
+        }
+        self.position = 0
+
+    def record(self, state: Any, action: int, next_state: Any, reward: float, done: bool):
+        """
+        Añade una transición al bloque en curso
+
+        Args:
+            state: Estado actual
+            action: Acción tomada
+            next_state: Estado siguiente
+            reward: Recompensa recibida
+            done: Indicador de fin de episodio
+        """
+        if self.columns is None:
+            self._allocate(state)
+
+        i = self.position
+        columns = self.columns
+        columns['states'][i] = state
+        columns['actions'][i] = action
+        columns['rewards'][i] = reward
+        columns['next_states'][i] = next_state
+        columns['dones'][i] = done
+        self.position += 1
+        self.total_transitions += 1
+
+        if self.position == self.chunk_size:
+            self._submit_chunk()
+
+    def end_episode(self):
+        """Marca el final del episodio actual"""
+        if self.total_transitions > self.episode_offsets[-1]:
+            self.episode_offsets.append(self.total_transitions)
+
+    def _submit_chunk(self):
+        """Entrega el bloque en curso al hilo escritor y empieza uno nuevo"""
+        if self.position == 0:
+            return
+        if self._error is not None:
+            raise RuntimeError("Error en el hilo escritor de trayectorias") from self._error
+
+        chunk = {name: column[:self.position] for name, column in self.columns.items()}
+        shard = len(self.shard_offsets)
+        self.shard_offsets.append(self.total_transitions - self.position)
+        self._queue.put((shard, chunk))
+
+        # Bloque nuevo: el escritor aún puede estar leyendo el anterior
+        self.columns = {name: np.empty_like(column) for name, column in self.columns.items()}
+        self.position = 0
+
+    def _write_loop(self):
+        """Bucle del hilo escritor"""
+        save = np.savez_compressed if self.compress else np.savez
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            shard, chunk = item
+            start = perf_counter()
+            try:
+                save(os.path.join(self.directory, f'shard_{shard:05d}.npz'), **chunk)
+            except Exception as error:
+                self._error = error
+            self.write_time += perf_counter() - start
+
+    def close(self):
+        """
+        Escribe el bloque pendiente, espera al hilo escritor y guarda el índice
+        """
+        if self.closed:
+            return
+        self.end_episode()
+        self._submit_chunk()
+        self._queue.put(None)
+        self._writer.join()
+        self.closed = True
+        if self._error is not None:
+            raise RuntimeError("Error en el hilo escritor de trayectorias") from self._error
+
+        np.savez(os.path.join(self.directory, 'index.npz'),
+                 episode_offsets=np.asarray(self.episode_offsets, dtype=np.int64),
+                 shard_offsets=np.asarray(self.shard_offsets + [self.total_transitions], dtype=np.int64))
+
+    def attach(self, agent) -> Callable:
+        """
+        Registra las transiciones de un agente envolviendo a nivel de instancia
+        sus métodos update y end_episode
+
+        Args:
+            agent: Agente a registrar
+
+        Returns:
+            Función sin argumentos que deshace el cambio. Si después se ha
+            envuelto el mismo método (instrumentación, QTableHistory, ...),
+            no se toca ese envoltorio: el de este registro deja de registrar
+            y solo llama al método original.
+        """
+        update = agent.update
+        end_episode = agent.end_episode
+        record = self.record
+        recorder_end_episode = self.end_episode
+        active = True
+
+        @wraps(update)
+        def recorded_update(state, action, next_state, reward, done, info=None):
+            if active:
+                record(state, action, next_state, reward, done)
+            return update(state, action, next_state, reward, done, info)
+
+        @wraps(end_episode)
+        def recorded_end_episode(*args, **kwargs):
+            if active:
+                recorder_end_episode()
+            return end_episode(*args, **kwargs)
+
+        wrappers = {'update': recorded_update, 'end_episode': recorded_end_episode}
+        previous = {name: vars(agent)[name] for name in wrappers if name in vars(agent)}
+        for name, wrapper in wrappers.items():
+            setattr(agent, name, wrapper)
+
+        def undo():
+            nonlocal active
+            active = False
+            for name, wrapper in wrappers.items():
+                if vars(agent).get(name) is not wrapper:
+                    continue
+                if name in previous:
+                    setattr(agent, name, previous[name])
+                else:
+                    delattr(agent, name)
+
+        return undo
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Estadísticas del registro
+
+        Returns:
+            Diccionario con transiciones, episodios, fragmentos escritos y
+            tiempo de escritura del hilo en segundo plano
+        """
+        return {
+            'transitions': self.total_transitions,
+            'episodes': len(self.episode_offsets) - 1,
+            'shards': len(self.shard_offsets),
+            'pending_chunks': self._queue.qsize(),
+            'write_time': self.write_time,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TrajectoryReader:
+    """
+    Lectura de los fragmentos escritos por TrajectoryRecorder.
+
+    Con el índice de desplazamientos, cada episodio se localiza sin recorrer
+    los anteriores: solo se cargan los fragmentos que lo contienen.
+    """
+
+    def __init__(self, directory: str, cache_shards: int = 2):
+        """
+        Args:
+            directory: Directorio con los fragmentos y el índice
+            cache_shards: Fragmentos que se mantienen en memoria
+        """
+        self.directory = directory
+        with np.load(os.path.join(directory, 'index.npz')) as index:
+            self.episode_offsets = index['episode_offsets']
+            self.shard_offsets = index['shard_offsets']
+        self.cache_shards = max(1, cache_shards)
+        self._cache = {}
+
+    def __len__(self) -> int:
+        """Número de episodios"""
+        return len(self.episode_offsets) - 1
+
+    @property
+    def num_transitions(self) -> int:
+        """Número total de transiciones"""
+        return int(self.shard_offsets[-1])
+
+    def _shard(self, shard: int) -> Dict[str, np.ndarray]:
+        """
+        Carga un fragmento (con una caché pequeña)
+
+        Args:
+            shard: Número de fragmento
+
+        Returns:
+            Columnas del fragmento
+        """
+        if shard not in self._cache:
+            if len(self._cache) >= self.cache_shards:
+                self._cache.pop(next(iter(self._cache)))
+            with np.load(os.path.join(self.directory, f'shard_{shard:05d}.npz')) as data:
+                self._cache[shard] = {name: data[name] for name in COLUMNS}
+        return self._cache[shard]
+
+    def transitions(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """
+        Devuelve las transiciones globales [start, stop)
+
+        Args:
+            start: Primera transición
+            stop: Transición siguiente a la última
+
+        Returns:
+            Diccionario de columnas
+        """
+        first = int(np.searchsorted(self.shard_offsets, start, side='right')) - 1
+        last = int(np.searchsorted(self.shard_offsets, stop, side='left'))
+        parts = {name: [] for name in COLUMNS}
+        for shard in range(first, last):
+            offset = self.shard_offsets[shard]
+            data = self._shard(shard)
+            lo, hi = max(start - offset, 0), min(stop, self.shard_offsets[shard + 1]) - offset
+            for name in COLUMNS:
+                parts[name].append(data[name][lo:hi])
+        return {name: chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+                for name, chunks in parts.items()}
+
+    def episode(self, index: int) -> Dict[str, np.ndarray]:
+        """
+        Devuelve las transiciones de un episodio
+
+        Args:
+            index: Número de episodio (admite índices negativos)
+
+        Returns:
+            Diccionario con las columnas states, actions, rewards, next_states y dones
+        """
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(f"Episodio {index} fuera de rango (hay {n})")
+        return self.transitions(int(self.episode_offsets[index]), int(self.episode_offsets[index + 1]))
+
+    def __getitem__(self, index: int) -> Dict[str, np.ndarray]:
+        return self.episode(index)
+
+    def episode_lengths(self) -> np.ndarray:
+        """Longitud de cada episodio"""
+        return np.diff(self.episode_offsets)
@@ -13,8 +13,33 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 
 # Importación de módulos o clases
-from .plotting import plot_episode_lengths, plot_reward_ratio, plot_training_comparation
+# matplotlib es costoso de importar, así que los módulos se cargan bajo
+# demanda (PEP 562) al acceder por primera vez a una función.
+_LAZY_IMPORTS = {
+    'plot_episode_lengths': '.plotting',
+    'plot_reward_ratio': '.plotting',
+    'plot_training_comparation': '.plotting',
+    'rolling_mean': '.decimation',
+    'lttb': '.decimation',
+    'min_max_decimate': '.decimation',
+    'decimate': '.decimation',
+    'StatsStreamWriter': '.streaming',
+    'StatsStreamReader': '.streaming',
+    'plot_stats_stream': '.streaming',
+    'plot_value_evolution': '.q_history',
+    'plot_policy_evolution': '.q_history',
+}
 
-# Lista de módulos o clases públicas
-__all__ = ['plot_episode_lengths', 'plot_reward_ratio', 'plot_training_comparation']
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
 
+# Lista de módulos o clases públicas
+__all__ = list(_LAZY_IMPORTS)
@@ -0,0 +1,131 @@
+"""
+Module: plotting/decimation.py
+Description: Suavizado y diezmado de series largas antes de dibujarlas.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+import numpy as np
+
+def rolling_mean(values, window):
+    """
+    Media móvil vectorizada basada en la suma acumulada.
+
+    Args:
+        values: Serie de valores.
+        window: Tamaño de la ventana.
+
+    Returns:
+        Tupla (x, media) donde x es el índice del último episodio de cada ventana.
+    """
+    values = np.asarray(values, dtype=float)
+    if window is None or window <= 1 or len(values) < window:
+        return np.arange(len(values)), values
+    cumsum = np.cumsum(np.insert(values, 0, 0.0))
+    smoothed = (cumsum[window:] - cumsum[:-window]) / window
+    return np.arange(window - 1, len(values)), smoothed
+
+def lttb(x, y, n_out):
+    """
+    Diezmado Largest-Triangle-Three-Buckets: conserva la forma visual de la serie
+    eligiendo en cada cubo el punto que forma el triángulo de mayor área.
+
+    Args:
+        x: Coordenadas x (crecientes).
+        y: Coordenadas y.
+        n_out: Número de puntos de salida.
+
+    Returns:
+        Tupla (x, y) diezmada.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Límites de los n_out - 2 cubos interiores (el primer y último punto se conservan)
+    edges = (np.floor(np.arange(n_out - 1) * (n - 2) / (n_out - 2)).astype(int) + 1)
+    edges[-1] = n - 1
+
+    # Media de cada cubo calculada con sumas acumuladas
+    cum_x = np.cumsum(np.insert(x, 0, 0.0))
+    cum_y = np.cumsum(np.insert(y, 0, 0.0))
+    counts = edges[1:] - edges[:-1]
+    avg_x = (cum_x[edges[1:]] - cum_x[edges[:-1]]) / counts
+    avg_y = (cum_y[edges[1:]] - cum_y[edges[:-1]]) / counts
+    avg_x = np.append(avg_x, x[-1])
+    avg_y = np.append(avg_y, y[-1])
+
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        # El tercer vértice es la media del cubo siguiente
+        next_x, next_y = avg_x[i + 1], avg_y[i + 1]
+        area = np.abs((x[a] - next_x) * (bucket_y - y[a]) - (x[a] - bucket_x) * (next_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return x[selected], y[selected]
+
+def min_max_decimate(x, y, n_out):
+    """
+    Diezmado min-max: conserva el mínimo y el máximo de cada cubo, de modo
+    que los picos de la serie siguen siendo visibles.
+
+    Args:
+        x: Coordenadas x (crecientes).
+        y: Coordenadas y.
+        n_out: Número aproximado de puntos de salida.
+
+    Returns:
+        Tupla (x, y) diezmada.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    n_buckets = n_out // 2
+    if n_out >= n or n_buckets < 1:
+        return x, y
+
+    # Rellena hasta un múltiplo del tamaño de cubo para poder usar reshape
+    size = int(np.ceil(n / n_buckets))
+    padding = size * n_buckets - n
+    offsets = np.arange(n_buckets) * size
+    mins = np.argmin(np.append(y, np.full(padding, np.inf)).reshape(n_buckets, size), axis=1) + offsets
+    maxs = np.argmax(np.append(y, np.full(padding, -np.inf)).reshape(n_buckets, size), axis=1) + offsets
+
+    selected = np.unique(np.concatenate(([0, n - 1], np.minimum(mins, n - 1), np.minimum(maxs, n - 1))))
+    return x[selected], y[selected]
+
+def decimate(x, y, max_points=2000, method='lttb'):
+    """
+    Reduce una serie a como mucho max_points puntos.
+
+    Args:
+        x: Coordenadas x.
+        y: Coordenadas y.
+        max_points: Número máximo de puntos (None para no diezmar).
+        method: 'lttb' o 'minmax'.
+
+    Returns:
+        Tupla (x, y) diezmada.
+    """
+    if max_points is None or len(y) <= max_points:
+        return np.asarray(x), np.asarray(y)
+    if method == 'lttb':
+        return lttb(x, y, max_points)
+    if method == 'minmax':
+        return min_max_decimate(x, y, max_points)
+    raise ValueError(f"Método de diezmado desconocido: {method}")
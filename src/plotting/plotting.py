@@ -12,51 +12,118 @@ with the additional restriction that it may not be used for commercial purposes.
 For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 """
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from plotting.decimation import rolling_mean, decimate
 
-def plot_episode_lengths(episode_lengths):
+def _new_figure(figsize, nrows=1, save_path=None):
+    """
+    Crea una figura. Si se va a guardar en fichero se usa directamente el
+    backend Agg, sin pasar por pyplot, para poder trabajar sin pantalla.
+
+    Args:
+        figsize: Tamaño de la figura.
+        nrows: Número de subplots (en una columna).
+        save_path: Ruta del fichero de salida o None para mostrarla.
+
+    Returns:
+        Tupla (figura, ejes).
+    """
+    if save_path is not None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig, fig.subplots(nrows, 1)
+    import matplotlib.pyplot as plt
+    return plt.subplots(nrows, 1, figsize=figsize)
+
+def _finish_figure(fig, save_path=None):
+    """
+    Guarda la figura en fichero (PNG, SVG, ... según la extensión) o la muestra.
+
+    Args:
+        fig: Figura.
+        save_path: Ruta del fichero de salida o None para mostrarla.
+    """
+    fig.tight_layout()
+    if save_path is not None:
+        fig.savefig(save_path)
+    else:
+        import matplotlib.pyplot as plt
+        plt.show()
+
+def _prepare_series(values, smooth_window=None, max_points=2000, decimation='lttb', start=0):
+    """
+    Suaviza y diezma una serie antes de dibujarla.
+
+    Args:
+        values: Serie de valores.
+        smooth_window: Ventana de la media móvil (None para no suavizar).
+        max_points: Número máximo de puntos a dibujar.
+        decimation: Método de diezmado ('lttb' o 'minmax').
+        start: Valor x del primer elemento.
+
+    Returns:
+        Tupla (x, y) lista para dibujar.
+    """
+    x, y = rolling_mean(values, smooth_window)
+    return decimate(x + start, y, max_points, decimation)
+
+def plot_episode_lengths(episode_lengths, smooth_window=None, max_points=2000, decimation='lttb', save_path=None):
     """
     Grafica la longitud de los episodios y muestra una curva de tendencia.
 
     Args:
         episode_lengths: Lista con la cantidad de pasos de cada episodio.
+        smooth_window: Ventana de la media móvil (None para no suavizar).
+        max_points: Número máximo de puntos a dibujar (None para dibujarlos todos).
+        decimation: Método de diezmado ('lttb' o 'minmax').
+        save_path: Fichero donde guardar la gráfica; si es None se muestra.
     """
-    episodes = np.arange(len(episode_lengths))
+    episode_lengths = np.asarray(episode_lengths, dtype=float)
+    fig, ax = _new_figure((8, 4), save_path=save_path)
+
+    x, y = _prepare_series(episode_lengths, smooth_window, max_points, decimation)
+    ax.plot(x, y, label="Longitud del episodio", alpha=0.5)
 
-    plt.figure(figsize=(8, 4))
-    plt.plot(episodes, episode_lengths, label="Longitud del episodio", alpha=0.5)
-    
     # Agregar curva de tendencia (ajuste polinómico de grado 1)
     if len(episode_lengths) > 1:
-        z = np.polyfit(episodes, episode_lengths, 1)
+        z = np.polyfit(np.arange(len(episode_lengths)), episode_lengths, 1)
         p = np.poly1d(z)
-        plt.plot(episodes, p(episodes), "r--", label="Tendencia")
+        ax.plot(x, p(x), "r--", label="Tendencia")
 
-    plt.xlabel("Episodio")
-    plt.ylabel("Longitud del episodio")
-    plt.title("Longitud de los episodios y curva de tendencia")
-    plt.legend()
-    plt.grid()
-    plt.show()
+    ax.set_xlabel("Episodio")
+    ax.set_ylabel("Longitud del episodio")
+    ax.set_title("Longitud de los episodios y curva de tendencia")
+    ax.legend()
+    ax.grid()
+    _finish_figure(fig, save_path)
 
-def plot_reward_ratio(list_stats):
-    # Creamos una lista de índices para el eje x
-    indices = list(range(len(list_stats)))
+def plot_reward_ratio(list_stats, max_points=2000, decimation='lttb', save_path=None):
+    """
+    Grafica la proporción acumulada de recompensas.
 
+    Args:
+        list_stats: Proporción de recompensas en cada episodio (stats()["reward_ratio"]).
+        max_points: Número máximo de puntos a dibujar (None para dibujarlos todos).
+        decimation: Método de diezmado ('lttb' o 'minmax').
+        save_path: Fichero donde guardar la gráfica; si es None se muestra.
+    """
     # Creamos el gráfico
-    plt.figure(figsize=(6, 3))
-    plt.plot(indices, list_stats)
+    fig, ax = _new_figure((6, 3), save_path=save_path)
+    x, y = _prepare_series(list_stats, None, max_points, decimation)
+    ax.plot(x, y)
 
     # Añadimos título y etiquetas
-    plt.title('Proporción de recompensas')
-    plt.xlabel('Episodio')
-    plt.ylabel('Proporción')
+    ax.set_title('Proporción de recompensas')
+    ax.set_xlabel('Episodio')
+    ax.set_ylabel('Proporción')
 
     # Mostramos el gráfico
-    plt.grid(True)
-    plt.show()
+    ax.grid(True)
+    _finish_figure(fig, save_path)
 
-def plot_training_comparation(algorithms_data, same=False):
+def plot_training_comparation(algorithms_data, same=False, smooth_window=None, max_points=2000,
+                              decimation='lttb', save_path=None):
     """
     Recibe un diccionario con la estructura:
         {
@@ -68,39 +135,40 @@ def plot_training_comparation(algorithms_data, same=False):
           * Recompensa por episodio
           * Duración de los episodios
       - Si same=True, solo se muestra la gráfica de la duración de los episodios.
+
+    Cada serie se suaviza con una media móvil de smooth_window episodios y se
+    diezma a max_points puntos antes de dibujarla. Si se indica save_path, la
+    gráfica se guarda en ese fichero en lugar de mostrarse.
     """
     if not same:
-        fig, (ax_reward, ax_length) = plt.subplots(2, 1, figsize=(10, 8))
+        fig, (ax_reward, ax_length) = _new_figure((10, 8), nrows=2, save_path=save_path)
         for alg_name, (rewards, lengths) in algorithms_data.items():
-            episodes = np.arange(1, len(rewards) + 1)
             # Gráfica de recompensas
-            ax_reward.plot(episodes, rewards, label=f"{alg_name}")
+            ax_reward.plot(*_prepare_series(rewards, smooth_window, max_points, decimation, start=1), label=f"{alg_name}")
             # Gráfica de duración de episodios
-            ax_length.plot(episodes, lengths, label=f"{alg_name}")
-        
+            ax_length.plot(*_prepare_series(lengths, smooth_window, max_points, decimation, start=1), label=f"{alg_name}")
+
         ax_reward.set_title("Recompensa por Episodio")
         ax_reward.set_xlabel("Episodio")
         ax_reward.set_ylabel("Recompensa")
         ax_reward.legend()
         ax_reward.grid(True)
-        
+
         ax_length.set_title("Duración de los Episodios")
         ax_length.set_xlabel("Episodio")
         ax_length.set_ylabel("Número de pasos")
         ax_length.legend()
         ax_length.grid(True)
     else:
-        fig, ax = plt.subplots(1, 1, figsize=(10, 8))
+        fig, ax = _new_figure((10, 8), save_path=save_path)
         for alg_name, (rewards, lengths) in algorithms_data.items():
-            episodes = np.arange(1, len(lengths) + 1)
             # Solo se grafica la duración
-            ax.plot(episodes, lengths, label=f"{alg_name}")
-        
+            ax.plot(*_prepare_series(lengths, smooth_window, max_points, decimation, start=1), label=f"{alg_name}")
+
         ax.set_title("Duración de los Episodios")
         ax.set_xlabel("Episodio")
         ax.set_ylabel("Número de pasos")
         ax.legend()
         ax.grid(True)
-    
-    plt.tight_layout()
-    plt.show()
\ No newline at end of file
+
+    _finish_figure(fig, save_path)
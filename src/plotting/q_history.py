@@ -0,0 +1,99 @@
+"""
+Module: plotting/q_history.py
+Description: Gráficas de la evolución de la función de valor y de la política greedy a partir de un historial de Q.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+import numpy as np
+from matplotlib import colormaps
+from plotting.plotting import _new_figure, _finish_figure
+
+def _open_reader(history):
+    """Acepta un QTableHistoryReader o la ruta del historial."""
+    if isinstance(history, str):
+        from instrumentacion.q_history import QTableHistoryReader
+        return QTableHistoryReader(history)
+    return history
+
+def _select_snapshots(num_snapshots, max_snapshots):
+    """Índices de instantáneas equiespaciadas (como mucho max_snapshots)."""
+    if max_snapshots is None or num_snapshots <= max_snapshots:
+        return np.arange(num_snapshots)
+    return np.unique(np.linspace(0, num_snapshots - 1, max_snapshots).astype(np.int64))
+
+def plot_value_evolution(history, states=None, max_snapshots=500, save_path=None):
+    """
+    Grafica la evolución de V(s) = max_a Q(s, a) a lo largo del entrenamiento:
+    un mapa de calor (instantánea x estado) y el valor medio.
+
+    Las tablas se reconstruyen una a una aplicando los deltas del historial,
+    así que solo se guarda V de las instantáneas dibujadas.
+
+    Args:
+        history: QTableHistoryReader o ruta del historial.
+        states: Estados a dibujar (por defecto todos).
+        max_snapshots: Número máximo de instantáneas a dibujar.
+        save_path: Fichero donde guardar la gráfica; si es None se muestra.
+    """
+    reader = _open_reader(history)
+    snapshots = _select_snapshots(len(reader), max_snapshots)
+    values = reader.value_history(states, snapshots)
+    episodes = reader.episodes[snapshots]
+
+    fig, (ax_map, ax_mean) = _new_figure((10, 8), nrows=2, save_path=save_path)
+    image = ax_map.imshow(values.T, aspect='auto', origin='lower', interpolation='nearest',
+                          extent=(episodes[0], episodes[-1], -0.5, values.shape[1] - 0.5))
+    fig.colorbar(image, ax=ax_map, label="V(s)")
+    ax_map.set_title("Evolución de la función de valor")
+    ax_map.set_xlabel("Episodio")
+    ax_map.set_ylabel("Estado")
+
+    ax_mean.plot(episodes, values.mean(axis=1), label="V media")
+    ax_mean.plot(episodes, values.max(axis=1), label="V máxima", alpha=0.6)
+    ax_mean.set_xlabel("Episodio")
+    ax_mean.set_ylabel("Valor")
+    ax_mean.legend()
+    ax_mean.grid(True)
+    _finish_figure(fig, save_path)
+
+def plot_policy_evolution(history, max_snapshots=500, save_path=None):
+    """
+    Grafica la evolución de la política greedy: la acción elegida en cada
+    estado a lo largo del entrenamiento y el número de estados cuya acción
+    cambia entre instantáneas consecutivas.
+
+    Args:
+        history: QTableHistoryReader o ruta del historial.
+        max_snapshots: Número máximo de instantáneas a dibujar.
+        save_path: Fichero donde guardar la gráfica; si es None se muestra.
+    """
+    reader = _open_reader(history)
+    snapshots = _select_snapshots(len(reader), max_snapshots)
+    greedy = reader.greedy_history(snapshots)
+    episodes = reader.episodes[snapshots]
+    n_actions = reader.shapes['Q'][1]
+
+    fig, (ax_map, ax_changes) = _new_figure((10, 8), nrows=2, save_path=save_path)
+    image = ax_map.imshow(greedy.T, aspect='auto', origin='lower', interpolation='nearest',
+                          cmap=colormaps['tab10'].resampled(n_actions), vmin=-0.5, vmax=n_actions - 0.5,
+                          extent=(episodes[0], episodes[-1], -0.5, greedy.shape[1] - 0.5))
+    fig.colorbar(image, ax=ax_map, label="Acción", ticks=range(n_actions))
+    ax_map.set_title("Evolución de la política greedy")
+    ax_map.set_xlabel("Episodio")
+    ax_map.set_ylabel("Estado")
+
+    changes = (greedy[1:] != greedy[:-1]).sum(axis=1)
+    ax_changes.plot(episodes[1:], changes)
+    ax_changes.set_title("Estados con cambio de acción greedy")
+    ax_changes.set_xlabel("Episodio")
+    ax_changes.set_ylabel("Estados")
+    ax_changes.grid(True)
+    _finish_figure(fig, save_path)
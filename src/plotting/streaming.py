@@ -0,0 +1,152 @@
+"""
+Module: plotting/streaming.py
+Description: Fichero de estadísticas en streaming para graficar un entrenamiento en curso.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+import numpy as np
+
+class StatsStreamWriter:
+    """
+    Escribe la recompensa y la longitud de cada episodio en un fichero de
+    texto ("recompensa,longitud" por línea) que otro proceso puede leer
+    mientras el entrenamiento sigue en marcha.
+    """
+
+    def __init__(self, path, flush_every=1000):
+        """
+        Args:
+            path: Ruta del fichero (se añaden líneas al final).
+            flush_every: Número de episodios que se acumulan antes de escribir.
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self.buffer = []
+        self.file = open(path, 'a')
+
+    def write(self, episode_reward, episode_length):
+        """
+        Registra un episodio.
+
+        Args:
+            episode_reward: Recompensa total del episodio.
+            episode_length: Número de pasos del episodio.
+        """
+        # float() evita que NumPy 2 escriba "np.float64(1.0)" con repr
+        self.buffer.append(f"{float(episode_reward)!r},{int(episode_length)}\n")
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Escribe en disco los episodios pendientes."""
+        if self.buffer:
+            self.file.write(''.join(self.buffer))
+            self.file.flush()
+            self.buffer = []
+
+    def close(self):
+        """Escribe los episodios pendientes y cierra el fichero."""
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class StatsStreamReader:
+    """
+    Lee de forma incremental un fichero escrito por StatsStreamWriter: cada
+    llamada a read_new solo procesa las líneas añadidas desde la anterior.
+    Los episodios se guardan en un array cuya capacidad se duplica al
+    llenarse, así que leer no vuelve a copiar todo lo leído antes.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Ruta del fichero de estadísticas.
+        """
+        self.path = path
+        self.offset = 0
+        self._buffer = np.empty((1024, 2))
+        self.size = 0
+
+    def read_new(self):
+        """
+        Lee las líneas completas añadidas desde la última lectura.
+
+        Returns:
+            Número de episodios nuevos.
+        """
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            content = f.read()
+
+        # Ignora una posible última línea a medio escribir
+        end = content.rfind(b'\n') + 1
+        if end == 0:
+            return 0
+        self.offset += end
+
+        values = np.array(content[:end].replace(b'\n', b',').decode().split(',')[:-1], dtype=float)
+        new_data = values.reshape(-1, 2)
+
+        needed = self.size + len(new_data)
+        if needed > len(self._buffer):
+            grown = np.empty((max(needed, 2 * len(self._buffer)), 2))
+            grown[:self.size] = self._buffer[:self.size]
+            self._buffer = grown
+        self._buffer[self.size:needed] = new_data
+        self.size = needed
+        return len(new_data)
+
+    @property
+    def data(self):
+        """Array (episodios, 2) con recompensa y longitud de cada episodio leído."""
+        return self._buffer[:self.size]
+
+    @property
+    def rewards(self):
+        """Recompensa de cada episodio leído."""
+        return self.data[:, 0]
+
+    @property
+    def lengths(self):
+        """Longitud de cada episodio leído."""
+        return self.data[:, 1]
+
+def plot_stats_stream(reader, save_path, name="Entrenamiento", smooth_window=100, max_points=2000,
+                      decimation='lttb'):
+    """
+    Lee los episodios nuevos de un fichero de estadísticas y vuelve a generar
+    la gráfica de recompensas y longitudes. Pensada para llamarse
+    periódicamente mientras el entrenamiento está en marcha.
+
+    Args:
+        reader: StatsStreamReader (o ruta del fichero, que crea uno nuevo).
+        save_path: Fichero de imagen de salida (PNG, SVG, ...).
+        name: Nombre de la serie en la leyenda.
+        smooth_window: Ventana de la media móvil.
+        max_points: Número máximo de puntos a dibujar.
+        decimation: Método de diezmado ('lttb' o 'minmax').
+
+    Returns:
+        El StatsStreamReader, para reutilizarlo en la siguiente llamada.
+    """
+    from plotting.plotting import plot_training_comparation
+
+    if isinstance(reader, str):
+        reader = StatsStreamReader(reader)
+    reader.read_new()
+    plot_training_comparation({name: (reader.rewards, reader.lengths)}, smooth_window=smooth_window,
+                              max_points=max_points, decimation=decimation, save_path=save_path)
+    return reader
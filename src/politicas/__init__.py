@@ -15,7 +15,9 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 # Importación de módulos o clases
 from .policy import Policy
 from .epsilon_greedy import EpsilonGreedyPolicy
+from .boltzmann import BoltzmannPolicy
+from .ucb import UCBPolicy
 # Lista de módulos o clases públicas
 
-__all__ = ['Policy', 'EpsilonGreedyPolicy']
+__all__ = ['Policy', 'EpsilonGreedyPolicy', 'BoltzmannPolicy', 'UCBPolicy']
 
@@ -0,0 +1,140 @@
+"""
+Module: politicas/boltzmann.py
+Description: Implementación de la política softmax (Boltzmann) con planificación de temperatura.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from politicas.policy import Policy
+from typing import Any
+import gymnasium as gym
+import numpy as np
+
+class BoltzmannPolicy(Policy):
+    """
+    Política softmax (Boltzmann): selecciona cada acción con probabilidad
+
+        π(a|s) = exp(Q(s, a) / T) / Σ_b exp(Q(s, b) / T)
+
+    Las probabilidades se calculan en el dominio logarítmico restando
+    log-sum-exp, de modo que valores Q grandes o temperaturas pequeñas no
+    desbordan. A diferencia de epsilon-greedy, la exploración se dirige a las
+    acciones con mejor valor estimado y todas las acciones tienen probabilidad
+    positiva (útil para importance sampling).
+
+    La temperatura se actualiza en decay() según schedule:
+        - 'exponential': T ← max(T * temperature_decay, temperature_min)
+        - 'linear': T ← max(T - temperature_decay, temperature_min)
+        - 'inverse': T = max(T_0 / (1 + temperature_decay * k), temperature_min)
+    """
+
+    SCHEDULES = ('exponential', 'linear', 'inverse')
+
+    def __init__(self, action_space: gym.spaces, temperature: float = 1.0, temperature_decay: float = 0.999,
+                 temperature_min: float = 0.01, schedule: str = 'exponential'):
+        """
+        Inicializa la política softmax
+
+        Args:
+            action_space: Espacio de acciones del entorno
+            temperature: Temperatura inicial (mayor = más exploración)
+            temperature_decay: Parámetro del decaimiento (factor, paso o velocidad según schedule)
+            temperature_min: Temperatura mínima
+            schedule: Planificación de la temperatura ('exponential', 'linear' o 'inverse')
+        """
+        super().__init__(action_space)
+        if schedule not in self.SCHEDULES:
+            raise ValueError(f"schedule debe ser uno de {self.SCHEDULES}")
+        if temperature <= 0 or temperature_min <= 0:
+            raise ValueError("La temperatura debe ser positiva")
+        self.temperature = temperature
+        self.initial_temperature = temperature
+        self.temperature_decay = temperature_decay
+        self.temperature_min = temperature_min
+        self.schedule = schedule
+        self.decay_steps = 0
+
+    def _q_values(self, state: Any, action_values: Any) -> np.ndarray:
+        """
+        Extrae los valores Q del estado (tabla, vector o función)
+
+        Args:
+            state: Estado actual
+            action_values: Matriz Q, vector de valores o función
+
+        Returns:
+            Vector de valores Q del estado
+        """
+        if isinstance(action_values, np.ndarray) and action_values.ndim > 1:
+            if not isinstance(state, (int, np.integer)):
+                raise ValueError("State debe ser un entero para espacios de estados discretos")
+            return action_values[state]
+        if callable(action_values):
+            return action_values(state)
+        return action_values
+
+    def get_action_probabilities_batch(self, action_values: np.ndarray, states: np.ndarray = None) -> np.ndarray:
+        """
+        Probabilidades softmax de un lote de estados
+
+        Args:
+            action_values: Array (batch, n_actions) con los valores Q de cada estado
+            states: No se usa
+
+        Returns:
+            Array (batch, n_actions) de probabilidades
+        """
+        logits = np.asarray(action_values, dtype=np.float64) / self.temperature
+        logits = logits - logits.max(axis=-1, keepdims=True)
+        log_pi = logits - np.log(np.exp(logits).sum(axis=-1, keepdims=True))
+        return np.exp(log_pi)
+
+    def get_action_probabilities(self, state: Any, action_values: np.ndarray):
+        """
+        Calcula las probabilidades de seleccionar cada acción según la política softmax
+
+        Args:
+            state: Estado actual
+            action_values: Matriz Q de valores de acción
+
+        Returns:
+            Array con probabilidades para cada acción
+        """
+        return self.get_action_probabilities_batch(self._q_values(state, action_values))
+
+    def select_action(self, state: Any, action_values: np.ndarray) -> int:
+        """
+        Selecciona una acción muestreando de la distribución softmax
+
+        Args:
+            state: Estado actual
+            action_values: Matriz Q de valores de acción
+
+        Returns:
+            La acción seleccionada
+        """
+        pi = self.get_action_probabilities(state, action_values)
+        action = int(np.searchsorted(np.cumsum(pi), np.random.random(), side='right'))
+        return min(action, self.n_actions - 1)
+
+    def decay_temperature(self):
+        """Aplica la planificación de temperatura"""
+        self.decay_steps += 1
+        if self.schedule == 'exponential':
+            temperature = self.temperature * self.temperature_decay
+        elif self.schedule == 'linear':
+            temperature = self.temperature - self.temperature_decay
+        else:
+            temperature = self.initial_temperature / (1.0 + self.temperature_decay * self.decay_steps)
+        self.temperature = max(temperature, self.temperature_min)
+
+    def decay(self):
+        """Decae la temperatura al final de cada episodio"""
+        self.decay_temperature()
@@ -71,6 +71,22 @@ class EpsilonGreedyPolicy(Policy):
         pi_A[best_action] += (1.0 - self.epsilon)
         return pi_A
     
+    def get_action_probabilities_batch(self, action_values: np.ndarray, states: np.ndarray = None) -> np.ndarray:
+        """
+        Probabilidades epsilon-greedy de un lote de estados
+        
+        Args:
+            action_values: Array (batch, n_actions) con los valores Q de cada estado
+            states: No se usa
+            
+        Returns:
+            Array (batch, n_actions) de probabilidades
+        """
+        action_values = np.asarray(action_values)
+        pi = np.full(action_values.shape, self.epsilon / self.n_actions)
+        pi[np.arange(len(action_values)), np.argmax(action_values, axis=1)] += 1.0 - self.epsilon
+        return pi
+    
     def select_action(self, state: Any, action_values: np.ndarray) -> int:
         """
         Selecciona una acción basada en el estado actual y los valores Q
@@ -88,4 +104,8 @@ class EpsilonGreedyPolicy(Policy):
     
     def decay_epsilon(self):
         """Aplica el decaimiento a epsilon"""
-        self.epsilon = max(self.epsilon * self.epsilon_decay, self.epsilon_min)
\ No newline at end of file
+        self.epsilon = max(self.epsilon * self.epsilon_decay, self.epsilon_min)
+
+    def decay(self):
+        """Decae epsilon al final de cada episodio"""
+        self.decay_epsilon()
@@ -14,7 +14,8 @@ For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
 
 from abc import ABC, abstractmethod
 import gymnasium as gym
-from typing import Any
+from typing import Any, Callable
+import numpy as np
 
 class Policy(ABC):
     """
@@ -57,4 +58,67 @@ class Policy(ABC):
         Returns:
             Array con probabilidades para cada acción
         """
-        pass
\ No newline at end of file
+        pass
+
+    def get_action_probabilities_batch(self, action_values: np.ndarray, states: np.ndarray = None) -> np.ndarray:
+        """
+        Probabilidades de cada acción para un lote de estados. Las subclases
+        lo vectorizan; por defecto se calcula fila a fila.
+
+        Args:
+            action_values: Array (batch, n_actions) con los valores Q de cada estado
+            states: Estados del lote (solo para políticas que dependen del estado)
+
+        Returns:
+            Array (batch, n_actions) de probabilidades
+        """
+        return np.stack([self.get_action_probabilities(None, q_values) for q_values in action_values])
+
+    def select_action_batch(self, states: np.ndarray, action_values: np.ndarray) -> np.ndarray:
+        """
+        Selecciona una acción para cada estado de un lote muestreando de forma
+        vectorizada (inversa de la función de distribución acumulada)
+
+        Args:
+            states: Estados del lote
+            action_values: Array (batch, n_actions) con los valores Q de cada estado
+
+        Returns:
+            Array de acciones
+        """
+        pi = self.get_action_probabilities_batch(action_values, states)
+        u = np.random.random((len(pi), 1))
+        actions = (np.cumsum(pi, axis=1) < u).sum(axis=1)
+        return np.minimum(actions, self.n_actions - 1)
+
+    def bind(self, agent) -> 'Policy':
+        """
+        Se llama al construir el agente, por si la política necesita leer
+        su estado (por ejemplo los contadores de visitas). Por defecto no hace nada.
+
+        Args:
+            agent: Agente que usa la política
+
+        Returns:
+            La propia política
+        """
+        return self
+
+    def decay(self):
+        """
+        Actualiza los parámetros de exploración al final de un episodio
+        (por defecto no hace nada)
+        """
+        pass
+
+    def instrument(self, timer) -> Callable:
+        """
+        Mide el tiempo de select_action con el temporizador indicado
+
+        Args:
+            timer: Temporizador (instrumentacion.PhaseTimer)
+
+        Returns:
+            Función sin argumentos que deshace la instrumentación
+        """
+        return timer.wrap_method(self, 'select_action', 'select_action')
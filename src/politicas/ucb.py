@@ -0,0 +1,169 @@
+"""
+Module: politicas/ucb.py
+Description: Implementación de la política UCB basada en contadores de visitas.
+
+Author: Iván Martínez Cuevas
+Email: ivan.martinezc@um.es
+Date: 2026/10/19
+
+This software is licensed under the GNU General Public License v3.0 (GPL-3.0),
+with the additional restriction that it may not be used for commercial purposes.
+
+For more details about GPL-3.0: https://www.gnu.org/licenses/gpl-3.0.html
+"""
+
+from politicas.policy import Policy
+from typing import Any
+import gymnasium as gym
+import numpy as np
+
+class UCBPolicy(Policy):
+    """
+    Política UCB (Upper Confidence Bound) para estados discretos:
+
+        a = argmax_a [ Q(s, a) + c * sqrt(ln N(s) / N(s, a)) ]
+
+    donde N(s, a) son las visitas del par y N(s) = Σ_a N(s, a) + 1. Las
+    acciones no probadas en un estado (N(s, a) = 0) se eligen primero. La
+    exploración se dirige a los pares poco visitados en lugar de repartirse
+    uniformemente como en epsilon-greedy.
+
+    El agente llama a bind() al construirse: si mantiene contadores de
+    visitas (MonteCarloAgent.visit_counts) se leen de ahí; si no, la política
+    cuenta sus propias selecciones. Con SARSA, que también llama a
+    select_action para elegir a' al actualizar, esas selecciones cuentan
+    como visitas.
+    """
+
+    def __init__(self, action_space: gym.spaces, c: float = 1.0, visit_counts: np.ndarray = None):
+        """
+        Inicializa la política UCB
+
+        Args:
+            action_space: Espacio de acciones del entorno
+            c: Peso del término de exploración
+            visit_counts: Matriz (n_states, n_actions) de visitas a usar (opcional)
+        """
+        super().__init__(action_space)
+        self.c = c
+        self.visit_counts = visit_counts
+        # Solo se cuentan las selecciones si los contadores son propios
+        self.count_selections = visit_counts is None
+
+    def bind(self, agent) -> 'UCBPolicy':
+        """
+        Usa los contadores de visitas del agente si los tiene; si no, crea
+        contadores propios con la forma de su tabla Q
+
+        Args:
+            agent: Agente tabular
+
+        Returns:
+            La propia política
+        """
+        counts = getattr(agent, 'visit_counts', None)
+        if counts is not None:
+            self.visit_counts = counts
+            self.count_selections = False
+        elif hasattr(agent, 'Q'):
+            self.visit_counts = np.zeros_like(agent.Q)
+            self.count_selections = True
+        return self
+
+    def _counts(self, action_values: np.ndarray) -> np.ndarray:
+        """
+        Devuelve los contadores, creándolos con la forma de la tabla Q si no existen
+
+        Args:
+            action_values: Matriz Q
+
+        Returns:
+            Matriz de visitas
+        """
+        if not isinstance(action_values, np.ndarray) or action_values.ndim != 2:
+            raise ValueError("UCBPolicy requiere una tabla Q (estados discretos)")
+        if self.visit_counts is None:
+            self.visit_counts = np.zeros(action_values.shape)
+        return self.visit_counts
+
+    def scores_batch(self, action_values: np.ndarray, states: np.ndarray) -> np.ndarray:
+        """
+        Puntuaciones UCB de un lote de estados
+
+        Args:
+            action_values: Array (batch, n_actions) con los valores Q de cada estado
+            states: Índices de los estados del lote
+
+        Returns:
+            Array (batch, n_actions); infinito en las acciones no probadas
+        """
+        if states is None:
+            raise ValueError("UCBPolicy necesita los estados para consultar las visitas")
+        if self.visit_counts is None:
+            raise ValueError("UCBPolicy no tiene contadores: usa bind(agent) o pasa visit_counts")
+        counts = self.visit_counts[np.asarray(states, dtype=np.int64)]
+        log_total = np.log(counts.sum(axis=-1, keepdims=True) + 1.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bonus = self.c * np.sqrt(log_total / counts)
+        return np.where(counts > 0, np.asarray(action_values) + bonus, np.inf)
+
+    def get_action_probabilities_batch(self, action_values: np.ndarray, states: np.ndarray = None) -> np.ndarray:
+        """
+        Probabilidades de un lote de estados: UCB es determinista, así que la
+        probabilidad se reparte entre las acciones empatadas en el máximo
+
+        Args:
+            action_values: Array (batch, n_actions) con los valores Q de cada estado
+            states: Índices de los estados del lote
+
+        Returns:
+            Array (batch, n_actions) de probabilidades
+        """
+        scores = self.scores_batch(action_values, states)
+        best = scores == scores.max(axis=-1, keepdims=True)
+        return best / best.sum(axis=-1, keepdims=True)
+
+    def get_action_probabilities(self, state: Any, action_values: np.ndarray):
+        """
+        Calcula las probabilidades de seleccionar cada acción según UCB
+
+        Args:
+            state: Estado actual (entero)
+            action_values: Matriz Q de valores de acción
+
+        Returns:
+            Array con probabilidades para cada acción
+        """
+        self._counts(action_values)
+        return self.get_action_probabilities_batch(action_values[[state]], [state])[0]
+
+    def select_action(self, state: Any, action_values: np.ndarray) -> int:
+        """
+        Selecciona la acción con mayor puntuación UCB (desempate aleatorio)
+
+        Args:
+            state: Estado actual (entero)
+            action_values: Matriz Q de valores de acción
+
+        Returns:
+            La acción seleccionada
+        """
+        self._counts(action_values)
+        return int(self.select_action_batch([state], action_values[[state]])[0])
+
+    def select_action_batch(self, states: np.ndarray, action_values: np.ndarray) -> np.ndarray:
+        """
+        Selecciona la acción UCB de cada estado de un lote
+
+        Args:
+            states: Índices de los estados del lote
+            action_values: Array (batch, n_actions) con los valores Q de cada estado
+
+        Returns:
+            Array de acciones
+        """
+        states = np.asarray(states, dtype=np.int64)
+        actions = super().select_action_batch(states, action_values)
+        if self.count_selections:
+            np.add.at(self.visit_counts, (states, actions), 1)
+        return actions